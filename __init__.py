@@ -22,22 +22,156 @@
 # pylint: disable=line-too-long
 # pylint: disable=no-name-in-module
 
-from collections import namedtuple
+import hashlib
+import re
+import time
+import unicodedata
+import weakref
+from collections import (
+    Counter,
+    OrderedDict,
+    deque,
+    namedtuple,
+)
+from functools import lru_cache
 
-from PyQt6 import QtWidgets
+from PyQt6 import (
+    QtCore,
+    QtWidgets,
+)
 
 from picard.plugin3.api import (
+    BaseAction,
+    File,
+    Metadata,
     OptionsPage,
     PluginApi,
     t_,
 )
 
+from .album_credits import ALBUM_CREDITS
+from .coperformance import COPERFORMANCE_GRAPH
+from .instrument_hierarchy import (
+    INSTRUMENT_HIERARCHY,
+    LEVEL_EXACT,
+    LEVEL_FAMILY,
+    LEVEL_TOP,
+)
+from .memory_profile import MEMORY_PROFILER
+from .performer_index import (
+    MULTI_VALUED_JOINER,
+    PERFORMER_INDEX,
+)
+from .performer_tags import parse_performer_tags
+# The relation handler class and registration function are also imported here so
+# that other plugins can register handlers for additional relation types.
+from .relation_handlers import (  # noqa: F401 # pylint: disable=unused-import
+    RELATION_GROUPS,
+    RELATION_HANDLERS,
+    TYPE_ID_HANDLERS,
+    PerformanceRecord,
+    RelationHandler,
+    register_relation_handler,
+)
+from .sort_order import (
+    SORT_ALPHABETICAL,
+    SORT_INSTRUMENT_FAMILY,
+    SORT_LEAD_VOCALS_FIRST,
+    SORT_RELATION_ORDER,
+    SORT_SOLOISTS_FIRST,
+    instrument_ranks,
+    rank_table,
+    record_ranks,
+)
 from .ui_options_combine_performer_tags import \
     Ui_CombinePerformerTagsOptionsPage
 
 
 USER_GUIDE_URL = 'https://picard-plugins-user-guides.readthedocs.io/en/latest/combine_performer_tags/user_guide.html'
 
+# Picard configuration key for the additional output profiles.  Each profile is stored as a
+# dictionary with the name of the variable to produce and the option settings to use.
+PROFILES_KEY = 'profiles'
+DEFAULT_VARIABLE = 'performers'
+
+# Picard configuration key for the number of relations above which a recording is processed
+# in chunks from the Qt event loop rather than all at once, and the size of the chunks.
+CHUNK_THRESHOLD_KEY = 'chunk_threshold'
+CHUNK_SIZE = 500
+
+# Picard configuration key for the time budget in milliseconds for processing each track, the
+# name of the variable flagging tracks whose output was degraded, and the number of records
+# processed between checks of the budget.
+TIME_BUDGET_KEY = 'time_budget'
+TRUNCATED_VARIABLE = DEFAULT_VARIABLE + '_truncated'
+BUDGET_CHECK_INTERVAL = 64
+
+# Degradation levels applied when the time budget is exceeded
+DEGRADE_NONE = 0
+DEGRADE_NO_ATTRIBUTES = 1   # Remaining records are formatted without their attribute sections
+DEGRADE_CAPPED = 2          # Remaining records are left out of the output
+
+# Picard configuration key for the path of the file to write the co-performance graph to
+COPERFORMANCE_FILE_KEY = 'coperformance_file'
+
+# Picard configuration key for the path of the performer index database
+INDEX_FILE_KEY = 'index_file'
+
+# Picard configuration key for the name of the credits file written in the directory of each album's files
+CREDITS_FILE_KEY = 'credits_file'
+
+# Names shown for an artist credited under more than one name on a recording
+NAME_FIRST_CREDIT = 1       # The first credited name, in the order of the relations
+NAME_MOST_CREDITED = 2      # The name the artist is credited as most often
+NAME_ARTIST = 3             # The standard artist name
+
+# Number of recordings whose processors are kept for the `$performers()` script function
+PROCESSOR_CACHE_SIZE = 1000
+
+# Option overrides accepted by the `$performers()` script function, as the PluginOptions
+# attributes to set and the setting for each of the accepted values.
+BOOLEAN_VALUES = {'0': False, '1': True}
+SCRIPT_OVERRIDES = {
+    'group': (('OPT_TAG_GROUP_BY_ARTIST',), {'artist': True, 'instrument': False}),
+    'level': (('OPT_INSTRUMENT_GROUPING_LEVEL',), {'exact': LEVEL_EXACT, 'family': LEVEL_FAMILY, 'top': LEVEL_TOP}),
+    'sort': (
+        ('OPT_SORT_ORDER',),
+        {
+            'alphabetical': SORT_ALPHABETICAL,
+            'relation': SORT_RELATION_ORDER,
+            'lead_vocals': SORT_LEAD_VOCALS_FIRST,
+            'soloists': SORT_SOLOISTS_FIRST,
+            'family': SORT_INSTRUMENT_FAMILY,
+        }
+    ),
+    'normalize': (('OPT_NORMALIZE_KEYS',), BOOLEAN_VALUES),
+    'credited_artist': (('OPT_CREDITED_ARTIST',), BOOLEAN_VALUES),
+    'artist_name': (('OPT_ARTIST_NAME',), {'first': NAME_FIRST_CREDIT, 'most_common': NAME_MOST_CREDITED, 'artist': NAME_ARTIST}),
+    'credited_instrument': (('OPT_CREDITED_INSTRUMENT',), BOOLEAN_VALUES),
+    'credited_vocal': (('OPT_CREDITED_VOCAL',), BOOLEAN_VALUES),
+    'additional': (('OPT_INSTRUMENT_ATTR_ADDITIONAL', 'OPT_VOCAL_ATTR_ADDITIONAL'), BOOLEAN_VALUES),
+    'guest': (('OPT_INSTRUMENT_ATTR_GUEST', 'OPT_VOCAL_ATTR_GUEST'), BOOLEAN_VALUES),
+    'solo': (('OPT_INSTRUMENT_ATTR_SOLO', 'OPT_VOCAL_ATTR_SOLO'), BOOLEAN_VALUES),
+    'vocal_types': (('OPT_VOCAL_ATTR_TYPES',), BOOLEAN_VALUES),
+    'other_performers': (('OPT_OTHER_PERFORMERS',), BOOLEAN_VALUES),
+}
+
+# Picard configuration key for the memory profiling mode
+MEMORY_PROFILING_KEY = 'memory_profiling'
+
+# Setting to keep a trace of the processing decisions, and the number of decisions kept for each track
+DECISION_TRACE_KEY = 'decision_trace'
+TRACE_SIZE = 2000
+
+# Picard configuration key for the name of the existing file tag to compare with the new
+# `_performers` variable, and the names of the change detection variables.
+COMPARE_TAG_KEY = 'compare_tag'
+DIGEST_VARIABLE = DEFAULT_VARIABLE + '_digest'
+CHANGED_VARIABLE = DEFAULT_VARIABLE + '_changed'
+
+# Variable listing the performers specific to each track, excluding those common to the whole album
+TRACK_ONLY_VARIABLE = DEFAULT_VARIABLE + '_track_only'
+
 
 class PluginOptions():
     """Tag formatting options used by the plugin.  Initial attribute values
@@ -51,6 +185,7 @@ class PluginOptions():
         self.OPT_CREDITED_ARTIST = 'cred_artist'
         self.OPT_CREDITED_INSTRUMENT = 'cred_instrument'
         self.OPT_CREDITED_VOCAL = 'cred_vocal'
+        self.OPT_ARTIST_NAME = 'artist_name'
         self.OPT_INSTRUMENT_ATTR_ADDITIONAL = 'inst_attr_additional'
         self.OPT_INSTRUMENT_ATTR_GUEST = 'inst_attr_guest'
         self.OPT_INSTRUMENT_ATTR_SOLO = 'inst_attr_solo'
@@ -59,6 +194,10 @@ class PluginOptions():
         self.OPT_VOCAL_ATTR_SOLO = 'vocal_attr_solo'
         self.OPT_VOCAL_ATTR_TYPES = 'vocal_attr_types'
         self.OPT_TAG_GROUP_BY_ARTIST = 'group_by_artist'
+        self.OPT_INSTRUMENT_GROUPING_LEVEL = 'instrument_grouping_level'
+        self.OPT_SORT_ORDER = 'sort_order'
+        self.OPT_NORMALIZE_KEYS = 'normalize_keys'
+        self.OPT_OTHER_PERFORMERS = 'other_performers'
         self.OPT_FORMAT_GROUP_ADDITIONAL = 'format_group_additional'
         self.OPT_FORMAT_GROUP_GUEST = 'format_group_guest'
         self.OPT_FORMAT_GROUP_SOLO = 'format_group_solo'
@@ -86,6 +225,69 @@ class PluginOptions():
             key = getattr(temp, option)
             self.__dict__[option] = self.api.plugin_config[key]
 
+    def load_from_dict(self, settings: dict) -> None:
+        """Set the current attributes from a dictionary of settings keyed by the Picard
+        configuration keys.  Attributes without a matching key are left unchanged.
+
+        Args:
+            settings (dict): Settings to use, such as those saved for an output profile.
+        """
+        temp = PluginOptions(self.api)  # Get unintialized list to provide Picard option settings keys
+        for option in [x for x in temp.__dict__ if x.startswith('OPT_')]:
+            key = getattr(temp, option)
+            if key in settings:
+                self.__dict__[option] = settings[key]
+
+    def to_dict(self) -> dict:
+        """Get the current attributes as a dictionary keyed by the Picard configuration keys.
+
+        Returns:
+            dict: Current settings.
+        """
+        temp = PluginOptions(self.api)  # Get unintialized list to provide Picard option settings keys
+        return {getattr(temp, option): self.__dict__[option] for option in temp.__dict__ if option.startswith('OPT_')}
+
+
+def load_profiles(api: PluginApi) -> list:
+    """Get the additional output profiles from the Picard configuration.  Settings missing
+    from a profile use the values from the main settings.
+
+    Args:
+        api (PluginApi): The plugin's api.
+
+    Returns:
+        list: Tuples of (variable name, PluginOptions) for each profile.
+    """
+    profiles = []
+    for profile in api.plugin_config[PROFILES_KEY]:
+        options = PluginOptions(api)
+        options.load_from_config()
+        options.load_from_dict(profile['settings'])
+        profiles.append((profile['variable'], options))
+    return profiles
+
+
+PerformerInfo = namedtuple('PerformerInfo', ['group', 'value_sort', 'info'])
+
+
+@lru_cache(maxsize=None)
+def normalize_key(text: str) -> str:
+    """Normalize a name for comparison, so that names differing only in case, Unicode
+    composition or whitespace are combined.  Results are cached, so each distinct name
+    is only normalized once per session.
+
+    Args:
+        text (str): Name to normalize.
+
+    Returns:
+        str: NFC normalized, case-folded name with the whitespace collapsed.
+    """
+    return ' '.join(unicodedata.normalize('NFC', text).casefold().split())
+
+
+def _unchanged(text: str) -> str:
+    return text
+
 
 class CombinePerformerTags():
     """Combines performer information from the metadata to produce a multi-value variable.
@@ -102,218 +304,1350 @@ class CombinePerformerTags():
         """
         self.performance_dict = {}
         self.source = source_metadata
+        self._records = None
+        self._ranks = {}
+        self._names = {}
+        self._credits = None
+        self._deadline = None
+        self._cap_deadline = None
+        self._truncated = False
+        self.degraded = DEGRADE_NONE
+        # Performance items produced by the `$performers()` script function, by option overrides
+        self.results = {}
+        # Most recent processing decisions, or None if tracing is not enabled
+        self.trace = None
+        # Processor for the records not common to the whole album, set once the album has loaded
+        self.track_only = None
+        self._parse = self._parse_relations
+        self._group = self._group_records
         if options:
             self.settings = options
         else:
             self.settings = PluginOptions(api)
             self.settings.load_from_config()
 
-    def _make_instrument_key(self, instrument: str, groups: dict) -> str:
+    @classmethod
+    def from_records(cls, records: list, options: PluginOptions = None, api: PluginApi = None) -> 'CombinePerformerTags':
+        """Create a processor for performance records that have already been parsed, such
+        as the records built from existing performer tags.
+
+        Args:
+            records (list): Performance records to process.
+            options (PluginOptions, optional): Options to use for processing.  If not provided,
+                the current settings from Picard's option settings are used.
+            api (PluginApi, optional): The plugin's api.  Defaults to None.
+
+        Returns:
+            CombinePerformerTags: Processor for the records.
+        """
+        processor = cls(None, options, api)
+        processor._records = records  # pylint: disable=protected-access
+        return processor
+
+    @property
+    def records(self) -> list:
+        """Performance records parsed from the input metadata.  The relations are only
+        parsed once, and the records are shared by all output profiles.
+        """
+        if self._records is None:
+            if self._deadline is None:
+                self._records = self._parse(self.source)
+            else:
+                self._records = self._parse_within_budget(self.source)
+        return self._records
+
+    def _get_ranks(self, sort_order: int) -> list:
+        """Get the rank tuples for the performance records in the specified sort order.  The
+        ranks are only calculated once for each sort order, and are shared by all output profiles.
+        """
+        if sort_order not in self._ranks:
+            self._ranks[sort_order] = record_ranks(self.records, sort_order)
+        return self._ranks[sort_order]
+
+    def _get_names(self, settings: PluginOptions) -> dict:
+        """Get the names shown for the artists credited under more than one name, by artist key.
+        The names are only chosen once for each policy, and shared by all output profiles.
+        """
+        # The standard name is the same on every relation for an artist
+        if not settings.OPT_CREDITED_ARTIST:
+            return {}
+        policy = settings.OPT_ARTIST_NAME
+        if policy not in self._names:
+            if self._credits is None:
+                self._credits = self._count_credits(self.records, {})
+            self._names[policy] = self._artist_names(self._credits, policy)
+        return self._names[policy]
+
+    @staticmethod
+    def _count_credits(records: list, credits: dict) -> dict:
+        # Counts the names each artist is credited under, by artist key, so that the counts
+        # can be collected in chunks and shared by all of the naming policies
+        for record in records:
+            if record.artist_key:
+                name = record.artist_credit or record.artist
+                credits.setdefault(record.artist_key, (record.artist, Counter()))[1][name] += 1
+        return credits
+
+    @staticmethod
+    def _artist_names(credits: dict, policy: int) -> dict:
+        names = {}
+        for artist_key, (artist, counts) in credits.items():
+            if len(counts) < 2:
+                continue
+            if policy == NAME_MOST_CREDITED:
+                # Ties go to the name credited first
+                names[artist_key] = counts.most_common(1)[0][0]
+            elif policy == NAME_ARTIST:
+                names[artist_key] = artist
+            else:
+                names[artist_key] = next(iter(counts))
+        return names
+
+    def set_budget(self, budget: float) -> None:
+        """Set a time budget for processing, starting now.  Once the budget is exceeded the
+        remaining relations are not parsed and the remaining records are formatted without
+        their attribute sections, and once twice the budget is exceeded the remaining records
+        are left out.  The level reached is available in ``degraded``.
+
+        Args:
+            budget (float): Time budget in seconds.
+        """
+        now = time.perf_counter()
+        self._deadline = now + budget
+        self._cap_deadline = now + 2 * budget
+
+    def clear_budget(self) -> None:
+        """Remove the time budget once the budgeted processing is done, so that the processor
+        gives its full output when it is used again, such as by the `$performers()` script
+        function.  Records cut short by the budget are dropped, to be parsed in full from the
+        input metadata the next time they are needed.
+        """
+        self._deadline = None
+        self._cap_deadline = None
+        self.degraded = DEGRADE_NONE
+        if self._truncated:
+            self._truncated = False
+            self._records = None
+            self._ranks = {}
+            self._names = {}
+            self._credits = None
+
+    def describe_degradation(self) -> str:
+        """Describe what was left out of the output because the time budget was exceeded.
+
+        Returns:
+            str: Description of the parts left out, or an empty string if nothing was left out.
+        """
+        parts = []
+        if self._truncated:
+            parts.append("relations")
+        if self.degraded == DEGRADE_CAPPED:
+            parts.append("performers")
+        elif self.degraded == DEGRADE_NO_ATTRIBUTES:
+            parts.append("attributes")
+        return ' and '.join(parts)
+
+    def _check_budget(self) -> int:
+        now = time.perf_counter()
+        if now > self._cap_deadline:
+            level = DEGRADE_CAPPED
+        elif now > self._deadline:
+            level = DEGRADE_NO_ATTRIBUTES
+        else:
+            return DEGRADE_NONE
+        self.degraded = max(self.degraded, level)
+        return level
+
+    def enable_trace(self, size: int) -> None:
+        """Keep a trace of the processing decisions, explaining why each relation was included,
+        skipped or merged.  Tracing replaces the parsing and grouping methods, so the processing
+        is unchanged when it is not enabled.
+
+        Args:
+            size (int): Number of the most recent decisions to keep.
+        """
+        self.trace = deque(maxlen=size)
+        self._parse = self._trace_parse
+        self._group = self._trace_group
+
+    def release_source(self) -> None:
+        """Release the input metadata once the relations have been parsed, keeping only the
+        compact performance records.
+        """
+        if self._records is not None:
+            self.source = None
+
+    def _parse_within_budget(self, relations: list) -> list:
+        # Stop parsing once the budget is exceeded, leaving the rest of the budget to format
+        # the relations parsed so far.
+        records = []
+        for start in range(0, len(relations), BUDGET_CHECK_INTERVAL):
+            if self._check_budget() != DEGRADE_NONE:
+                self._truncated = True
+                if self.trace is not None:
+                    self.trace.append(f"Skipped relations {start + 1} to {len(relations)}: time budget exceeded")
+                break
+            records.extend(self._parse(relations[start:start + BUDGET_CHECK_INTERVAL]))
+        return records
+
+    @staticmethod
+    def _parse_relations(relations: list) -> list:
+        records = []
+        for relation in relations:
+            handler = RELATION_HANDLERS.get(relation.get('type'))
+            if handler is None and TYPE_ID_HANDLERS:
+                handler = TYPE_ID_HANDLERS.get(relation.get('type-id'))
+            if handler is not None and relation.get('artist'):
+                records.append(handler.parse(relation))
+        return records
+
+    def _trace_parse(self, relations: list) -> list:
+        records = []
+        for relation in relations:
+            relation_type = relation.get('type')
+            handler = RELATION_HANDLERS.get(relation_type)
+            if handler is None and TYPE_ID_HANDLERS:
+                handler = TYPE_ID_HANDLERS.get(relation.get('type-id'))
+            if handler is None:
+                self.trace.append(f"Skipped '{relation_type}' relation: not a performance relation type")
+            elif not relation.get('artist'):
+                self.trace.append(f"Skipped '{relation_type}' relation: no artist")
+            else:
+                record = handler.parse(relation)
+                records.append(record)
+                attributes = f" ({', '.join(sorted(record.attributes))})" if record.attributes else ''
+                self.trace.append(f"Parsed '{relation_type}' relation: {record.artist} as {record.instrument}{attributes}")
+        return records
+
+    def _trace_group(self, settings: PluginOptions, records: list, ranks: list, performers: dict, names: dict) -> None:
+        self.trace.append(
+            f"Formatting {len(records)} records grouped by {'artist' if settings.OPT_TAG_GROUP_BY_ARTIST else 'instrument'}"
+        )
+        normalize = normalize_key if settings.OPT_NORMALIZE_KEYS else _unchanged
+        items = {key: set(item['data']) for key, item in performers.items()}
+        for record in records:
+            self.trace.append(self._explain_record(settings, record, normalize, items, names))
+        self._group_records(settings, records, ranks, performers, names)
+        if self.degraded:
+            self.trace.append(f"Time budget exceeded: the remaining {self.describe_degradation()} were left out")
+
+    def _explain_record(self, settings: PluginOptions, record: PerformanceRecord, normalize, items: dict, names: dict) -> str:
+        subject = f"{record.artist} as {record.instrument}"
+        handler = RELATION_GROUPS[record.group]
+        if handler.option and not getattr(settings, handler.option):
+            return f"Skipped {subject}: {handler.option} is not enabled"
+        key, value, _sort_key, sort_value = self._format_record(settings, record, names=names)
+        if not key or not len(value) > 1:
+            return f"Skipped {subject}: empty value"
+
+        notes = []
+        if record.artist_key in names:
+            notes.append(f"artist credited under several names, shown as '{names[record.artist_key]}'")
+        elif settings.OPT_CREDITED_ARTIST and record.artist_credit:
+            notes.append(f"credited artist '{record.artist_credit}'")
+        if handler.hierarchy and settings.OPT_INSTRUMENT_GROUPING_LEVEL != LEVEL_EXACT and record.instrument_id:
+            ancestor = INSTRUMENT_HIERARCHY.get_name(record.instrument_id, settings.OPT_INSTRUMENT_GROUPING_LEVEL)
+            if ancestor:
+                notes.append(f"grouped as '{ancestor}'")
+        elif record.instrument_credit and handler.credited_option and getattr(settings, handler.credited_option):
+            notes.append(f"credited instrument '{record.instrument_credit}'")
+        suppressed = [x for x in record.attributes if x in handler.keyword_options and not getattr(settings, handler.keyword_options[x])]
+        if suppressed:
+            notes.append(f"attributes left out: {', '.join(sorted(suppressed))}")
+
+        match_key, item = self._match_keys(settings, record, key, value, sort_value, normalize)
+        if match_key not in items:
+            items[match_key] = {item}
+            action = f"added '{key}: {value}'"
+        elif item in items[match_key]:
+            action = f"merged with the same value '{value}' in '{key}'"
+        else:
+            items[match_key].add(item)
+            action = f"merged '{value}' into '{key}'"
+        return f"Included {subject}: {action}" + (f" ({'; '.join(notes)})" if notes else '')
+
+    @staticmethod
+    def _make_instrument_key(settings: PluginOptions, instrument: str, groups: dict) -> str:
         key = ''
 
         if groups[1]:
-            sep: str = self.settings.OPT_FORMAT_GROUP_1_SEP if self.settings.OPT_FORMAT_GROUP_1_SEP else ' '
-            key += self.settings.OPT_FORMAT_GROUP_1_START + sep.join(groups[1]) + self.settings.OPT_FORMAT_GROUP_1_END
+            sep: str = settings.OPT_FORMAT_GROUP_1_SEP if settings.OPT_FORMAT_GROUP_1_SEP else ' '
+            key += settings.OPT_FORMAT_GROUP_1_START + sep.join(groups[1]) + settings.OPT_FORMAT_GROUP_1_END
 
         key += instrument
 
         if groups[2]:
-            sep: str = self.settings.OPT_FORMAT_GROUP_2_SEP if self.settings.OPT_FORMAT_GROUP_2_SEP else ' '
-            key += self.settings.OPT_FORMAT_GROUP_2_START + sep.join(groups[2]) + self.settings.OPT_FORMAT_GROUP_2_END
+            sep: str = settings.OPT_FORMAT_GROUP_2_SEP if settings.OPT_FORMAT_GROUP_2_SEP else ' '
+            key += settings.OPT_FORMAT_GROUP_2_START + sep.join(groups[2]) + settings.OPT_FORMAT_GROUP_2_END
 
         if groups[3]:
-            sep: str = self.settings.OPT_FORMAT_GROUP_3_SEP if self.settings.OPT_FORMAT_GROUP_3_SEP else ' '
-            key += self.settings.OPT_FORMAT_GROUP_3_START + sep.join(groups[3]) + self.settings.OPT_FORMAT_GROUP_3_END
+            sep: str = settings.OPT_FORMAT_GROUP_3_SEP if settings.OPT_FORMAT_GROUP_3_SEP else ' '
+            key += settings.OPT_FORMAT_GROUP_3_START + sep.join(groups[3]) + settings.OPT_FORMAT_GROUP_3_END
 
         return key
 
-    def _make_instrument_value(self, instrument: str, groups: dict) -> str:
+    @staticmethod
+    def _make_instrument_value(settings: PluginOptions, instrument: str, groups: dict) -> str:
         value = ''
 
         if groups[1]:
-            sep: str = self.settings.OPT_FORMAT_GROUP_1_SEP if self.settings.OPT_FORMAT_GROUP_1_SEP else ' '
-            value += self.settings.OPT_FORMAT_GROUP_1_START + sep.join(groups[1]) + self.settings.OPT_FORMAT_GROUP_1_END
+            sep: str = settings.OPT_FORMAT_GROUP_1_SEP if settings.OPT_FORMAT_GROUP_1_SEP else ' '
+            value += settings.OPT_FORMAT_GROUP_1_START + sep.join(groups[1]) + settings.OPT_FORMAT_GROUP_1_END
 
         value += instrument
 
         if groups[2]:
-            sep: str = self.settings.OPT_FORMAT_GROUP_2_SEP if self.settings.OPT_FORMAT_GROUP_2_SEP else ' '
-            value += self.settings.OPT_FORMAT_GROUP_2_START + sep.join(groups[2]) + self.settings.OPT_FORMAT_GROUP_2_END
+            sep: str = settings.OPT_FORMAT_GROUP_2_SEP if settings.OPT_FORMAT_GROUP_2_SEP else ' '
+            value += settings.OPT_FORMAT_GROUP_2_START + sep.join(groups[2]) + settings.OPT_FORMAT_GROUP_2_END
 
         if groups[3]:
-            sep: str = self.settings.OPT_FORMAT_GROUP_3_SEP if self.settings.OPT_FORMAT_GROUP_3_SEP else ' '
-            value += self.settings.OPT_FORMAT_GROUP_3_START + sep.join(groups[3]) + self.settings.OPT_FORMAT_GROUP_3_END
+            sep: str = settings.OPT_FORMAT_GROUP_3_SEP if settings.OPT_FORMAT_GROUP_3_SEP else ' '
+            value += settings.OPT_FORMAT_GROUP_3_START + sep.join(groups[3]) + settings.OPT_FORMAT_GROUP_3_END
 
         if groups[4]:
-            sep: str = self.settings.OPT_FORMAT_GROUP_4_SEP if self.settings.OPT_FORMAT_GROUP_4_SEP else ' '
-            value += self.settings.OPT_FORMAT_GROUP_4_START + sep.join(groups[4]) + self.settings.OPT_FORMAT_GROUP_4_END
+            sep: str = settings.OPT_FORMAT_GROUP_4_SEP if settings.OPT_FORMAT_GROUP_4_SEP else ' '
+            value += settings.OPT_FORMAT_GROUP_4_START + sep.join(groups[4]) + settings.OPT_FORMAT_GROUP_4_END
 
         return value
 
-    def _make_artist_value(self, artist: str, groups: dict) -> str:
+    @staticmethod
+    def _make_artist_value(settings: PluginOptions, artist: str, groups: dict) -> str:
         value = artist
 
         if groups[4]:
-            sep: str = self.settings.OPT_FORMAT_GROUP_4_SEP if self.settings.OPT_FORMAT_GROUP_4_SEP else ' '
-            value += self.settings.OPT_FORMAT_GROUP_4_START + sep.join(groups[4]) + self.settings.OPT_FORMAT_GROUP_4_END
+            sep: str = settings.OPT_FORMAT_GROUP_4_SEP if settings.OPT_FORMAT_GROUP_4_SEP else ' '
+            value += settings.OPT_FORMAT_GROUP_4_START + sep.join(groups[4]) + settings.OPT_FORMAT_GROUP_4_END
 
         return value
 
-    def _parse_metadata(self, relation: dict) -> tuple:
+    def _format_record(self, settings: PluginOptions, record: PerformanceRecord, attributes: bool = True, names: dict = None) -> tuple:
         groups = {1: [], 2: [], 3: [], 4: []}
 
-        group = relation['type'][0]
-        attributes = set(x for x in relation['attributes'])   # Make copy to update if empty
-        performer = relation['target-credit'] if self.settings.OPT_CREDITED_ARTIST and relation['target-credit'] else relation['artist']['name']
-        performer_sort = relation['artist']['sort-name']
-        if not attributes or not attributes.difference({'additional', 'guest', 'solo'}):
-            attributes.add('vocals' if group == 'v' else 'instruments')
-        instrument = attributes.difference({'additional', 'guest', 'solo'}).pop()
-        attributes = attributes.difference({instrument,})
+        handler = RELATION_GROUPS[record.group]
+        if handler.option and not getattr(settings, handler.option):
+            return '', '', '', ''
 
-        # Get as credited name for the instrument or vocal
-        if (
-            'attribute-credits' in relation and instrument in relation['attribute-credits']
-            and (
-                (group == 'i' and self.settings.OPT_CREDITED_INSTRUMENT)
-                or (group == 'v' and self.settings.OPT_CREDITED_VOCAL)
-            )
-        ):
-            instrument = relation['attribute-credits'][instrument]
+        # Artists credited under more than one name are shown with the name chosen for the artist
+        if names and record.artist_key in names:
+            performer = names[record.artist_key]
+        else:
+            performer = record.artist_credit if settings.OPT_CREDITED_ARTIST and record.artist_credit else record.artist
+        performer_sort = record.artist_sort
+        instrument = record.instrument
 
-        # Add any additional attributes such as 'guest' or 'solo'
-        for attr in attributes:
-            if (
-                attr == 'additional'
-                and (
-                    (group == 'i' and not self.settings.OPT_INSTRUMENT_ATTR_ADDITIONAL)
-                    or (group == 'v' and not self.settings.OPT_VOCAL_ATTR_ADDITIONAL)
-                )
-            ):
-                continue
+        # Get the family or top-level instrument if grouping by instrument hierarchy
+        ancestor = ''
+        if handler.hierarchy and settings.OPT_INSTRUMENT_GROUPING_LEVEL != LEVEL_EXACT and record.instrument_id:
+            ancestor = INSTRUMENT_HIERARCHY.get_name(record.instrument_id, settings.OPT_INSTRUMENT_GROUPING_LEVEL)
 
-            if (
-                attr == 'guest'
-                and (
-                    (group == 'i' and not self.settings.OPT_INSTRUMENT_ATTR_GUEST)
-                    or (group == 'v' and not self.settings.OPT_VOCAL_ATTR_GUEST)
-                )
-            ):
-                continue
+        if ancestor:
+            instrument = ancestor
+        # Get as credited name for the instrument or vocal
+        elif record.instrument_credit and handler.credited_option and getattr(settings, handler.credited_option):
+            instrument = record.instrument_credit
 
-            if (
-                attr == 'solo'
-                and (
-                    (group == 'i' and not self.settings.OPT_INSTRUMENT_ATTR_SOLO)
-                    or (group == 'v' and not self.settings.OPT_VOCAL_ATTR_SOLO)
-                )
-            ):
+        # Add any additional attributes such as 'guest' or 'solo'
+        for attr in record.attributes if attributes else ():
+            option = handler.keyword_options.get(attr)
+            if option and not getattr(settings, option):
                 continue
 
             if attr == 'additional':
-                groups[self.settings.OPT_FORMAT_GROUP_ADDITIONAL].append(attr)
+                groups[settings.OPT_FORMAT_GROUP_ADDITIONAL].append(attr)
             elif attr == 'guest':
-                groups[self.settings.OPT_FORMAT_GROUP_GUEST].append(attr)
+                groups[settings.OPT_FORMAT_GROUP_GUEST].append(attr)
             elif attr == 'solo':
-                groups[self.settings.OPT_FORMAT_GROUP_SOLO].append(attr)
-            elif self.settings.OPT_VOCAL_ATTR_TYPES and group == 'v':
-                groups[self.settings.OPT_FORMAT_GROUP_VOCALS].append(attr)
+                groups[settings.OPT_FORMAT_GROUP_SOLO].append(attr)
+            elif settings.OPT_VOCAL_ATTR_TYPES and handler.type_attributes:
+                groups[settings.OPT_FORMAT_GROUP_VOCALS].append(attr)
 
         #############################################################
         #                                                           #
-        #   Grouping Rules                                          #
+        #   Grouping Rules (alphabetical sort order)                #
         #                                                           #
         #   If grouping by artist:                                  #
         #       - keys are sorted by artist sort name               #
         #       - values are sorted by instrument/vocal name with   #
-        #         instruments appearing before vocals               #
+        #         instruments appearing before vocals and other     #
+        #         performance credits                               #
         #                                                           #
         #   If grouping by instrument/vocal                         #
         #       - keys are sorted by instrument/vocal name with     #
-        #         instruments appearing before vocals               #
+        #         instruments appearing before vocals and other     #
+        #         performance credits                               #
         #       - values are sorted by artist sort name             #
         #                                                           #
+        #   Other sort orders rank the keys and values by role,     #
+        #   attribute, instrument or relation order first.          #
+        #                                                           #
         #############################################################
 
-        if self.settings.OPT_TAG_GROUP_BY_ARTIST:
+        if settings.OPT_TAG_GROUP_BY_ARTIST:
             key = performer
-            value = self._make_instrument_value(instrument, groups)
+            value = self._make_instrument_value(settings, instrument, groups)
             sort_key = performer_sort
-            sort_value = group + value
+            sort_value = value
         else:
-            key = self._make_instrument_key(instrument, groups)
-            value = self._make_artist_value(performer, groups)
-            sort_key = group + key
+            key = self._make_instrument_key(settings, instrument, groups)
+            value = self._make_artist_value(settings, performer, groups)
+            sort_key = key
             sort_value = performer_sort
 
-        return key, value, group, sort_key, sort_value
+        return key, value, sort_key, sort_value
 
-    def get_performers(self) -> list:
+    def get_performers(self, options: PluginOptions = None) -> list:
         """Process the input metadata using the provided settings to produce
         the list of performance items for the multi-value variable.
 
+        Args:
+            options (PluginOptions, optional): Options for the output profile to produce.  If
+                not provided, the processor's settings are used.  The input relations are only
+                parsed once, regardless of the number of profiles requested.
+
         Returns:
             list: Performance items for the multi-value variable.
         """
+        settings = options if options else self.settings
 
         performers = {}
-        performers_tag = []
+        self._group(settings, self.records, self._get_ranks(settings.OPT_SORT_ORDER), performers, self._get_names(settings))
+        return self._make_tag(performers)
 
-        PerformerInfo = namedtuple('PerformerInfo', ['value_sort', 'info'])
+    def iter_chunks(self, profiles: list, chunk_size: int):
+        """Generator that processes the input metadata in chunks of relations, yielding
+        after each chunk so that the caller can do other work between the chunks.
 
-        for relation in self.source:
-            if (
-                'artist' not in relation or not relation['artist']
-                or 'type' not in relation or relation['type'] not in ('instrument', 'vocal')
-            ):
-                continue
+        Args:
+            profiles (list): Options for each of the output profiles to produce.  An entry
+                of None uses the processor's settings.
+            chunk_size (int): Maximum number of relations or records to process in each chunk.
 
-            key, value, group, sort_key, sort_value = self._parse_metadata(relation)
+        Returns:
+            list: Performance items for each of the output profiles, as the value of the
+                ``StopIteration`` raised when the generator is exhausted.
+        """
+        if self._records is None:
+            records = []
+            for start in range(0, len(self.source), chunk_size):
+                records.extend(self._parse(self.source[start:start + chunk_size]))
+                yield
+            self._records = records
+
+        results = []
+        for options in profiles:
+            settings = options if options else self.settings
+            sort_order = settings.OPT_SORT_ORDER
+            if sort_order not in self._ranks:
+                families = instrument_ranks(self._records) if sort_order == SORT_INSTRUMENT_FAMILY else None
+                ranks = []
+                for start in range(0, len(self._records), chunk_size):
+                    ranks.extend(record_ranks(self._records[start:start + chunk_size], sort_order, families, start))
+                    yield
+                self._ranks[sort_order] = ranks
+            ranks = self._ranks[sort_order]
+            # The names for artists credited under more than one name are chosen from all of the records
+            if settings.OPT_CREDITED_ARTIST and settings.OPT_ARTIST_NAME not in self._names:
+                if self._credits is None:
+                    credits = {}
+                    for start in range(0, len(self._records), chunk_size):
+                        self._count_credits(self._records[start:start + chunk_size], credits)
+                        yield
+                    self._credits = credits
+                self._names[settings.OPT_ARTIST_NAME] = self._artist_names(self._credits, settings.OPT_ARTIST_NAME)
+                yield
+            names = self._get_names(settings)
+            performers = {}
+            for start in range(0, len(self._records), chunk_size):
+                self._group(settings, self._records[start:start + chunk_size], ranks[start:start + chunk_size], performers, names)
+                yield
+            keys = self._sort_keys(performers)
+            yield
+            value_ranks = self._value_ranks(performers)
+            yield
+            performers_tag = []
+            for start in range(0, len(keys), chunk_size):
+                performers_tag.extend(self._make_tag(performers, keys[start:start + chunk_size], value_ranks))
+                yield
+            results.append(performers_tag)
+        return results
+
+    @staticmethod
+    def _match_keys(settings: PluginOptions, record: PerformanceRecord, key: str, value: str, sort_value: str, normalize) -> tuple:
+        # Artists are matched on their artist key, so that an artist credited under different
+        # names is combined and different artists sharing a name are not.  Records without an
+        # artist id are matched on the name.
+        if settings.OPT_TAG_GROUP_BY_ARTIST:
+            return record.artist_key or normalize(key), PerformerInfo(record.group, normalize(sort_value), normalize(value))
+        return normalize(key), PerformerInfo(record.group, normalize(sort_value), (record.artist_key, normalize(value)))
+
+    def _group_records(self, settings: PluginOptions, records: list, ranks: list, performers: dict, names: dict) -> None:
+        # Items and values are matched on their artist keys and normalized names if enabled,
+        # and output using the first form of the name seen.  The names are those chosen for
+        # the artists credited under more than one name, from ``_get_names()``.
+        normalize = normalize_key if settings.OPT_NORMALIZE_KEYS else _unchanged
+        for index, (record, rank) in enumerate(zip(records, ranks)):
+            if self._deadline is not None and not index % BUDGET_CHECK_INTERVAL and self._check_budget() == DEGRADE_CAPPED:
+                return
+            key, value, sort_key, sort_value = self._format_record(settings, record, self.degraded == DEGRADE_NONE, names)
             if not key or not len(value) > 1:
                 continue
 
-            if key not in performers:
-                performers[key] = {'group': 'z', 'key_sort': '', 'data': set(), }
-
-            if group < performers[key]['group']:
-                performers[key]['group'] = group
+            match_key, item = self._match_keys(settings, record, key, value, sort_value, normalize)
+            if match_key not in performers:
+                performers[match_key] = {'name': key, 'rank': rank, 'key_sort': normalize(sort_key), 'data': {}, }
+            elif rank < performers[match_key]['rank']:
+                performers[match_key]['rank'] = rank
+
+            performers[match_key]['key_sort'] = normalize(sort_key)
+            data = performers[match_key]['data']
+            if item not in data:
+                data[item] = (rank, value)
+            elif rank < data[item][0]:
+                data[item] = (rank, data[item][1])
+
+    @staticmethod
+    def _sort_keys(performers: dict) -> list:
+        key_ranks = rank_table(x['key_sort'] for x in performers.values())
+        return sorted(performers, key=lambda x: performers[x]['rank'] + (key_ranks[performers[x]['key_sort']],))
+
+    @staticmethod
+    def _value_ranks(performers: dict) -> dict:
+        return rank_table(info.value_sort for item in performers.values() for info in item['data'])
+
+    @staticmethod
+    def _make_tag(performers: dict, keys: list = None, value_ranks: dict = None) -> list:
+        performers_tag = []
 
-            performers[key]['key_sort'] = sort_key
-            performers[key]['data'].add(PerformerInfo(sort_value, value))
+        if keys is None:
+            keys = CombinePerformerTags._sort_keys(performers)
+        if value_ranks is None:
+            value_ranks = CombinePerformerTags._value_ranks(performers)
 
-        for item in sorted(performers.items(), key=lambda x: x[1]['group'] + x[1]['key_sort']):
-            tag_key = item[0]
-            values = [x[1] for x in sorted(item[1]['data'], key=lambda y: y[0])]
+        for tag_key in keys:
+            data = performers[tag_key]['data']
+            values = [data[x][1] for x in sorted(data, key=lambda x, d=data: d[x][0] + (value_ranks[x.value_sort],))]
             value = ', '.join(values)
-            performers_tag.append(f"{tag_key}: {value}")
+            performers_tag.append(f"{performers[tag_key]['name']}: {value}")
 
         return performers_tag
 
 
-def combine_performer_tags(api: PluginApi, _album, album_metadata, track_metadata, release_metadata) -> None:
-    """Combines performer information into a multi-value variable for use in scripting.
+class ChunkedRunner():
+    """Runs a chunked processing generator from the Qt event loop, so that the user
+    interface stays responsive while a large recording is processed.
+    """
+
+    # Qt only holds a weak reference to a bound method slot, so keep the runners
+    # alive until they are finished.
+    _running = set()
+
+    def __init__(self, steps, callback, time_slice: float = 0.01) -> None:
+        """Runs a chunked processing generator from the Qt event loop.
+
+        Args:
+            steps (generator): Generator that yields between chunks of work.
+            callback (callable): Called with the value returned by the generator when it is exhausted.
+            time_slice (float, optional): Maximum time in seconds to spend processing chunks
+                before returning control to the event loop.  Defaults to 0.01.
+        """
+        self.steps = steps
+        self.callback = callback
+        self.time_slice = time_slice
+        # The timer is started again at the end of each slice, so that the timers that became due
+        # during the slice run before the next slice.  A zero delay ``QTimer.singleShot()`` is queued
+        # as an event instead, which can run the next slice straight after the previous one.
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_slice)
+
+    def start(self) -> None:
+        """Start processing the chunks.
+        """
+        self._running.add(self)
+        self._timer.start()
+
+    def _run_slice(self) -> None:
+        end = time.perf_counter() + self.time_slice
+        try:
+            while time.perf_counter() < end:
+                next(self.steps)
+        except StopIteration as e:
+            self._running.discard(self)
+            self.callback(e.value)
+            return
+        self._timer.start()
+
+
+class ChunkedAlbums():
+    """Counts the tracks on each album that are still being processed in chunks.  Picard does not
+    wait for them before it finalizes the album, so the work done once all of the album's tracks
+    have been processed, such as finding the performers common to the album, waits for them.
+    """
+
+    def __init__(self) -> None:
+        self._albums = {}
+
+    def start(self, album) -> None:
+        """Record that a track on an album has started to be processed in chunks.
+
+        Args:
+            album (Album): Album containing the track.
+        """
+        state = self._albums.setdefault(id(album), {'count': 0, 'callbacks': []})
+        state['count'] += 1
+
+    def finish(self, album) -> None:
+        """Record that a track on an album has been processed in chunks, running the functions
+        waiting for the album once its last track has been processed.
+
+        Args:
+            album (Album): Album containing the track.
+        """
+        state = self._albums.get(id(album))
+        if state is None:
+            return
+        state['count'] -= 1
+        if state['count']:
+            return
+        del self._albums[id(album)]
+        for func in state['callbacks']:
+            func()
+
+    def processing(self, album) -> bool:
+        """Check whether an album is still loading or has tracks still being processed in chunks.
+
+        Args:
+            album (Album): Album to check.
+
+        Returns:
+            bool: True if the album's tracks have not all been processed.
+        """
+        return not album.loaded or id(album) in self._albums
+
+    def run_when_processed(self, album, func, run_on_error: bool = False) -> None:
+        """Run a function once an album has finished loading and all of its tracks have been processed.
+
+        Args:
+            album (Album): Album to wait for.
+            func (callable): Function to run.
+            run_on_error (bool, optional): Also run the function if the album fails to load.
+                Defaults to False.
+        """
+        def _loaded() -> None:
+            state = self._albums.get(id(album))
+            if state is None:
+                func()
+            else:
+                state['callbacks'].append(func)
+
+        album.run_when_loaded(_loaded, run_on_error=run_on_error)
+
+
+CHUNKED_ALBUMS = ChunkedAlbums()
+
+
+class MissingDataLog():
+    """Collects the missing metadata errors for each album while it is loading, so that
+    a single summary line is logged for the album rather than one line per track.
+    """
+
+    # Maximum number of track numbers to include in the summary for each missing element
+    SAMPLE_SIZE = 5
+
+    def __init__(self) -> None:
+        self._albums = {}
+        self._warned = set()
+
+    def reset(self) -> None:
+        """Clear all collected errors and the record of warnings already logged.
+        """
+        self._albums = {}
+        self._warned = set()
+
+    def warn_once(self, api: PluginApi, key: str, message: str) -> None:
+        """Log a warning message only the first time it is reported in the session.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            key (str): Key identifying the message.
+            message (str): Message to log.
+        """
+        if key in self._warned:
+            return
+        self._warned.add(key)
+        api.logger.warning(message)
+
+    def add(self, api: PluginApi, album, album_id: str, metadata_element: str, track_number: str) -> None:
+        """Record a track with missing metadata.  The summary for the album is logged once
+        the album has finished loading.  If the track is not part of an album that is still
+        loading, the error is logged immediately.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            album (Album): Album containing the track, or None.
+            album_id (str): MusicBrainz id of the album.
+            metadata_element (str): The missing metadata element.
+            track_number (str): Number of the track with the missing element.
+        """
+        if album is None or album.loaded:
+            api.logger.error(f"{album_id}: Missing '{metadata_element}' in track {track_number} metadata.")
+            return
+
+        key = id(album)
+        if key not in self._albums:
+            self._albums[key] = (album_id, {})
+            album.run_when_loaded(lambda: self.flush(api, key), run_on_error=True)
+        tracks = self._albums[key][1].setdefault(metadata_element, [])
+        tracks.append(track_number)
+
+    def discard(self, album) -> None:
+        """Drop any errors collected for an album that was removed before it finished loading.
+
+        Args:
+            album (Album): The removed album.
+        """
+        self._albums.pop(id(album), None)
+
+    def flush(self, api: PluginApi, key: int) -> None:
+        """Log the summary of the missing metadata for an album.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            key (int): Key of the album in the collected errors.
+        """
+        if key not in self._albums:
+            return
+        album_id, elements = self._albums.pop(key)
+        details = []
+        for metadata_element, tracks in elements.items():
+            sample = ', '.join(tracks[:self.SAMPLE_SIZE]) + (', ...' if len(tracks) > self.SAMPLE_SIZE else '')
+            details.append(f"'{metadata_element}' in {len(tracks)} track{'' if len(tracks) == 1 else 's'} ({sample})")
+        api.logger.error(f"{album_id}: Missing {'; '.join(details)} metadata.")
+
+
+MISSING_DATA_LOG = MissingDataLog()
+
+
+class ProcessorCache():
+    """Keeps the processors for the most recently processed recordings, so that the
+    `$performers()` script function can reuse their parsed relations and results.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._processors = OrderedDict()
+
+    def add(self, recording_id: str, processor: CombinePerformerTags) -> None:
+        """Add the processor for a recording, replacing any existing processor for the recording.
+
+        Args:
+            recording_id (str): MusicBrainz id of the recording.
+            processor (CombinePerformerTags): Processor for the recording's relations.
+        """
+        self._processors[recording_id] = processor
+        self._processors.move_to_end(recording_id)
+        while len(self._processors) > self.size:
+            self._processors.popitem(last=False)
+
+    def get(self, recording_id: str) -> CombinePerformerTags:
+        """Get the processor for a recording.
+
+        Args:
+            recording_id (str): MusicBrainz id of the recording.
+
+        Returns:
+            CombinePerformerTags: Processor for the recording, or None if it is not available.
+        """
+        processor = self._processors.get(recording_id)
+        if processor is not None:
+            self._processors.move_to_end(recording_id)
+        return processor
+
+    def clear_results(self) -> None:
+        """Clear the results memoized for the script function, after the settings have changed.
+        """
+        compile_overrides.cache_clear()
+        for processor in self._processors.values():
+            processor.results.clear()
+
+
+PROCESSOR_CACHE = ProcessorCache(PROCESSOR_CACHE_SIZE)
+
+
+class AlbumCommonPerformers():
+    """Finds the performance records common to all of the tracks on an album while it is loading,
+    so that the `_performers_track_only` variable can list the performers specific to each track.
+
+    Each distinct record on the album is given a compact integer id, and the common set is kept
+    as the running intersection of the ids on each track processed.  Once the album has loaded,
+    the variable is set for each track from its kept records without parsing the relations again.
+    """
+
+    def __init__(self) -> None:
+        self._albums = {}
+
+    def add_track(self, api: PluginApi, track, processor: CombinePerformerTags) -> None:
+        """Add the performance records for a track on an album that is still loading.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            track (Track): The processed track.
+            processor (CombinePerformerTags): Processor holding the track's performance records.
+        """
+        album = getattr(track, 'album', None)
+        if album is None or not CHUNKED_ALBUMS.processing(album):
+            return
+
+        key = id(album)
+        if key not in self._albums:
+            self._albums[key] = {'album': album, 'ids': {}, 'common': None, 'tracks': []}
+            CHUNKED_ALBUMS.run_when_processed(album, lambda: self.finalize(api, key), run_on_error=True)
+        state = self._albums[key]
+        ids = state['ids']
+        # The order of the attributes is not significant when matching the records
+        record_ids = [ids.setdefault((record[:-1], frozenset(record.attributes)), len(ids)) for record in processor.records]
+        track_ids = set(record_ids)
+        state['common'] = track_ids if state['common'] is None else state['common'] & track_ids
+        state['tracks'].append((track, processor, record_ids))
+
+    def discard(self, album) -> None:
+        """Drop the records collected for an album that was removed before it finished loading.
+
+        Args:
+            album (Album): The removed album.
+        """
+        self._albums.pop(id(album), None)
+
+    def finalize(self, api: PluginApi, key: int) -> None:
+        """Set the `_performers_track_only` variable for each of the tracks on an album that
+        has finished loading.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            key (int): Key of the album in the collected records.
+        """
+        state = self._albums.pop(key, None)
+        if state is None:
+            return
+        # Tracks from a load that failed are not part of the album
+        loaded = set(state['album'].tracks)
+        tracks = [x for x in state['tracks'] if x[0] in loaded]
+        # Nothing is common to the album when there is only a single track to compare
+        common = state['common'] if len(tracks) > 1 else set()
+        for track, processor, record_ids in tracks:
+            records = [record for record, record_id in zip(processor.records, record_ids) if record_id not in common]
+            processor.track_only = CombinePerformerTags.from_records(records, processor.settings, api)
+            set_track_variable(api, track, TRACK_ONLY_VARIABLE, processor.track_only.get_performers())
+
+
+ALBUM_COMMON_PERFORMERS = AlbumCommonPerformers()
+
+
+@lru_cache(maxsize=256)
+def compile_overrides(api: PluginApi, overrides: tuple) -> PluginOptions:
+    """Get the options for a set of `$performers()` option overrides, applied to the current settings.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        overrides (tuple): Overrides in the form "name=value".
+
+    Returns:
+        PluginOptions: Options to use, or None if any of the overrides are not valid.
+    """
+    options = PluginOptions(api)
+    options.load_from_config()
+    for override in overrides:
+        name, _sep, value = override.partition('=')
+        attributes, values = SCRIPT_OVERRIDES.get(name.strip(), ((), {}))
+        value = values.get(value.strip().lower())
+        if value is None:
+            return None
+        for attribute in attributes:
+            setattr(options, attribute, value)
+    return options
+
+
+def check_settings(api: PluginApi, settings: dict) -> str:
+    """Check settings keyed by the Picard configuration keys, such as those sent to the service,
+    against the registered options.  Each value must have the type of the registered option, and
+    an option set with a group of radio buttons must have the value of one of the buttons.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        settings (dict): Settings to check.
+
+    Returns:
+        str: Description of the first setting that is not valid, or an empty string if all are valid.
+    """
+    keys = PluginOptions()  # Get unintialized list to provide Picard option settings keys
+    fields = {getattr(keys, attribute): (field_type, widgets) for attribute, field_type, widgets in CombinePerformerTagsOptionsPage.FIELDS}
+    for key, value in settings.items():
+        if key not in fields:
+            return f"Unknown setting '{key}'."
+        expected = type(api.plugin_config[key])
+        if type(value) is not expected:  # pylint: disable=unidiomatic-typecheck
+            return f"The '{key}' setting must be of type {expected.__name__}."
+        field_type, widgets = fields[key]
+        if field_type == FIELD_BUTTON_GROUP and value not in widgets:
+            return f"The '{key}' setting must be one of {', '.join(str(x) for x in sorted(widgets))}."
+    return ''
+
+
+def find_processor(api: PluginApi, parser, function: str) -> CombinePerformerTags:
+    """Find the processor for the track a script is run for.  The processor kept for a loaded track
+    is used if the script is run for one of its files, such as when naming the file at save time,
+    and the processors for the recently processed recordings are used otherwise.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        parser (ScriptParser): Parser running the script.
+        function (str): Name of the script function, for the log message.
+
+    Returns:
+        CombinePerformerTags: Processor for the track, or None if it is not available.
+    """
+    track = getattr(getattr(parser, 'file', None), 'parent_item', None)
+    processor = LOADED_TRACKS.get(track) if track is not None else None
+    if processor is None:
+        recording_id = parser.context['musicbrainz_recordingid']
+        processor = PROCESSOR_CACHE.get(recording_id)
+        if processor is None:
+            MISSING_DATA_LOG.warn_once(
+                api, f"{function}:{recording_id}",
+                f"${function}() returned an empty value because the performers for recording '{recording_id}' are no longer available."
+            )
+    return processor
+
+
+def script_performers(api: PluginApi, parser, *overrides) -> str:
+    """Script function returning the combined performers for the track, with the option overrides applied.
+    """
+    processor = find_processor(api, parser, 'performers')
+    if processor is None:
+        return ''
+    overrides = tuple(x for x in overrides if x.strip())
+    if overrides not in processor.results:
+        options = compile_overrides(processor.settings.api, overrides)
+        processor.results[overrides] = processor.get_performers(options) if options else []
+    return MULTI_VALUED_JOINER.join(processor.results[overrides])
+
+
+def script_performers_trace(api: PluginApi, parser) -> str:
+    """Script function returning the decision trace for the track, one decision per line.
+    """
+    processor = find_processor(api, parser, 'performers_trace')
+    if processor is None or processor.trace is None:
+        return ''
+    return '\n'.join(processor.trace)
+
+
+def album_removed(_api: PluginApi, album) -> None:
+    """Called after an album has been removed.
+    """
+    MISSING_DATA_LOG.discard(album)
+    MEMORY_PROFILER.discard(album)
+    PERFORMER_INDEX.discard(album)
+    ALBUM_COMMON_PERFORMERS.discard(album)
+    ALBUM_CREDITS.discard(album)
+
+
+def process_track(api: PluginApi, track, album_metadata, track_metadata, release_metadata) -> None:
+    """Track metadata processor, profiling the memory used when the memory profiling mode is enabled.
     """
+    if api.plugin_config[MEMORY_PROFILING_KEY]:
+        album_id = release_metadata['id'] if release_metadata else 'No Album ID'
+        MEMORY_PROFILER.profile(
+            api, getattr(track, 'album', None), album_id,
+            combine_performer_tags, api, track, album_metadata, track_metadata, release_metadata
+        )
+    else:
+        combine_performer_tags(api, track, album_metadata, track_metadata, release_metadata)
 
-    def metadata_error(album_id: str, metadata_element: str, track_number: str) -> None:
-        api.logger.error(f"{album_id}: Missing '{metadata_element}' in track {track_number} metadata.")
+
+def combine_performer_tags(api: PluginApi, track, album_metadata, track_metadata, release_metadata) -> None:
+    """Combines performer information into a multi-value variable for use in scripting.
+    """
 
     if not api.global_config.setting['track_ars']:
-        api.logger.error("Use track relationships is not enabled in Options -> Metadata.")
+        MISSING_DATA_LOG.warn_once(
+            api, 'track_ars',
+            "Use track relationships is not enabled in Options -> Metadata, so the existing performer tags are used."
+        )
+        combine_existing_tags(api, track, album_metadata, album_metadata)
         return
 
+    album = getattr(track, 'album', None)
     album_id = release_metadata['id'] if release_metadata else 'No Album ID'
     track_number = track_metadata['number'] if track_metadata and 'number' in track_metadata else 'No Track Number'
 
     if 'recording' not in track_metadata:
-        metadata_error(album_id, 'recording', track_number)
+        MISSING_DATA_LOG.add(api, album, album_id, 'recording', track_number)
         return
 
     if 'relations' not in track_metadata['recording']:
-        metadata_error(album_id, 'recording->relations', track_number)
+        MISSING_DATA_LOG.add(api, album, album_id, 'recording->relations', track_number)
+        return
+
+    relations = track_metadata['recording']['relations']
+    recording_id = track_metadata['recording'].get('id', '')
+    processor = CombinePerformerTags(relations, api=api)
+    if api.plugin_config[DECISION_TRACE_KEY]:
+        processor.enable_trace(TRACE_SIZE)
+    profiles = [(DEFAULT_VARIABLE, None)] + load_profiles(api)
+
+    # Process very large recordings from the event loop while the album is still loading
+    threshold = api.plugin_config[CHUNK_THRESHOLD_KEY]
+    if threshold and len(relations) > threshold and album is not None and not album.loaded:
+        if recording_id:
+            PROCESSOR_CACHE.add(recording_id, processor)
+        process_in_chunks(
+            api, track, album_metadata, processor, profiles,
+            lambda: track_processed(api, track, recording_id, processor)
+        )
+        return
+
+    budget = api.plugin_config[TIME_BUDGET_KEY]
+    if budget:
+        processor.set_budget(budget / 1000)
+
+    # The budget only applies to processing the track, so it is removed before the processor is
+    # kept for the `$performers()` script function and for re-applying the settings
+    try:
+        set_variables(album_metadata, profiles, [processor.get_performers(options) for _variable, options in profiles])
+
+        if processor.degraded:
+            album_metadata['~' + TRUNCATED_VARIABLE] = '1'
+            api.logger.warning(
+                f"{album_id}: Processing {len(relations)} relations in track {track_number} exceeded "
+                f"the time budget of {budget} ms, so the remaining {processor.describe_degradation()} were left out."
+            )
+
+        track_processed(api, track, recording_id, processor)
+    finally:
+        processor.clear_budget()
+    if recording_id:
+        PROCESSOR_CACHE.add(recording_id, processor)
+
+
+def combine_existing_tags(api: PluginApi, track, source_metadata, metadata) -> bool:
+    """Combine the existing `performer:<role>` tags into the variables, for use when the track
+    relationships are not retrieved from MusicBrainz.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        track (Track): The track being processed.
+        source_metadata (Metadata): Track or file metadata containing the performer tags.
+        metadata (Metadata): Track metadata to update, or None to update the loaded track and
+            its linked files.
+
+    Returns:
+        bool: True if the metadata contained performer tags.
+    """
+    records = parse_performer_tags(source_metadata)
+    if not records:
+        return False
+
+    processor = CombinePerformerTags.from_records(records, api=api)
+    if api.plugin_config[DECISION_TRACE_KEY]:
+        processor.enable_trace(TRACE_SIZE)
+    profiles = [(DEFAULT_VARIABLE, None)] + load_profiles(api)
+    results = [processor.get_performers(options) for _variable, options in profiles]
+    if metadata is None:
+        reapply_to_track(api, track, profiles, results)
+        recording_id = track.orig_metadata['musicbrainz_recordingid']
+    else:
+        set_variables(metadata, profiles, results)
+        recording_id = metadata['musicbrainz_recordingid']
+    if recording_id:
+        PROCESSOR_CACHE.add(recording_id, processor)
+    track_processed(api, track, recording_id, processor)
+    return True
+
+
+def track_processed(api: PluginApi, track, recording_id: str, processor: CombinePerformerTags) -> None:
+    """Keep the performance records for a processed track so that changed settings can be re-applied
+    and the performers common to the album can be found, log the decision trace and add the performers
+    to the co-performance graph, the performer index and the album credits, if enabled.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        track (Track): The processed track.
+        recording_id (str): MusicBrainz id of the recording.
+        processor (CombinePerformerTags): Processor for the recording's relations.
+    """
+    if processor.trace is not None:
+        api.logger.debug(f"Decision trace for recording {recording_id}:\n" + '\n'.join(processor.trace))
+    if api.plugin_config[CREDITS_FILE_KEY]:
+        add_album_credits(api, track)
+
+    # Records cut short by the time budget are not kept, so they are never re-applied in place of the full
+    # records, and are not compared with the other tracks on the album.  They are also left out of the
+    # co-performance graph, which only counts each recording once, and the performer index.
+    if processor.degraded:
+        return
+    path = api.plugin_config[COPERFORMANCE_FILE_KEY]
+    if path:
+        COPERFORMANCE_GRAPH.add_recording(api, path, recording_id, processor.records)
+    PERFORMER_INDEX.add_recording(api, getattr(track, 'album', None), recording_id, processor.records)
+    if track is not None:
+        processor.release_source()
+        LOADED_TRACKS[track] = processor
+        ALBUM_COMMON_PERFORMERS.add_track(api, track, processor)
+
+
+def add_album_credits(api: PluginApi, track) -> None:
+    """Add the combined performers already set for a processed track to the album credits.  The
+    credits file is written once the album has finished loading.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        track (Track): The processed track.
+    """
+    album = getattr(track, 'album', None)
+    if album is None:
+        return
+    if not ALBUM_CREDITS.tracked(album) and CHUNKED_ALBUMS.processing(album):
+        CHUNKED_ALBUMS.run_when_processed(album, lambda: ALBUM_CREDITS.write(api, album, api.plugin_config[CREDITS_FILE_KEY]))
+    ALBUM_CREDITS.add_track(album, track, track.metadata.getall('~' + DEFAULT_VARIABLE))
+
+
+def file_saved(api: PluginApi, file) -> None:
+    """Called after a file has been saved.  The album credits file is written again once all of
+    the album's files have been saved.
+    """
+    filename = api.plugin_config[CREDITS_FILE_KEY]
+    album = getattr(file.parent_item, 'album', None)
+    if not filename or album is None or not ALBUM_CREDITS.tracked(album):
+        return
+    if any(x.state == File.State.PENDING for x in album.iterfiles(save=True)):
+        return
+    ALBUM_CREDITS.write(api, album, filename)
+
+
+def set_variables(metadata, profiles: list, results: list) -> None:
+    """Set the variables for each of the output profiles, and the digest of the main variable.
+
+    Args:
+        metadata (Metadata): Track metadata to update.
+        profiles (list): Tuples of (variable name, PluginOptions) for each output profile.
+        results (list): Performance items for each of the output profiles.
+    """
+    for (variable, _options), performers in zip(profiles, results):
+        metadata['~' + variable] = performers
+    metadata['~' + DIGEST_VARIABLE] = performers_digest(results[0])
+
+
+def performers_digest(items: list) -> str:
+    """Get a stable digest of a list of performance items.
+
+    Args:
+        items (list): Performance items.
+
+    Returns:
+        str: Hexadecimal digest of the items.
+    """
+    return hashlib.sha1('\n'.join(items).encode('utf-8')).hexdigest()
+
+
+def file_added(api: PluginApi, track, file) -> None:
+    """Called after a file has been added to a track.  When the track relationships are not
+    retrieved, the variables are combined from the performer tags in the file.  Picard has already
+    run the tagger scripts for the file by this time, so they are run again once the
+    `_performers_changed` variable has been set.
+    """
+    if not api.global_config.setting['track_ars']:
+        combine_existing_tags(api, track, file.orig_metadata, None)
+    if api.plugin_config[COMPARE_TAG_KEY]:
+        update_file(api, track, file)
+        track.update()
+
+
+def compare_existing_tag(api: PluginApi, track, file) -> None:
+    """Set the `_performers_changed` variable for a file linked to a track, by comparing the
+    track's `_performers` variable with the existing tag in the file.
+    """
+    tag = api.plugin_config[COMPARE_TAG_KEY]
+    digest = track.metadata['~' + DIGEST_VARIABLE]
+    if not tag or not digest:
         return
+    changed = performers_digest(file.orig_metadata.getall(tag)) != digest
+    file.metadata['~' + CHANGED_VARIABLE] = '1' if changed else ''
+
+
+def update_file(api: PluginApi, track, file) -> None:
+    """Run the tagger scripts again for a file linked to a track, with the `_performers_changed`
+    variable set from the track's current variables.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        track (Track): Track the file is linked to.
+        file (File): File to update.
+    """
+    compare_existing_tag(api, track, file)
+    track.update_file_metadata(file)
+    # The file metadata is rebuilt from the track metadata when the existing tags are cleared
+    compare_existing_tag(api, track, file)
+
+
+def update_linked_files(api: PluginApi, track) -> None:
+    """Run the tagger scripts again for the files linked to a track after its variables have
+    changed, as when a file is added to the track.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        track (Track): Track to update.
+    """
+    for file in list(track.files):
+        update_file(api, track, file)
+    track.update()
+
+
+def process_in_chunks(api: PluginApi, track, metadata, processor: CombinePerformerTags, profiles: list, finished=None) -> None:
+    """Process a large recording in chunks from the Qt event loop.  Picard only finalizes an album
+    once the requests for the release have finished, and not when a plugin task completes, so the
+    chunks are processed in a non-blocking album task.  If the album has been finalized by the time
+    the variables are ready, they are set for the loaded track and the track's scripts are run again.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        track (Track): Track being processed, on an album that is still loading.
+        metadata (Metadata): Track metadata to update.
+        processor (CombinePerformerTags): Processor for the track's relations.
+        profiles (list): Tuples of (variable name, PluginOptions) for each output profile.
+        finished (callable, optional): Called once the variables have been set.
+    """
+    album = track.album
+    task_id = f"chunked_{id(metadata)}"
+    api.add_album_task(album, task_id, f"Combining {len(processor.source)} performer relations")
+    CHUNKED_ALBUMS.start(album)
+
+    def _finished(results: list) -> None:
+        if album.loaded:
+            set_loaded_track_variables(api, track, profiles, results)
+        else:
+            set_variables(metadata, profiles, results)
+        if finished is not None:
+            finished()
+        api.complete_album_task(album, task_id)
+        CHUNKED_ALBUMS.finish(album)
+
+    ChunkedRunner(processor.iter_chunks([x[1] for x in profiles], CHUNK_SIZE), _finished).start()
+
+
+# Processors for the loaded tracks, holding their parsed performance records
+LOADED_TRACKS = weakref.WeakKeyDictionary()
+
+
+def reapply_settings(api: PluginApi) -> None:
+    """Recompute the variables for all of the loaded tracks from their kept performance records, using
+    the current settings.  The tracks are processed from the Qt event loop, and only the tracks whose
+    variables change are updated.
+
+    Args:
+        api (PluginApi): The plugin's api.
+    """
+    settings = PluginOptions(api)
+    settings.load_from_config()
+    profiles = [(DEFAULT_VARIABLE, settings)] + load_profiles(api)
 
-    processor = CombinePerformerTags(track_metadata['recording']['relations'], api=api)
-    album_metadata['~performers'] = processor.get_performers()
+    def _finished(counts: tuple) -> None:
+        changed, processed = counts
+        api.logger.info(f"Re-applied the settings to {processed} loaded tracks, {changed} of which were changed.")
+
+    ChunkedRunner(_reapply_steps(api, list(LOADED_TRACKS.items()), profiles), _finished).start()
+
+
+def _reapply_steps(api: PluginApi, tracks: list, profiles: list):
+    changed = 0
+    processed = 0
+    for track, processor in tracks:
+        album = track.album
+        if album is not None and not album.loaded:
+            continue
+        processed += 1
+        track_profiles = profiles
+        results = [processor.get_performers(options) for _variable, options in profiles]
+        if processor.track_only is not None:
+            track_profiles = profiles + [(TRACK_ONLY_VARIABLE, None)]
+            results.append(processor.track_only.get_performers(profiles[0][1]))
+        if reapply_to_track(api, track, track_profiles, results):
+            changed += 1
+        yield
+    return changed, processed
+
+
+def reapply_to_track(api: PluginApi, track, profiles: list, results: list) -> bool:
+    """Update the variables for a loaded track, and the metadata of the files linked to it.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        track (Track): Track to update.
+        profiles (list): Tuples of (variable name, PluginOptions) for each output profile.
+        results (list): Performance items for each of the output profiles.
+
+    Returns:
+        bool: True if any of the variables changed, or False if the track was left unchanged.
+    """
+    if all(track.orig_metadata.getall('~' + variable) == performers for (variable, _options), performers in zip(profiles, results)):
+        return False
+    for metadata in (track.orig_metadata, track.scripted_metadata, track.metadata):
+        set_variables(metadata, profiles, results)
+    ALBUM_CREDITS.update_track(track, results[0])
+    update_linked_files(api, track)
+    return True
+
+
+def set_loaded_track_variables(api: PluginApi, track, profiles: list, results: list) -> None:
+    """Set the variables for a track on an album that was finalized before they were ready, running
+    the tagger scripts for the track again as Picard does when the album has loaded.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        track (Track): Track to update.
+        profiles (list): Tuples of (variable name, PluginOptions) for each output profile.
+        results (list): Performance items for each of the output profiles.
+    """
+    set_variables(track.orig_metadata, profiles, results)
+    metadata = Metadata(track.orig_metadata)
+    track.run_scripts(metadata, strip_whitespace=True)
+    track.metadata.copy(metadata)
+    track.scripted_metadata.copy(metadata)
+    update_linked_files(api, track)
+
+
+def set_track_variable(api: PluginApi, track, variable: str, values: list) -> None:
+    """Set a variable for a loaded track, and update the metadata of the files linked to it.
+
+    Args:
+        api (PluginApi): The plugin's api.
+        track (Track): Track to update.
+        variable (str): Name of the variable, without the leading underscore.
+        values (list): Values of the variable.
+    """
+    for metadata in (track.orig_metadata, track.scripted_metadata, track.metadata):
+        metadata['~' + variable] = values
+    update_linked_files(api, track)
+
+
+class ReapplySettingsAction(BaseAction):
+    """Tools menu action re-applying the current settings to the loaded tracks.
+    """
+
+    TITLE = t_("action.reapply", "Re-apply performer settings to loaded tracks")
+
+    def callback(self, objs) -> None:
+        reapply_settings(self.api)
+
+
+def _numbered_buttons(prefix: str, count: int) -> dict:
+    return {i: f"{prefix}_{i}" for i in range(1, count + 1)}
+
+
+# Types of widgets used for the option settings on the options page
+FIELD_CHECKBOX = 1
+FIELD_BUTTON_GROUP = 2
+FIELD_LINE_EDIT = 3
 
 
 class CombinePerformerTagsOptionsPage(OptionsPage):
@@ -325,6 +1659,43 @@ class CombinePerformerTagsOptionsPage(OptionsPage):
 
     keys = PluginOptions()  # Get unintialized list to provide Picard option settings keys
 
+    # Widgets used for each of the option settings, as (PluginOptions attribute, field type, widgets).
+    # Button groups map the button id (the setting value) to the name of the radio button widget.
+    FIELDS = (
+        ('OPT_CREDITED_ARTIST', FIELD_CHECKBOX, 'cb_credited_artists'),
+        ('OPT_CREDITED_INSTRUMENT', FIELD_CHECKBOX, 'cb_credited_instruments'),
+        ('OPT_CREDITED_VOCAL', FIELD_CHECKBOX, 'cb_credited_vocals'),
+        ('OPT_ARTIST_NAME', FIELD_BUTTON_GROUP, _numbered_buttons('artist_name_rb', 3)),
+        ('OPT_INSTRUMENT_ATTR_ADDITIONAL', FIELD_CHECKBOX, 'cb_additional_instruments'),
+        ('OPT_INSTRUMENT_ATTR_GUEST', FIELD_CHECKBOX, 'cb_guest_instruments'),
+        ('OPT_INSTRUMENT_ATTR_SOLO', FIELD_CHECKBOX, 'cb_solo_instruments'),
+        ('OPT_VOCAL_ATTR_ADDITIONAL', FIELD_CHECKBOX, 'cb_additional_vocals'),
+        ('OPT_VOCAL_ATTR_GUEST', FIELD_CHECKBOX, 'cb_guest_vocals'),
+        ('OPT_VOCAL_ATTR_SOLO', FIELD_CHECKBOX, 'cb_solo_vocals'),
+        ('OPT_VOCAL_ATTR_TYPES', FIELD_CHECKBOX, 'cb_vocal_types'),
+        ('OPT_TAG_GROUP_BY_ARTIST', FIELD_BUTTON_GROUP, {0: 'rb_group_instrument', 1: 'rb_group_artist'}),
+        ('OPT_INSTRUMENT_GROUPING_LEVEL', FIELD_BUTTON_GROUP, _numbered_buttons('level_rb', 3)),
+        ('OPT_SORT_ORDER', FIELD_BUTTON_GROUP, _numbered_buttons('sort_rb', 5)),
+        ('OPT_NORMALIZE_KEYS', FIELD_CHECKBOX, 'cb_normalize_keys'),
+        ('OPT_OTHER_PERFORMERS', FIELD_CHECKBOX, 'cb_other_performers'),
+        ('OPT_FORMAT_GROUP_ADDITIONAL', FIELD_BUTTON_GROUP, _numbered_buttons('additional_rb', 4)),
+        ('OPT_FORMAT_GROUP_GUEST', FIELD_BUTTON_GROUP, _numbered_buttons('guest_rb', 4)),
+        ('OPT_FORMAT_GROUP_SOLO', FIELD_BUTTON_GROUP, _numbered_buttons('solo_rb', 4)),
+        ('OPT_FORMAT_GROUP_VOCALS', FIELD_BUTTON_GROUP, _numbered_buttons('vocals_rb', 4)),
+        ('OPT_FORMAT_GROUP_1_START', FIELD_LINE_EDIT, 'format_group_1_start_char'),
+        ('OPT_FORMAT_GROUP_1_END', FIELD_LINE_EDIT, 'format_group_1_end_char'),
+        ('OPT_FORMAT_GROUP_1_SEP', FIELD_LINE_EDIT, 'format_group_1_sep_char'),
+        ('OPT_FORMAT_GROUP_2_START', FIELD_LINE_EDIT, 'format_group_2_start_char'),
+        ('OPT_FORMAT_GROUP_2_END', FIELD_LINE_EDIT, 'format_group_2_end_char'),
+        ('OPT_FORMAT_GROUP_2_SEP', FIELD_LINE_EDIT, 'format_group_2_sep_char'),
+        ('OPT_FORMAT_GROUP_3_START', FIELD_LINE_EDIT, 'format_group_3_start_char'),
+        ('OPT_FORMAT_GROUP_3_END', FIELD_LINE_EDIT, 'format_group_3_end_char'),
+        ('OPT_FORMAT_GROUP_3_SEP', FIELD_LINE_EDIT, 'format_group_3_sep_char'),
+        ('OPT_FORMAT_GROUP_4_START', FIELD_LINE_EDIT, 'format_group_4_start_char'),
+        ('OPT_FORMAT_GROUP_4_END', FIELD_LINE_EDIT, 'format_group_4_end_char'),
+        ('OPT_FORMAT_GROUP_4_SEP', FIELD_LINE_EDIT, 'format_group_4_sep_char'),
+    )
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.ui = Ui_CombinePerformerTagsOptionsPage()
@@ -336,231 +1707,210 @@ class CombinePerformerTagsOptionsPage(OptionsPage):
 
         self.processor = CombinePerformerTags(ExampleMetadata.RELS, api=self.api)
 
-        self.ui.cb_credited_artists.clicked.connect(self._update_settings_and_examples)
-        self.ui.cb_credited_instruments.clicked.connect(self._update_settings_and_examples)
-        self.ui.cb_credited_vocals.clicked.connect(self._update_settings_and_examples)
-
-        self.ui.cb_additional_instruments.clicked.connect(self._update_settings_and_examples)
-        self.ui.cb_guest_instruments.clicked.connect(self._update_settings_and_examples)
-        self.ui.cb_solo_instruments.clicked.connect(self._update_settings_and_examples)
-
-        self.ui.cb_additional_vocals.clicked.connect(self._update_settings_and_examples)
-        self.ui.cb_guest_vocals.clicked.connect(self._update_settings_and_examples)
-        self.ui.cb_solo_vocals.clicked.connect(self._update_settings_and_examples)
-
-        self.ui.cb_vocal_types.clicked.connect(self._update_settings_and_examples)
-
-        self.ui.rb_group_artist.clicked.connect(self._update_settings_and_examples)
-        self.ui.rb_group_instrument.clicked.connect(self._update_settings_and_examples)
-
-        self.ui.additional_rb_1.clicked.connect(self._update_settings_and_examples)
-        self.ui.additional_rb_2.clicked.connect(self._update_settings_and_examples)
-        self.ui.additional_rb_3.clicked.connect(self._update_settings_and_examples)
-        self.ui.additional_rb_4.clicked.connect(self._update_settings_and_examples)
-
-        self.ui.guest_rb_1.clicked.connect(self._update_settings_and_examples)
-        self.ui.guest_rb_2.clicked.connect(self._update_settings_and_examples)
-        self.ui.guest_rb_3.clicked.connect(self._update_settings_and_examples)
-        self.ui.guest_rb_4.clicked.connect(self._update_settings_and_examples)
-
-        self.ui.solo_rb_1.clicked.connect(self._update_settings_and_examples)
-        self.ui.solo_rb_2.clicked.connect(self._update_settings_and_examples)
-        self.ui.solo_rb_3.clicked.connect(self._update_settings_and_examples)
-        self.ui.solo_rb_4.clicked.connect(self._update_settings_and_examples)
-
-        self.ui.vocals_rb_1.clicked.connect(self._update_settings_and_examples)
-        self.ui.vocals_rb_2.clicked.connect(self._update_settings_and_examples)
-        self.ui.vocals_rb_3.clicked.connect(self._update_settings_and_examples)
-        self.ui.vocals_rb_4.clicked.connect(self._update_settings_and_examples)
-
-        self.ui.format_group_1_start_char.editingFinished.connect(self._update_settings_and_examples)
-        self.ui.format_group_2_start_char.editingFinished.connect(self._update_settings_and_examples)
-        self.ui.format_group_3_start_char.editingFinished.connect(self._update_settings_and_examples)
-        self.ui.format_group_4_start_char.editingFinished.connect(self._update_settings_and_examples)
-
-        self.ui.format_group_1_sep_char.editingFinished.connect(self._update_settings_and_examples)
-        self.ui.format_group_2_sep_char.editingFinished.connect(self._update_settings_and_examples)
-        self.ui.format_group_3_sep_char.editingFinished.connect(self._update_settings_and_examples)
-        self.ui.format_group_4_sep_char.editingFinished.connect(self._update_settings_and_examples)
-
-        self.ui.format_group_1_end_char.editingFinished.connect(self._update_settings_and_examples)
-        self.ui.format_group_2_end_char.editingFinished.connect(self._update_settings_and_examples)
-        self.ui.format_group_3_end_char.editingFinished.connect(self._update_settings_and_examples)
-        self.ui.format_group_4_end_char.editingFinished.connect(self._update_settings_and_examples)
-
-    def _log_widget_error(self, error: Exception, widget: str) -> None:
-        self.api.logger.error(f"{error}: Unable to find widget '{widget}'.")
+        # Working copy of the main settings and additional output profiles
+        self.profiles = []
+        self.current_profile = 0
+
+        self.ui.profile_selector.currentIndexChanged.connect(self._select_profile)
+        self.ui.profile_add.clicked.connect(self._add_profile)
+        self.ui.profile_remove.clicked.connect(self._remove_profile)
+
+        # Build the widget registry and connect the signals for each of the option settings
+        self.checkboxes = {}
+        self.button_groups = {}
+        self.line_edits = {}
+        for attribute, field_type, widgets in self.FIELDS:
+            if field_type == FIELD_CHECKBOX:
+                widget = getattr(self.ui, widgets)
+                self.checkboxes[attribute] = widget
+                widget.clicked.connect(lambda checked, a=attribute: self._field_changed(a, checked))
+            elif field_type == FIELD_BUTTON_GROUP:
+                group = QtWidgets.QButtonGroup(self)
+                for button_id, name in widgets.items():
+                    group.addButton(getattr(self.ui, name), button_id)
+                self.button_groups[attribute] = group
+                group.idClicked.connect(lambda button_id, a=attribute: self._field_changed(a, button_id))
+            else:
+                widget = getattr(self.ui, widgets)
+                self.line_edits[attribute] = widget
+                widget.editingFinished.connect(lambda a=attribute, w=widget: self._field_changed(a, w.text()))
+
+        # Values as loaded from the config, used to only write the settings that have changed
+        self._loaded = {}
 
     def load(self) -> None:
         """Load the option settings.
         """
-        self.ui.cb_credited_artists.setChecked(self.api.plugin_config[self.keys.OPT_CREDITED_ARTIST])
-        self.ui.cb_credited_instruments.setChecked(self.api.plugin_config[self.keys.OPT_CREDITED_INSTRUMENT])
-        self.ui.cb_credited_vocals.setChecked(self.api.plugin_config[self.keys.OPT_CREDITED_VOCAL])
-        self.ui.cb_additional_instruments.setChecked(self.api.plugin_config[self.keys.OPT_INSTRUMENT_ATTR_ADDITIONAL])
-        self.ui.cb_guest_instruments.setChecked(self.api.plugin_config[self.keys.OPT_INSTRUMENT_ATTR_GUEST])
-        self.ui.cb_solo_instruments.setChecked(self.api.plugin_config[self.keys.OPT_INSTRUMENT_ATTR_SOLO])
-        self.ui.cb_additional_vocals.setChecked(self.api.plugin_config[self.keys.OPT_VOCAL_ATTR_ADDITIONAL])
-        self.ui.cb_guest_vocals.setChecked(self.api.plugin_config[self.keys.OPT_VOCAL_ATTR_GUEST])
-        self.ui.cb_solo_vocals.setChecked(self.api.plugin_config[self.keys.OPT_VOCAL_ATTR_SOLO])
-        self.ui.cb_vocal_types.setChecked(self.api.plugin_config[self.keys.OPT_VOCAL_ATTR_TYPES])
-
-        if self.api.plugin_config[self.keys.OPT_TAG_GROUP_BY_ARTIST]:
-            self.ui.rb_group_artist.setChecked(True)
-        else:
-            self.ui.rb_group_instrument.setChecked(True)
-
-        def _set_rb(radio_button: str, number: int) -> None:
-            """Set the appropriate radio button as selected.
-
-            Args:
-                radio_button (str): Prefix of radio button widget.
-                number (int): Button number to set as selected.
-            """
-            try:
-                widget = f"{radio_button}_{number}"
-                self.ui.scrollArea.findChild(QtWidgets.QRadioButton, widget).setChecked(True)
-            except (KeyError, AttributeError) as e:
-                self._log_widget_error(e, widget)
-
-        # Settings for keywords
-        _set_rb('additional_rb', self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_ADDITIONAL])
-        _set_rb('guest_rb', self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_GUEST])
-        _set_rb('solo_rb', self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_SOLO])
-        _set_rb('vocals_rb', self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_VOCALS])
-
-        # Settings for word group 1
-        self.ui.format_group_1_start_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_1_START])
-        self.ui.format_group_1_end_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_1_END])
-        self.ui.format_group_1_sep_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_1_SEP])
-
-        # Settings for word group 2
-        self.ui.format_group_2_start_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_2_START])
-        self.ui.format_group_2_end_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_2_END])
-        self.ui.format_group_2_sep_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_2_SEP])
-
-        # Settings for word group 3
-        self.ui.format_group_3_start_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_3_START])
-        self.ui.format_group_3_end_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_3_END])
-        self.ui.format_group_3_sep_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_3_SEP])
-
-        # Settings for word group 4
-        self.ui.format_group_4_start_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_4_START])
-        self.ui.format_group_4_end_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_4_END])
-        self.ui.format_group_4_sep_char.setText(self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_4_SEP])
-
+        self.settings.load_from_config()
+        self.profiles = [{'variable': DEFAULT_VARIABLE, 'settings': self.settings.to_dict()}]
+        for profile in self.api.plugin_config[PROFILES_KEY]:
+            self.profiles.append({'variable': profile['variable'], 'settings': dict(profile['settings'])})
+        self.current_profile = 0
+        self._update_profile_selector()
+
+        self.ui.chunk_threshold.setValue(self.api.plugin_config[CHUNK_THRESHOLD_KEY])
+        self.ui.time_budget.setValue(self.api.plugin_config[TIME_BUDGET_KEY])
+        self.ui.cb_memory_profiling.setChecked(self.api.plugin_config[MEMORY_PROFILING_KEY])
+        self.ui.cb_decision_trace.setChecked(self.api.plugin_config[DECISION_TRACE_KEY])
+        self.ui.compare_tag.setText(self.api.plugin_config[COMPARE_TAG_KEY])
+        self.ui.coperformance_file.setText(self.api.plugin_config[COPERFORMANCE_FILE_KEY])
+        self.ui.index_file.setText(self.api.plugin_config[INDEX_FILE_KEY])
+        self.ui.credits_file.setText(self.api.plugin_config[CREDITS_FILE_KEY])
+
+        self._loaded = dict(self.profiles[0]['settings'])
+        self._loaded[PROFILES_KEY] = self.profiles[1:]
+        self._loaded[CHUNK_THRESHOLD_KEY] = self.ui.chunk_threshold.value()
+        self._loaded[TIME_BUDGET_KEY] = self.ui.time_budget.value()
+        self._loaded[MEMORY_PROFILING_KEY] = self.ui.cb_memory_profiling.isChecked()
+        self._loaded[DECISION_TRACE_KEY] = self.ui.cb_decision_trace.isChecked()
+        self._loaded[COMPARE_TAG_KEY] = self.ui.compare_tag.text().strip()
+        self._loaded[COPERFORMANCE_FILE_KEY] = self.ui.coperformance_file.text().strip()
+        self._loaded[INDEX_FILE_KEY] = self.ui.index_file.text().strip()
+        self._loaded[CREDITS_FILE_KEY] = self.ui.credits_file.text().strip()
+
+        self._load_widgets(self.settings)
         self.update_examples()
 
-    def _get_rb(self, radio_button: str, max_number: int) -> int:
-        """Gets the number of the radio button set as selected.
+    def _load_widgets(self, settings: PluginOptions) -> None:
+        """Set the widgets from the option settings.
 
         Args:
-            radio_button (str): Prefix of radio button widgets to check.
-            max_number (int): Maximum number of radio button widgets to check.
-
-        Returns:
-            int: Number of the radio button marked as selected.  Defaults to 1.
+            settings (PluginOptions): Settings to display.
         """
-        for i in range(1, max_number + 1):
-            try:
-                widget = f"{radio_button}_{i}"
-                if self.ui.scrollArea.findChild(QtWidgets.QRadioButton, widget).isChecked():
-                    return i
-            except (KeyError, AttributeError) as e:
-                self._log_widget_error(e, widget)
-        return 1
+        for attribute, widget in self.checkboxes.items():
+            widget.setChecked(getattr(settings, attribute))
+        for attribute, group in self.button_groups.items():
+            button = group.button(int(getattr(settings, attribute)))
+            if button is None:
+                self.api.logger.error(f"Unable to find radio button {int(getattr(settings, attribute))} for '{attribute}'.")
+                continue
+            button.setChecked(True)
+        for attribute, widget in self.line_edits.items():
+            widget.setText(getattr(settings, attribute))
 
     def save(self) -> None:
-        """Save the option settings.
-        """
-        self.api.plugin_config[self.keys.OPT_CREDITED_ARTIST] = self.ui.cb_credited_artists.isChecked()
-        self.api.plugin_config[self.keys.OPT_CREDITED_INSTRUMENT] = self.ui.cb_credited_instruments.isChecked()
-        self.api.plugin_config[self.keys.OPT_CREDITED_VOCAL] = self.ui.cb_credited_vocals.isChecked()
-        self.api.plugin_config[self.keys.OPT_INSTRUMENT_ATTR_ADDITIONAL] = self.ui.cb_additional_instruments.isChecked()
-        self.api.plugin_config[self.keys.OPT_INSTRUMENT_ATTR_GUEST] = self.ui.cb_guest_instruments.isChecked()
-        self.api.plugin_config[self.keys.OPT_INSTRUMENT_ATTR_SOLO] = self.ui.cb_solo_instruments.isChecked()
-        self.api.plugin_config[self.keys.OPT_VOCAL_ATTR_ADDITIONAL] = self.ui.cb_additional_vocals.isChecked()
-        self.api.plugin_config[self.keys.OPT_VOCAL_ATTR_GUEST] = self.ui.cb_guest_vocals.isChecked()
-        self.api.plugin_config[self.keys.OPT_VOCAL_ATTR_SOLO] = self.ui.cb_solo_vocals.isChecked()
-        self.api.plugin_config[self.keys.OPT_VOCAL_ATTR_TYPES] = self.ui.cb_vocal_types.isChecked()
-        self.api.plugin_config[self.keys.OPT_TAG_GROUP_BY_ARTIST] = self.ui.rb_group_artist.isChecked()
-
-        # Settings for word group 1
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_1_START] = self.ui.format_group_1_start_char.text()
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_1_END] = self.ui.format_group_1_end_char.text()
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_1_SEP] = self.ui.format_group_1_sep_char.text()
-
-        # Settings for word group 2
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_2_START] = self.ui.format_group_2_start_char.text()
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_2_END] = self.ui.format_group_2_end_char.text()
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_2_SEP] = self.ui.format_group_2_sep_char.text()
-
-        # Settings for word group 3
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_3_START] = self.ui.format_group_3_start_char.text()
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_3_END] = self.ui.format_group_3_end_char.text()
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_3_SEP] = self.ui.format_group_3_sep_char.text()
-
-        # Settings for word group 4
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_4_START] = self.ui.format_group_4_start_char.text()
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_4_END] = self.ui.format_group_4_end_char.text()
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_4_SEP] = self.ui.format_group_4_sep_char.text()
-
-        # Settings for keywords
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_ADDITIONAL] = self._get_rb('additional_rb', 4)
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_GUEST] = self._get_rb('guest_rb', 4)
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_SOLO] = self._get_rb('solo_rb', 4)
-        self.api.plugin_config[self.keys.OPT_FORMAT_GROUP_VOCALS] = self._get_rb('vocals_rb', 4)
+        """Save the option settings.  Only the settings that have changed since they
+        were loaded are written to the configuration.
+        """
+        self._store_current_profile()
+
+        # The first profile holds the main settings used for the `_performers` variable
+        changed = {key: value for key, value in self.profiles[0]['settings'].items() if self._loaded.get(key) != value}
+        if self.profiles[1:] != self._loaded.get(PROFILES_KEY):
+            changed[PROFILES_KEY] = self.profiles[1:]
+        if self.ui.chunk_threshold.value() != self._loaded.get(CHUNK_THRESHOLD_KEY):
+            changed[CHUNK_THRESHOLD_KEY] = self.ui.chunk_threshold.value()
+        if self.ui.time_budget.value() != self._loaded.get(TIME_BUDGET_KEY):
+            changed[TIME_BUDGET_KEY] = self.ui.time_budget.value()
+        if self.ui.cb_memory_profiling.isChecked() != self._loaded.get(MEMORY_PROFILING_KEY):
+            changed[MEMORY_PROFILING_KEY] = self.ui.cb_memory_profiling.isChecked()
+        if self.ui.cb_decision_trace.isChecked() != self._loaded.get(DECISION_TRACE_KEY):
+            changed[DECISION_TRACE_KEY] = self.ui.cb_decision_trace.isChecked()
+        if self.ui.compare_tag.text().strip() != self._loaded.get(COMPARE_TAG_KEY):
+            changed[COMPARE_TAG_KEY] = self.ui.compare_tag.text().strip()
+        if self.ui.coperformance_file.text().strip() != self._loaded.get(COPERFORMANCE_FILE_KEY):
+            changed[COPERFORMANCE_FILE_KEY] = self.ui.coperformance_file.text().strip()
+        if self.ui.index_file.text().strip() != self._loaded.get(INDEX_FILE_KEY):
+            changed[INDEX_FILE_KEY] = self.ui.index_file.text().strip()
+        if self.ui.credits_file.text().strip() != self._loaded.get(CREDITS_FILE_KEY):
+            changed[CREDITS_FILE_KEY] = self.ui.credits_file.text().strip()
+
+        for key, value in changed.items():
+            self.api.plugin_config[key] = value
+        self._loaded.update(changed)
+
+        if changed:
+            PROCESSOR_CACHE.clear_results()
+            for processor in LOADED_TRACKS.values():
+                processor.results.clear()
+        if PROFILES_KEY in changed:
+            register_script_variables(self.api)
+        if INDEX_FILE_KEY in changed:
+            PERFORMER_INDEX.open(self.api, changed[INDEX_FILE_KEY])
+
+    def _store_current_profile(self) -> None:
+        self.save_to_example_settings()
+        self.profiles[self.current_profile]['settings'] = self.settings.to_dict()
+
+    def _update_profile_selector(self) -> None:
+        self.ui.profile_selector.blockSignals(True)
+        self.ui.profile_selector.clear()
+        self.ui.profile_selector.addItems([f"%_{x['variable']}%" for x in self.profiles])
+        self.ui.profile_selector.setCurrentIndex(self.current_profile)
+        self.ui.profile_selector.blockSignals(False)
+        self.ui.profile_remove.setEnabled(self.current_profile > 0)
+
+    def _select_profile(self, index: int) -> None:
+        if index < 0 or index == self.current_profile:
+            return
+        self._store_current_profile()
+        self.current_profile = index
+        self.ui.profile_remove.setEnabled(index > 0)
+        self.settings.load_from_dict(self.profiles[index]['settings'])
+        self._load_widgets(self.settings)
+        self.update_examples()
+
+    def _add_profile(self) -> None:
+        variable, ok = QtWidgets.QInputDialog.getText(
+            self,
+            self.api.tr("ui.profile.add.title", "Add Output Profile"),
+            self.api.tr("ui.profile.add.label", "Name of the variable to produce (without the leading '%_'):"),
+        )
+        variable = variable.strip().lstrip('%_').rstrip('%')
+        if not ok or not variable:
+            return
+        if not re.fullmatch(r'\w+', variable) or variable in [x['variable'] for x in self.profiles]:
+            QtWidgets.QMessageBox.warning(
+                self,
+                self.api.tr("ui.profile.add.title", "Add Output Profile"),
+                self.api.tr("ui.profile.add.invalid", "'{variable}' is not a valid new variable name.", variable=variable),
+            )
+            return
+
+        # Start the new profile from the settings currently displayed
+        self._store_current_profile()
+        self.profiles.append({'variable': variable, 'settings': self.settings.to_dict()})
+        self.current_profile = len(self.profiles) - 1
+        self._update_profile_selector()
+
+    def _remove_profile(self) -> None:
+        if self.current_profile < 1:
+            return
+        del self.profiles[self.current_profile]
+        self.current_profile = 0
+        self._update_profile_selector()
+        self.settings.load_from_dict(self.profiles[0]['settings'])
+        self._load_widgets(self.settings)
+        self.update_examples()
 
     def save_to_example_settings(self) -> None:
         """Save the option settings used for the examples.
         """
-        self.settings.OPT_CREDITED_ARTIST = self.ui.cb_credited_artists.isChecked()
-        self.settings.OPT_CREDITED_INSTRUMENT = self.ui.cb_credited_instruments.isChecked()
-        self.settings.OPT_CREDITED_VOCAL = self.ui.cb_credited_vocals.isChecked()
-        self.settings.OPT_INSTRUMENT_ATTR_ADDITIONAL = self.ui.cb_additional_instruments.isChecked()
-        self.settings.OPT_INSTRUMENT_ATTR_GUEST = self.ui.cb_guest_instruments.isChecked()
-        self.settings.OPT_INSTRUMENT_ATTR_SOLO = self.ui.cb_solo_instruments.isChecked()
-        self.settings.OPT_VOCAL_ATTR_ADDITIONAL = self.ui.cb_additional_vocals.isChecked()
-        self.settings.OPT_VOCAL_ATTR_GUEST = self.ui.cb_guest_vocals.isChecked()
-        self.settings.OPT_VOCAL_ATTR_SOLO = self.ui.cb_solo_vocals.isChecked()
-        self.settings.OPT_VOCAL_ATTR_TYPES = self.ui.cb_vocal_types.isChecked()
-        self.settings.OPT_TAG_GROUP_BY_ARTIST = self.ui.rb_group_artist.isChecked()
-
-        # Settings for word group 1
-        self.settings.OPT_FORMAT_GROUP_1_START = self.ui.format_group_1_start_char.text()
-        self.settings.OPT_FORMAT_GROUP_1_END = self.ui.format_group_1_end_char.text()
-        self.settings.OPT_FORMAT_GROUP_1_SEP = self.ui.format_group_1_sep_char.text()
-
-        # Settings for word group 2
-        self.settings.OPT_FORMAT_GROUP_2_START = self.ui.format_group_2_start_char.text()
-        self.settings.OPT_FORMAT_GROUP_2_END = self.ui.format_group_2_end_char.text()
-        self.settings.OPT_FORMAT_GROUP_2_SEP = self.ui.format_group_2_sep_char.text()
-
-        # Settings for word group 3
-        self.settings.OPT_FORMAT_GROUP_3_START = self.ui.format_group_3_start_char.text()
-        self.settings.OPT_FORMAT_GROUP_3_END = self.ui.format_group_3_end_char.text()
-        self.settings.OPT_FORMAT_GROUP_3_SEP = self.ui.format_group_3_sep_char.text()
-
-        # Settings for word group 4
-        self.settings.OPT_FORMAT_GROUP_4_START = self.ui.format_group_4_start_char.text()
-        self.settings.OPT_FORMAT_GROUP_4_END = self.ui.format_group_4_end_char.text()
-        self.settings.OPT_FORMAT_GROUP_4_SEP = self.ui.format_group_4_sep_char.text()
-
-        # Settings for keywords
-        self.settings.OPT_FORMAT_GROUP_ADDITIONAL = self._get_rb('additional_rb', 4)
-        self.settings.OPT_FORMAT_GROUP_GUEST = self._get_rb('guest_rb', 4)
-        self.settings.OPT_FORMAT_GROUP_SOLO = self._get_rb('solo_rb', 4)
-        self.settings.OPT_FORMAT_GROUP_VOCALS = self._get_rb('vocals_rb', 4)
-
-    def _update_settings_and_examples(self) -> None:
-        self.save_to_example_settings()
-        self.processor.settings = self.settings
+        for attribute, widget in self.checkboxes.items():
+            setattr(self.settings, attribute, widget.isChecked())
+        for attribute, group in self.button_groups.items():
+            if group.checkedId() >= 0:
+                setattr(self.settings, attribute, type(getattr(self.settings, attribute))(group.checkedId()))
+        for attribute, widget in self.line_edits.items():
+            setattr(self.settings, attribute, widget.text())
+
+    def _field_changed(self, attribute: str, value) -> None:
+        """Update the example settings from the widget that changed, and refresh the examples.
+
+        Args:
+            attribute (str): PluginOptions attribute for the widget.
+            value (bool|int|str): New value from the widget.
+        """
+        value = type(getattr(self.settings, attribute))(value)
+        if getattr(self.settings, attribute) == value:
+            return
+        setattr(self.settings, attribute, value)
         self.update_examples()
 
     def update_examples(self) -> None:
         """Update the examples displayed.
         """
-        items = self.processor.get_performers()
+        items = self.processor.get_performers(self.settings)
         self.ui.example_items.setText('\n'.join(items))
 
 
@@ -843,6 +2193,7 @@ def enable(api: PluginApi) -> None:
     api.plugin_config.register_option(keys.OPT_CREDITED_ARTIST, True)
     api.plugin_config.register_option(keys.OPT_CREDITED_INSTRUMENT, True)
     api.plugin_config.register_option(keys.OPT_CREDITED_VOCAL, True)
+    api.plugin_config.register_option(keys.OPT_ARTIST_NAME, NAME_FIRST_CREDIT)
     api.plugin_config.register_option(keys.OPT_INSTRUMENT_ATTR_ADDITIONAL, True)
     api.plugin_config.register_option(keys.OPT_INSTRUMENT_ATTR_GUEST, True)
     api.plugin_config.register_option(keys.OPT_INSTRUMENT_ATTR_SOLO, True)
@@ -852,6 +2203,10 @@ def enable(api: PluginApi) -> None:
     api.plugin_config.register_option(keys.OPT_VOCAL_ATTR_TYPES, True)
 
     api.plugin_config.register_option(keys.OPT_TAG_GROUP_BY_ARTIST, True)
+    api.plugin_config.register_option(keys.OPT_INSTRUMENT_GROUPING_LEVEL, LEVEL_EXACT)
+    api.plugin_config.register_option(keys.OPT_SORT_ORDER, SORT_ALPHABETICAL)
+    api.plugin_config.register_option(keys.OPT_NORMALIZE_KEYS, False)
+    api.plugin_config.register_option(keys.OPT_OTHER_PERFORMERS, False)
 
     api.plugin_config.register_option(keys.OPT_FORMAT_GROUP_ADDITIONAL, 3)
     api.plugin_config.register_option(keys.OPT_FORMAT_GROUP_GUEST, 4)
@@ -870,12 +2225,132 @@ def enable(api: PluginApi) -> None:
     api.plugin_config.register_option(keys.OPT_FORMAT_GROUP_4_END, ')')
     api.plugin_config.register_option(keys.OPT_FORMAT_GROUP_4_SEP, '')
 
+    api.plugin_config.register_option(PROFILES_KEY, [])
+    api.plugin_config.register_option(CHUNK_THRESHOLD_KEY, 2000)
+    api.plugin_config.register_option(TIME_BUDGET_KEY, 0)
+    api.plugin_config.register_option(MEMORY_PROFILING_KEY, False)
+    api.plugin_config.register_option(DECISION_TRACE_KEY, False)
+    api.plugin_config.register_option(COMPARE_TAG_KEY, '')
+    api.plugin_config.register_option(COPERFORMANCE_FILE_KEY, '')
+    api.plugin_config.register_option(INDEX_FILE_KEY, '')
+    api.plugin_config.register_option(CREDITS_FILE_KEY, '')
+
     # Migrate settings from 2.x version if available
     migrate_settings(api)
 
-    # Register script variable
+    # Start a new logging session
+    MISSING_DATA_LOG.reset()
+
+    # Open the performer index, if enabled
+    PERFORMER_INDEX.open(api, api.plugin_config[INDEX_FILE_KEY])
+
+    # Register script variables and functions
+    register_script_variables(api)
+    register_script_functions(api)
+
+    # Register processor
+    api.register_track_metadata_processor(process_track)
+    api.register_album_post_removal_processor(album_removed)
+    api.register_file_post_addition_to_track_processor(file_added)
+    api.register_file_post_save_processor(file_saved)
+
+    # Register options page and actions
+    api.register_options_page(CombinePerformerTagsOptionsPage)
+    api.register_tools_menu_action(ReapplySettingsAction)
+
+
+def disable() -> None:
+    """Called when plugin is disabled."""
+    COPERFORMANCE_GRAPH.flush()
+    PERFORMER_INDEX.close()
+
+
+def performer_track_count(_parser, artist: str, instrument: str = '') -> str:
+    """Script function returning the number of recordings in the performer index featuring an artist.
+    """
+    return PERFORMER_INDEX.track_count(artist, instrument)
+
+
+def performer_instruments(_parser, artist: str) -> str:
+    """Script function returning the instruments and vocals performed by an artist in the performer index.
+    """
+    return PERFORMER_INDEX.instruments(artist)
+
+
+def register_script_functions(api: PluginApi) -> None:
+    """Register the `$performers()` and `$performers_trace()` script functions, and the script
+    functions answering queries from the performer index.
+    """
+    # The script functions are called with the parser only, so the api is passed on to them here
+    def _performers(parser, *overrides) -> str:
+        return script_performers(api, parser, *overrides)
+
+    def _performers_trace(parser) -> str:
+        return script_performers_trace(api, parser)
+
+    api.register_script_function(
+        _performers,
+        name='performers',
+        documentation=api.tr(
+            "function.performers",
+            (
+                "Returns the combined performers for the track, using the current settings with any of the "
+                "following overrides given as \"name=value\" arguments: group (artist or instrument), level "
+                "(exact, family or top), sort (alphabetical, relation, lead_vocals, soloists or family), "
+                "artist_name (first, most_common or artist), and normalize, credited_artist, credited_instrument, "
+                "credited_vocal, additional, guest, solo, vocal_types and other_performers (0 or 1). Returns an "
+                "empty string if any of the overrides are not valid."
+            )
+        ),
+        signature='$performers([name=value,...])',
+    )
+    api.register_script_function(
+        _performers_trace,
+        name='performers_trace',
+        documentation=api.tr(
+            "function.performers_trace",
+            (
+                "Returns the decisions made when combining the performers for the track, one per line, explaining "
+                "why each relation was included, skipped or merged. Returns an empty string if the decision trace "
+                "is not enabled."
+            )
+        ),
+        signature='$performers_trace()',
+    )
+    api.register_script_function(
+        performer_track_count,
+        name='performer_track_count',
+        documentation=api.tr(
+            "function.performer_track_count",
+            (
+                "Returns the number of recordings in the performer index featuring the artist, given by name or "
+                "MusicBrainz id. If an instrument is given, only the recordings where the artist performs that "
+                "instrument or vocal are counted. Returns an empty string if the performer index is not enabled."
+            )
+        ),
+        signature='$performer_track_count(artist[,instrument])',
+    )
+    api.register_script_function(
+        performer_instruments,
+        name='performer_instruments',
+        documentation=api.tr(
+            "function.performer_instruments",
+            (
+                "Returns a multi-value list of the instruments and vocals performed by the artist, given by name or "
+                "MusicBrainz id, on the recordings in the performer index. Returns an empty string if the performer "
+                "index is not enabled."
+            )
+        ),
+        signature='$performer_instruments(artist)',
+    )
+
+
+def register_script_variables(api: PluginApi) -> None:
+    """Register the script variables for the main settings and each of the additional output profiles.
+    """
+    api.unregister_all_script_variables()
     api.register_script_variable(
-        name="_performers",
+        name="_" + DEFAULT_VARIABLE,
         documentation=api.tr(
             "variable.performers",
             (
@@ -884,12 +2359,55 @@ def enable(api: PluginApi) -> None:
             )
         )
     )
-
-    # Register processor
-    api.register_track_metadata_processor(combine_performer_tags)
-
-    # Register options page
-    api.register_options_page(CombinePerformerTagsOptionsPage)
+    for profile in api.plugin_config[PROFILES_KEY]:
+        api.register_script_variable(
+            name="_" + profile['variable'],
+            documentation=api.tr(
+                "variable.profile",
+                (
+                    "All instrument and vocal performer tags combined into a multi-value variable, with the format based "
+                    "on the '{variable}' output profile on the settings page."
+                ),
+                variable=profile['variable'],
+            )
+        )
+    api.register_script_variable(
+        name="_" + DIGEST_VARIABLE,
+        documentation=api.tr(
+            "variable.digest",
+            "Digest of the `%_performers%` variable, which only changes when the combined performer credits change."
+        )
+    )
+    api.register_script_variable(
+        name="_" + CHANGED_VARIABLE,
+        documentation=api.tr(
+            "variable.changed",
+            (
+                "Set to \"1\" for a file when the `%_performers%` variable differs from the file's existing tag "
+                "selected on the settings page, and empty when it is unchanged."
+            )
+        )
+    )
+    api.register_script_variable(
+        name="_" + TRACK_ONLY_VARIABLE,
+        documentation=api.tr(
+            "variable.track_only",
+            (
+                "The items of the `%_performers%` variable for the performances specific to the track, leaving out "
+                "those common to every track on the album. Set once the album has finished loading."
+            )
+        )
+    )
+    api.register_script_variable(
+        name="_" + TRUNCATED_VARIABLE,
+        documentation=api.tr(
+            "variable.truncated",
+            (
+                "Set to \"1\" when processing the track exceeded the time budget on the settings page, "
+                "and the `%_performers%` variable was produced without some of the attributes or performers."
+            )
+        )
+    )
 
 
 def migrate_settings(api: PluginApi):
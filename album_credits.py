@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Optional credits sheet written next to the files of each album.
+
+The combined performers produced for each track are collected as the track is
+processed, and updated when changed settings are re-applied, so the combiner is
+never run again to produce the sheet.  The sheet is written once the album has
+finished loading and again once all of its files have been saved, as a single
+buffered write to a temporary file that is then renamed over the sheet.  The
+format is JSON if the file name ends in ".json", and plain text otherwise.
+"""
+
+import json
+import os
+
+
+class AlbumCredits():
+    """Collects the combined performers for the tracks on each album, and writes them to
+    a credits sheet in the album's directory.
+    """
+
+    def __init__(self) -> None:
+        self._albums = {}
+
+    def add_track(self, album, track, performers: list) -> None:
+        """Add or replace the combined performers for a track.
+
+        Args:
+            album (Album): Album containing the track.
+            track (Track): The processed track.
+            performers (list): Performance items for the track's `_performers` variable.
+        """
+        tracks = self._albums.setdefault(id(album), {})
+        metadata = track.metadata
+        tracks[id(track)] = (
+            _number(metadata.get('discnumber')),
+            _number(metadata.get('tracknumber')),
+            metadata.get('title', ''),
+            list(performers),
+        )
+
+    def update_track(self, track, performers: list) -> None:
+        """Replace the combined performers for a track that has already been collected.
+
+        Args:
+            track (Track): The updated track.
+            performers (list): Performance items for the track's `_performers` variable.
+        """
+        album = getattr(track, 'album', None)
+        if album is not None and id(track) in self._albums.get(id(album), {}):
+            self.add_track(album, track, performers)
+
+    def tracked(self, album) -> bool:
+        """Check whether credits have been collected for an album.
+
+        Args:
+            album (Album): The album to check.
+
+        Returns:
+            bool: True if credits have been collected for the album.
+        """
+        return id(album) in self._albums
+
+    def discard(self, album) -> None:
+        """Drop the credits collected for a removed album.
+
+        Args:
+            album (Album): The removed album.
+        """
+        self._albums.pop(id(album), None)
+
+    def write(self, api, album, filename: str) -> None:
+        """Write the credits sheet for an album to the directory containing its files.  Nothing
+        is written if none of the album's tracks have files.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            album (Album): The album to write.
+            filename (str): Name of the credits sheet file.
+        """
+        tracks = self._albums.get(id(album))
+        if not tracks or not filename:
+            return
+        directories = {os.path.dirname(x.filename) for x in album.iterfiles(save=True)}
+        if not directories:
+            return
+        directory = os.path.commonpath(list(directories))
+
+        entries = sorted(tracks.values(), key=lambda x: (x[0], x[1]))
+        if filename.lower().endswith('.json'):
+            content = self.format_json(album.metadata, entries)
+        else:
+            content = self.format_text(album.metadata, entries)
+
+        path = os.path.join(directory, filename)
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except OSError as e:
+            api.logger.error(f"Unable to write the album credits to '{path}': {e}")
+
+    @staticmethod
+    def format_text(album_metadata, entries: list) -> str:
+        """Format the credits as plain text liner notes.
+
+        Args:
+            album_metadata (Metadata): Metadata of the album.
+            entries (list): Tuples of (disc number, track number, title, performance items), in order.
+
+        Returns:
+            str: The credits sheet.
+        """
+        multiple_discs = len({x[0] for x in entries}) > 1
+        lines = [album_metadata.get('album', ''), album_metadata.get('albumartist', ''), '']
+        for disc, number, title, performers in entries:
+            position = f"{disc}-{number:02d}" if multiple_discs else f"{number:02d}"
+            lines.append(f"{position} {title}")
+            lines.extend(f"    {x}" for x in performers)
+            lines.append('')
+        return '\n'.join(lines)
+
+    @staticmethod
+    def format_json(album_metadata, entries: list) -> str:
+        """Format the credits as JSON.
+
+        Args:
+            album_metadata (Metadata): Metadata of the album.
+            entries (list): Tuples of (disc number, track number, title, performance items), in order.
+
+        Returns:
+            str: The credits sheet.
+        """
+        sheet = {
+            'album': album_metadata.get('album', ''),
+            'albumartist': album_metadata.get('albumartist', ''),
+            'musicbrainz_albumid': album_metadata.get('musicbrainz_albumid', ''),
+            'tracks': [
+                {'discnumber': disc, 'tracknumber': number, 'title': title, 'performers': performers}
+                for disc, number, title, performers in entries
+            ],
+        }
+        return json.dumps(sheet, ensure_ascii=False, indent=2) + '\n'
+
+
+def _number(text: str) -> int:
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        return 0
+
+
+ALBUM_CREDITS = AlbumCredits()
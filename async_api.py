@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""asyncio counterparts of the combiner entry points, for use with asynchronous sources of
+recordings such as readers over JSON dumps or database cursors::
+
+    async for mbid, performers in combine_stream(recordings, options):
+        ...
+
+The recordings are processed with ``CombinePerformerTags.get_performers()``, so the results
+are the same as when processing them synchronously.  Recordings with more relations than
+``OFFLOAD_THRESHOLD`` are processed in an executor, so that a very large recording does not
+block the event loop.  At most ``max_in_flight`` recordings are read from the source ahead
+of the results being consumed, so a slow consumer holds back reading from the source.
+"""
+
+from collections import deque
+from functools import lru_cache
+import asyncio
+
+from . import (
+    CombinePerformerTags,
+    PluginOptions,
+    enable,
+)
+from .offline_api import OfflinePluginApi
+
+
+# Recordings with more relations than this are processed in the executor
+OFFLOAD_THRESHOLD = 500
+
+# Default number of recordings read from the source ahead of the results being consumed
+MAX_IN_FLIGHT = 8
+
+
+@lru_cache(maxsize=1)
+def default_options() -> PluginOptions:
+    """Get the plugin's default options, for use when no options are provided.
+
+    Returns:
+        PluginOptions: The default options.
+    """
+    api = OfflinePluginApi()
+    enable(api)
+    options = PluginOptions(api)
+    options.load_from_config()
+    return options
+
+
+def combine(relations: list, options: PluginOptions) -> list:
+    """Combine the performers for the relations of a recording.
+
+    Args:
+        relations (list): Relations in MusicBrainz JSON web service format.
+        options (PluginOptions): Options to use for processing.
+
+    Returns:
+        list: Performance items for the multi-value variable.
+    """
+    return CombinePerformerTags(relations, options).get_performers(options)
+
+
+async def combine_async(relations: list, options: PluginOptions = None, executor=None) -> list:
+    """Combine the performers for the relations of a recording, processing large recordings
+    in an executor.
+
+    Args:
+        relations (list): Relations in MusicBrainz JSON web service format.
+        options (PluginOptions, optional): Options to use for processing.  Defaults to the
+            plugin's default options.
+        executor (concurrent.futures.Executor, optional): Executor for large recordings.
+            Defaults to the event loop's default executor.
+
+    Returns:
+        list: Performance items for the multi-value variable.
+    """
+    return await _submit(asyncio.get_running_loop(), relations, options or default_options(), executor)
+
+
+async def combine_stream(recordings, options: PluginOptions = None, max_in_flight: int = MAX_IN_FLIGHT, executor=None):
+    """Asynchronous generator combining the performers for a stream of recordings, yielding the
+    results in the order of the recordings.
+
+    Args:
+        recordings (AsyncIterable): Recordings in MusicBrainz JSON web service format, each
+            with its "id" and "relations".
+        options (PluginOptions, optional): Options to use for processing.  Defaults to the
+            plugin's default options.
+        max_in_flight (int, optional): Maximum number of recordings read from the source
+            ahead of the results being consumed.  Defaults to 8.
+        executor (concurrent.futures.Executor, optional): Executor for large recordings.
+            Defaults to the event loop's default executor.
+
+    Yields:
+        tuple: The recording's MusicBrainz id and its performance items.
+    """
+    options = options or default_options()
+    loop = asyncio.get_running_loop()
+    pending = deque()
+    try:
+        async for recording in recordings:
+            pending.append((recording.get('id', ''), _submit(loop, recording.get('relations', []), options, executor)))
+            if len(pending) >= max_in_flight:
+                mbid, future = pending.popleft()
+                yield mbid, await future
+        while pending:
+            mbid, future = pending.popleft()
+            yield mbid, await future
+    finally:
+        for _mbid, future in pending:
+            future.cancel()
+
+
+def _submit(loop: asyncio.AbstractEventLoop, relations: list, options: PluginOptions, executor) -> asyncio.Future:
+    if len(relations) > OFFLOAD_THRESHOLD:
+        return loop.run_in_executor(executor, combine, relations, options)
+    future = loop.create_future()
+    try:
+        future.set_result(combine(relations, options))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        future.set_exception(e)
+    return future
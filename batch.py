@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Headless batch processing of a MusicBrainz recording JSON dump, split into shards that can
+be run on several machines.  Run from the directory containing the plugin package with::
+
+    python -m combine_performer_tags.batch run recording.jsonl output/ --shard 1/4
+    python -m combine_performer_tags.batch merge output/shard-*-of-4.jsonl -o performers.jsonl
+
+Each recording is assigned to a shard from a hash of its MusicBrainz id, so every worker reads
+the whole dump but only processes its own recordings, and the assignment is the same on every
+machine.  A worker writes its results in sorted runs, and after each run records the offset in
+the dump reached in a checkpoint file, so a worker that is stopped or crashes resumes from the
+last checkpoint when it is run again.  Once the dump has been read, the runs are merged into a
+single sorted output file for the shard.
+
+The merge combines the shard outputs into one result file sorted by recording id, using a
+streaming k-way merge that only holds one line from each input file in memory.  The output
+files have one JSON object per line, ``{"id": ..., "performers": [...]}``, for each recording
+with performers.  The optional ``--options`` file holds an object of settings keyed by the
+Picard configuration keys, as saved for an output profile, and settings that are not given
+use the plugin defaults.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+import zlib
+
+from . import (
+    DEFAULT_VARIABLE,
+    CombinePerformerTags,
+    PluginOptions,
+    enable,
+)
+from .offline_api import OfflinePluginApi
+
+
+# Default number of recordings processed in the shard between checkpoints
+CHECKPOINT_INTERVAL = 20000
+
+# Largest number of files merged at once.  Merging more files is done in several passes, to
+# stay within the limit of open files.
+MAX_MERGE_FILES = 200
+
+# Each output line starts with the recording id, so the lines sort in the order of the ids
+ID_PREFIX = '{"id": "'
+
+
+def parse_shard(text: str) -> tuple:
+    """Parse a shard given as "i/N", numbered from 1.
+
+    Args:
+        text (str): Shard to parse.
+
+    Returns:
+        tuple: The shard number and the number of shards.
+    """
+    try:
+        index, count = (int(x) for x in text.split('/'))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{text}', expected i/N.") from e
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{text}', expected 1 <= i <= N.")
+    return index, count
+
+
+def shard_of(recording_id: str, count: int) -> int:
+    """Get the shard for a recording.  The hash does not depend on the Python process, so the
+    recordings are assigned the same way on every machine.
+
+    Args:
+        recording_id (str): MusicBrainz id of the recording.
+        count (int): Number of shards.
+
+    Returns:
+        int: The shard number, from 1 to the number of shards.
+    """
+    return zlib.crc32(recording_id.encode('utf-8')) % count + 1
+
+
+def record_line(recording_id: str, performers: list) -> str:
+    """Format the output line for a recording.
+
+    Args:
+        recording_id (str): MusicBrainz id of the recording.
+        performers (list): Performance items for the recording.
+
+    Returns:
+        str: JSON line, starting with the recording id.
+    """
+    return json.dumps({'id': recording_id, DEFAULT_VARIABLE: performers}, ensure_ascii=False) + '\n'
+
+
+def _line_id(line: str) -> str:
+    return line[len(ID_PREFIX):line.find('"', len(ID_PREFIX))]
+
+
+def _write_atomic(path: str, lines) -> None:
+    # Written to a temporary file that replaces the target once it is safely on disk, so an
+    # interrupted write never leaves a partial file in place
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.writelines(lines)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def merge_files(paths: list, output: str) -> int:
+    """Merge files of output lines, each sorted by recording id, into a single sorted file.  A
+    recording found in more than one file is only written once.
+
+    Args:
+        paths (list): Paths of the sorted files to merge.
+        output (str): Path of the merged file.
+
+    Returns:
+        int: Number of recordings written.
+    """
+    passes = 0
+    while len(paths) > MAX_MERGE_FILES:
+        passes += 1
+        merged = []
+        for start in range(0, len(paths), MAX_MERGE_FILES):
+            path = f"{output}.pass{passes}-{len(merged) + 1}"
+            _merge(paths[start:start + MAX_MERGE_FILES], path)
+            merged.append(path)
+        if passes > 1:
+            for path in paths:
+                os.remove(path)
+        paths = merged
+    count = _merge(paths, output)
+    if passes:
+        for path in paths:
+            os.remove(path)
+    return count
+
+
+def _merge(paths: list, output: str) -> int:
+    files = [open(x, 'r', encoding='utf-8') for x in paths]  # pylint: disable=consider-using-with
+    count = 0
+    try:
+        def _lines():
+            nonlocal count
+            previous = None
+            for line in heapq.merge(*files, key=_line_id):
+                recording_id = _line_id(line)
+                if recording_id != previous:
+                    previous = recording_id
+                    count += 1
+                    yield line
+        _write_atomic(output, _lines())
+    finally:
+        for f in files:
+            f.close()
+    return count
+
+
+class ShardWorker():
+    """Processes the recordings of one shard of a recording dump, resuming from the last
+    checkpoint if the shard has already been started.
+    """
+
+    def __init__(self, dump: str, directory: str, shard: tuple, options: PluginOptions, interval: int = CHECKPOINT_INTERVAL) -> None:
+        """Processes the recordings of one shard of a recording dump.
+
+        Args:
+            dump (str): Path of the recording dump, with one recording per line.
+            directory (str): Directory for the shard's runs, checkpoint and output.
+            shard (tuple): The shard number and the number of shards.
+            options (PluginOptions): Options to use for processing.
+            interval (int, optional): Number of recordings processed in the shard between
+                checkpoints.  Defaults to 20000.
+        """
+        self.dump = dump
+        self.shard = shard
+        self.options = options
+        self.interval = interval
+        self.name = os.path.join(directory, f"shard-{shard[0]}-of-{shard[1]}")
+        self.checkpoint_path = f"{self.name}.checkpoint.json"
+        self.output = f"{self.name}.jsonl"
+        self.state = {
+            'dump': os.path.abspath(dump),
+            'shard': list(shard),
+            'offset': 0,
+            'runs': 0,
+            'processed': 0,
+            'finished': False,
+        }
+
+    def _load_checkpoint(self) -> None:
+        if not os.path.exists(self.checkpoint_path):
+            return
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('dump') != self.state['dump'] or state.get('shard') != self.state['shard']:
+            raise ValueError(f"The checkpoint '{self.checkpoint_path}' is for a different dump or shard.")
+        self.state = state
+
+    def _save_checkpoint(self) -> None:
+        _write_atomic(self.checkpoint_path, [json.dumps(self.state)])
+
+    def _run_path(self, number: int) -> str:
+        return f"{self.name}.run-{number:06d}.jsonl"
+
+    def _write_run(self, lines: list, offset: int) -> None:
+        # The run is written before the checkpoint, so a crash in between processes the same
+        # recordings again into the same run file
+        lines.sort(key=_line_id)
+        _write_atomic(self._run_path(self.state['runs'] + 1), lines)
+        self.state['runs'] += 1
+        self.state['offset'] = offset
+        self._save_checkpoint()
+        print(f"Shard {self.shard[0]}/{self.shard[1]}: {self.state['processed']} recordings, offset {offset}", file=sys.stderr)
+
+    def run(self) -> str:
+        """Process the shard's recordings, resuming from the last checkpoint.
+
+        Returns:
+            str: Path of the shard's sorted output file.
+        """
+        self._load_checkpoint()
+        if self.state['finished']:
+            return self.output
+
+        index, count = self.shard
+        offset = self.state['offset']
+        lines = []
+        pending = 0
+        with open(self.dump, 'rb') as dump:
+            dump.seek(offset)
+            for line in dump:
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    recording = json.loads(line)
+                except ValueError as e:
+                    print(f"Skipped invalid recording before offset {offset}: {e}", file=sys.stderr)
+                    continue
+                recording_id = recording.get('id', '')
+                if not recording_id or shard_of(recording_id, count) != index:
+                    continue
+                try:
+                    performers = CombinePerformerTags(recording.get('relations', []), self.options).get_performers(self.options)
+                except (KeyError, TypeError, AttributeError) as e:
+                    print(f"Unable to process recording '{recording_id}': {e}", file=sys.stderr)
+                    performers = []
+                if performers:
+                    lines.append(record_line(recording_id, performers))
+                self.state['processed'] += 1
+                pending += 1
+                if pending >= self.interval:
+                    self._write_run(lines, offset)
+                    lines = []
+                    pending = 0
+        if pending or not self.state['runs']:
+            self._write_run(lines, offset)
+
+        runs = [self._run_path(x) for x in range(1, self.state['runs'] + 1)]
+        merge_files(runs, self.output)
+        self.state['finished'] = True
+        self._save_checkpoint()
+        for path in runs:
+            os.remove(path)
+        return self.output
+
+
+def load_options(path: str) -> PluginOptions:
+    """Get the options for processing, from the plugin defaults and an optional settings file.
+
+    Args:
+        path (str): Path of a JSON file with an object of settings keyed by the Picard
+            configuration keys, or None to use the defaults.
+
+    Returns:
+        PluginOptions: Options to use for processing.
+    """
+    api = OfflinePluginApi(plugin_config={})
+    enable(api)
+    options = PluginOptions(api)
+    options.load_from_config()
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            options.load_from_dict(json.load(f))
+    return options
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Combine Performer Tags batch processing")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="process one shard of a recording dump")
+    run_parser.add_argument('dump', help="recording dump with one JSON recording per line")
+    run_parser.add_argument('directory', help="directory for the shard's checkpoint and output")
+    run_parser.add_argument('--shard', type=parse_shard, default=(1, 1), help="shard to process, as i/N")
+    run_parser.add_argument('--options', help="JSON file of settings keyed by the Picard configuration keys")
+    run_parser.add_argument(
+        '--checkpoint-interval', type=int, default=CHECKPOINT_INTERVAL,
+        help="recordings processed in the shard between checkpoints",
+    )
+
+    merge_parser = subparsers.add_parser('merge', help="merge shard outputs into one sorted file")
+    merge_parser.add_argument('files', nargs='+', help="sorted shard output files")
+    merge_parser.add_argument('-o', '--output', required=True, help="merged output file")
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        os.makedirs(args.directory, exist_ok=True)
+        worker = ShardWorker(args.dump, args.directory, args.shard, load_options(args.options), max(1, args.checkpoint_interval))
+        print(worker.run())
+    else:
+        count = merge_files(args.files, args.output)
+        print(f"Merged {count} recordings into {args.output}")
+
+
+if __name__ == '__main__':
+    main()
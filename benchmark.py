@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Performance benchmarks for the plugin.  Run from the directory containing the
+plugin package with::
+
+    python -m combine_performer_tags.benchmark profiles --relations 500 --profiles 4
+    python -m combine_performer_tags.benchmark stall --relations 20000 --limit 50
+    python -m combine_performer_tags.benchmark albums --albums 10 --tracks 12 --relations 40
+    python -m combine_performer_tags.benchmark ui --repeat 3 --limit 50
+"""
+
+import argparse
+from functools import lru_cache
+import gc
+import os
+import random
+import sys
+import time
+
+from PyQt6 import (
+    QtCore,
+    QtWidgets,
+)
+
+from picard.ui import options as picard_options
+
+from . import (
+    CHUNK_SIZE,
+    CHUNK_THRESHOLD_KEY,
+    PROFILES_KEY,
+    ChunkedRunner,
+    CombinePerformerTags,
+    ExampleMetadata,
+    PluginOptions,
+    enable,
+)
+from .offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+
+
+BASE_SETTINGS = {
+    'cred_artist': True,
+    'cred_instrument': True,
+    'cred_vocal': True,
+    'inst_attr_additional': True,
+    'inst_attr_guest': True,
+    'inst_attr_solo': True,
+    'vocal_attr_additional': True,
+    'vocal_attr_guest': True,
+    'vocal_attr_solo': True,
+    'vocal_attr_types': True,
+    'artist_name': 1,
+    'group_by_artist': True,
+    'instrument_grouping_level': 1,
+    'sort_order': 1,
+    'normalize_keys': False,
+    'other_performers': False,
+    'format_group_additional': 3,
+    'format_group_guest': 4,
+    'format_group_solo': 3,
+    'format_group_vocals': 2,
+    'format_group_1_start_char': '',
+    'format_group_1_end_char': ' ',
+    'format_group_1_sep_char': '',
+    'format_group_2_start_char': ', ',
+    'format_group_2_end_char': '',
+    'format_group_2_sep_char': '',
+    'format_group_3_start_char': ' (',
+    'format_group_3_end_char': ')',
+    'format_group_3_sep_char': '',
+    'format_group_4_start_char': ' (',
+    'format_group_4_end_char': ')',
+    'format_group_4_sep_char': '',
+}
+
+# Settings added since the 2.x version of the plugin
+NEW_SETTINGS = ('artist_name', 'instrument_grouping_level', 'sort_order', 'normalize_keys', 'other_performers')
+
+# Variations applied to the base settings for each additional output profile
+PROFILE_VARIATIONS = [
+    {},
+    {'group_by_artist': False},
+    {'inst_attr_additional': False, 'inst_attr_guest': False, 'inst_attr_solo': False, 'vocal_attr_types': False},
+    {'group_by_artist': False, 'instrument_grouping_level': 2},
+    {'cred_artist': False, 'cred_instrument': False, 'cred_vocal': False},
+    {'sort_order': 4},
+]
+
+
+def make_options(variation: dict = None) -> PluginOptions:
+    """Make an options object from the base settings with the specified changes.
+
+    Args:
+        variation (dict, optional): Settings to change from the base settings.
+
+    Returns:
+        PluginOptions: Options for processing.
+    """
+    # Start from the registered defaults, so that a setting missing from the base settings
+    # never keeps its configuration key string as its value
+    options = PluginOptions(_defaults_api())
+    options.load_from_config()
+    options.load_from_dict(BASE_SETTINGS)
+    options.load_from_dict(variation or {})
+    return options
+
+
+@lru_cache(maxsize=1)
+def _defaults_api() -> OfflinePluginApi:
+    api = OfflinePluginApi(plugin_config={})
+    enable(api)
+    return api
+
+
+def make_relations(count: int, seed: int = 0) -> list:
+    """Make a synthetic list of performer relations based on the example metadata.
+
+    Args:
+        count (int): Number of relations to make.
+        seed (int, optional): Random number generator seed.  Defaults to 0.
+
+    Returns:
+        list: Relations in MusicBrainz JSON web service format.
+    """
+    rng = random.Random(seed)
+    artists = max(count // 4, 1)
+    relations = []
+    for i in range(count):
+        template = ExampleMetadata.RELS[i % len(ExampleMetadata.RELS)]
+        number = rng.randrange(artists)
+        relation = dict(template)
+        relation['artist'] = dict(template['artist'], name=f"Artist {number}", **{'sort-name': f"{number}, Artist", 'id': f"artist-{number}"})
+        relation['target-credit'] = f"Credited {number}" if rng.random() < 0.2 else ''
+        relation['attributes'] = list(template['attributes'])
+        for attribute in ('additional', 'guest', 'solo'):
+            if rng.random() < 0.1:
+                relation['attributes'].append(attribute)
+        relations.append(relation)
+    return relations
+
+
+def _time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_profiles(relations: int, profiles: int, repeat: int) -> None:
+    """Show the marginal cost of each additional output profile, compared with
+    running the complete process separately for each profile.
+    """
+    source = make_relations(relations)
+    options = [make_options(PROFILE_VARIATIONS[i % len(PROFILE_VARIATIONS)]) for i in range(profiles)]
+
+    def single_pass(count: int) -> None:
+        processor = CombinePerformerTags(source, options[0])
+        for profile in options[:count]:
+            processor.get_performers(profile)
+
+    def separate_passes(count: int) -> None:
+        for profile in options[:count]:
+            CombinePerformerTags(source, profile).get_performers()
+
+    parse = _time(lambda: CombinePerformerTags(source, options[0]).records, repeat)
+    print(f"{relations} relations, best of {repeat} runs")
+    print(f"  parse only: {parse * 1000:9.3f} ms")
+    print("  profiles     single pass   marginal   separate passes")
+    previous = parse
+    for count in range(1, profiles + 1):
+        single = _time(lambda: single_pass(count), repeat)
+        separate = _time(lambda: separate_passes(count), repeat)
+        print(f"  {count:8d}  {single * 1000:10.3f} ms {(single - previous) * 1000:7.3f} ms  {separate * 1000:12.3f} ms")
+        previous = single
+
+
+def measure_stall(start_work) -> tuple:
+    """Run some work from the Qt event loop while a 1 ms heartbeat timer records the
+    longest gap between its ticks.
+
+    Args:
+        start_work (callable): Called from the event loop with a callback to call,
+            with the result, when the work is complete.
+
+    Returns:
+        tuple: Longest stall and total elapsed time in seconds, and the result of the work.
+    """
+    gaps = [0.0]
+    last = [time.perf_counter()]
+    result = []
+
+    def _beat() -> None:
+        now = time.perf_counter()
+        gaps.append(now - last[0])
+        last[0] = now
+
+    # Move the objects created during setup out of the garbage collector's view, so that
+    # full collections scanning the synthetic relations are not counted as processing stalls.
+    gc.collect()
+    gc.freeze()
+
+    loop = QtCore.QEventLoop()
+    heartbeat = QtCore.QTimer()
+    heartbeat.setInterval(1)
+    heartbeat.timeout.connect(_beat)
+
+    def _done(value) -> None:
+        result.append(value)
+        _beat()
+        heartbeat.stop()
+        loop.quit()
+
+    start = last[0] = time.perf_counter()
+    heartbeat.start()
+    QtCore.QTimer.singleShot(5, lambda: start_work(_done))
+    loop.exec()
+    gc.unfreeze()
+    return max(gaps), time.perf_counter() - start, result[0]
+
+
+def benchmark_stall(relations: int, limit: float) -> bool:
+    """Show the longest event loop stall when processing a large recording synchronously
+    and in chunks.
+
+    Returns:
+        bool: True if the longest stall with chunked processing is within the limit (ms).
+    """
+    _app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv[:1])
+    source = make_relations(relations)
+    options = make_options()
+
+    def _synchronous(done) -> None:
+        done([CombinePerformerTags(source, options).get_performers()])
+
+    def _chunked(done) -> None:
+        ChunkedRunner(CombinePerformerTags(source, options).iter_chunks([options], CHUNK_SIZE), done).start()
+
+    sync_stall, sync_elapsed, sync_result = measure_stall(_synchronous)
+    chunked_stall, chunked_elapsed, chunked_result = measure_stall(_chunked)
+
+    print(f"{relations} relations, chunks of {CHUNK_SIZE}")
+    print(f"  synchronous: longest stall {sync_stall * 1000:9.3f} ms, total {sync_elapsed * 1000:9.3f} ms")
+    print(f"  chunked:     longest stall {chunked_stall * 1000:9.3f} ms, total {chunked_elapsed * 1000:9.3f} ms")
+    if chunked_result != sync_result:
+        print("  FAIL: chunked output differs from synchronous output")
+        return False
+    if chunked_stall * 1000 > limit:
+        print(f"  FAIL: longest chunked stall exceeds {limit} ms")
+        return False
+    return True
+
+
+def make_legacy_settings() -> dict:
+    """Make a set of settings as stored by the 2.x version of the plugin.
+
+    Returns:
+        dict: Global settings with the 2.x setting keys.
+    """
+    return {f"cpt_{key}": value for key, value in BASE_SETTINGS.items() if key not in NEW_SETTINGS}
+
+
+def _percentile(values: list, percent: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * percent / 100), len(values) - 1)]
+
+
+def benchmark_albums(albums: int, tracks: int, relations: int) -> None:
+    """Show the time taken to enable the plugin, with and without migrating the 2.x settings,
+    and the latency per track and per album when loading synthetic albums through the
+    registered track processor with the offline api.
+    """
+    enable_times = {}
+    for label, settings in (('new settings', {}), ('2.x migration', make_legacy_settings())):
+        # Chunked processing needs a running Qt event loop, and is covered by the stall benchmark
+        # and the chunked processing tests
+        api = OfflinePluginApi(settings=settings, plugin_config={CHUNK_THRESHOLD_KEY: 0})
+        start = time.perf_counter()
+        enable(api)
+        enable_times[label] = time.perf_counter() - start
+
+    processors = api.registered['register_track_metadata_processor']
+    track_times = []
+    album_times = []
+    for album_number in range(albums):
+        album = OfflineAlbum(f"album-{album_number}")
+        release_node = {'id': album.id}
+        track_nodes = [
+            {
+                'number': str(track_number + 1),
+                'recording': {'relations': make_relations(relations, seed=album_number * tracks + track_number)},
+            }
+            for track_number in range(tracks)
+        ]
+        album_start = time.perf_counter()
+        for track_node in track_nodes:
+            track = OfflineTrack(album)
+            start = time.perf_counter()
+            for processor in processors:
+                processor(track, track.metadata, track_node, release_node)
+            track_times.append(time.perf_counter() - start)
+        album.finish_loading()
+        album_times.append(time.perf_counter() - album_start)
+
+    print(f"{albums} albums of {tracks} tracks, {relations} relations per track")
+    for label, elapsed in enable_times.items():
+        print(f"  enable ({label}): {elapsed * 1000:9.3f} ms")
+    print(
+        f"  per track: mean {sum(track_times) / len(track_times) * 1000:9.3f} ms, "
+        f"p50 {_percentile(track_times, 50) * 1000:9.3f} ms, "
+        f"p95 {_percentile(track_times, 95) * 1000:9.3f} ms, "
+        f"max {max(track_times) * 1000:9.3f} ms"
+    )
+    print(
+        f"  per album: mean {sum(album_times) / len(album_times) * 1000:9.3f} ms, "
+        f"max {max(album_times) * 1000:9.3f} ms"
+    )
+
+
+def _timed_ms(func) -> float:
+    start = time.perf_counter()
+    func()
+    QtWidgets.QApplication.processEvents()
+    return (time.perf_counter() - start) * 1000
+
+
+def _page_interactions(page) -> list:
+    """Get the scripted interactions with each of the controls on the options page that
+    update the examples, as (label, function) tuples.
+    """
+    interactions = []
+    for attribute, widget in page.checkboxes.items():
+        interactions.append((attribute, widget.click))
+        interactions.append((attribute, widget.click))
+    for attribute, group in page.button_groups.items():
+        for button in group.buttons():
+            interactions.append((attribute, button.click))
+    for attribute, widget in page.line_edits.items():
+        for text in ('[', widget.text()):
+            interactions.append((attribute, lambda w=widget, t=text: (w.setText(t), w.editingFinished.emit())))
+    for index in (1, 0):
+        interactions.append(('profile', lambda i=index: page.ui.profile_selector.setCurrentIndex(i)))
+    return interactions
+
+
+def benchmark_ui(repeat: int, limit: float) -> bool:
+    """Show the latency of the options page under Qt's offscreen platform: constructing the
+    page, loading the settings, and each scripted interaction that updates the examples.
+
+    Returns:
+        bool: True if the 99th percentile latency of the example updates is within the limit (ms).
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    _app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    # Options pages look up the Picard application, which is not running offline
+    picard_options.tagger_instance = lambda: None
+    api = OfflinePluginApi()
+    enable(api)
+    # Adding a profile opens a dialog, so the page starts with an additional profile to switch to
+    api.plugin_config[PROFILES_KEY] = [{'variable': 'performers_by_instrument', 'settings': {'group_by_artist': False}}]
+    page_class = api.registered['register_options_page'][0]
+
+    construct_times = []
+    load_times = []
+    update_times = []
+    for _ in range(repeat):
+        page = None
+
+        def _construct() -> None:
+            nonlocal page
+            page = page_class()
+
+        construct_times.append(_timed_ms(_construct))
+        load_times.append(_timed_ms(page.load))
+        for _label, interaction in _page_interactions(page):
+            update_times.append(_timed_ms(interaction))
+        page.deleteLater()
+        QtWidgets.QApplication.processEvents()
+
+    print(f"Options page, {repeat} runs, {len(update_times) // repeat} interactions per run")
+    for label, times in (('construct', construct_times), ('load', load_times), ('update', update_times)):
+        print(
+            f"  {label:9s}: p50 {_percentile(times, 50):9.3f} ms, p99 {_percentile(times, 99):9.3f} ms, "
+            f"max {max(times):9.3f} ms"
+        )
+    if _percentile(update_times, 99) > limit:
+        print(f"  FAIL: 99th percentile example update latency exceeds {limit} ms")
+        return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Combine Performer Tags benchmarks")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    profiles_parser = subparsers.add_parser('profiles', help="marginal cost of additional output profiles")
+    profiles_parser.add_argument('--relations', type=int, default=500, help="number of relations per recording")
+    profiles_parser.add_argument('--profiles', type=int, default=4, help="maximum number of output profiles")
+    profiles_parser.add_argument('--repeat', type=int, default=5, help="number of timed runs")
+
+    stall_parser = subparsers.add_parser('stall', help="longest event loop stall for a large recording")
+    stall_parser.add_argument('--relations', type=int, default=20000, help="number of relations in the recording")
+    stall_parser.add_argument('--limit', type=float, default=50, help="maximum allowed stall in ms when processing in chunks")
+
+    albums_parser = subparsers.add_parser('albums', help="latency per track and album using the offline api")
+    albums_parser.add_argument('--albums', type=int, default=10, help="number of albums to load")
+    albums_parser.add_argument('--tracks', type=int, default=12, help="number of tracks per album")
+    albums_parser.add_argument('--relations', type=int, default=40, help="number of relations per track")
+
+    ui_parser = subparsers.add_parser('ui', help="options page latency under the offscreen platform")
+    ui_parser.add_argument('--repeat', type=int, default=3, help="number of times to construct and exercise the page")
+    ui_parser.add_argument('--limit', type=float, default=50, help="maximum allowed 99th percentile example update latency in ms")
+
+    args = parser.parse_args()
+    if args.benchmark == 'profiles':
+        benchmark_profiles(args.relations, args.profiles, args.repeat)
+    elif args.benchmark == 'stall':
+        sys.exit(0 if benchmark_stall(args.relations, args.limit) else 1)
+    elif args.benchmark == 'albums':
+        benchmark_albums(args.albums, args.tracks, args.relations)
+    elif args.benchmark == 'ui':
+        sys.exit(0 if benchmark_ui(args.repeat, args.limit) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Optional graph of the artists performing together on the recordings processed.
+
+The graph is kept as a sparse set of edges between pairs of artists, keyed by their
+MusicBrainz ids, and is updated from the performance records of each recording as
+its track is processed.  The edges collected are appended to a CSV file periodically
+and when Picard exits, so the file is an edge list in which the number of recordings
+for each pair of artists is the sum over all of the rows for the pair.  Each recording
+is only counted once per session, even if its album is reloaded.
+"""
+
+import atexit
+import csv
+import os
+import time
+
+
+# Seconds between writes of the collected edges, and the number of edges collected
+# before they are written regardless of the time.
+FLUSH_INTERVAL = 60
+FLUSH_EDGES = 10000
+
+# Recordings with more artists than this are not added to the graph, because the
+# number of edges grows with the square of the number of artists.
+MAX_ARTISTS = 500
+
+BUFFER_SIZE = 65536
+
+HEADER = ('artist_1', 'artist_1_name', 'artist_2', 'artist_2_name', 'recordings', 'instruments_1', 'instruments_2')
+
+
+class CoPerformanceGraph():
+    """Collects the pairs of artists performing together on each recording, and appends
+    them to an edge list file.
+    """
+
+    def __init__(self) -> None:
+        self._path = ''
+        self._logger = None
+        self._edges = {}
+        self._names = {}
+        self._recordings = set()
+        self._last_flush = time.monotonic()
+        self._exit_registered = False
+
+    def add_recording(self, api, path: str, recording_id: str, records: list) -> None:
+        """Add the artists performing on a recording to the graph.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            path (str): Path of the file to write the graph to.
+            recording_id (str): MusicBrainz id of the recording.
+            records (list): Performance records for the recording.
+        """
+        if recording_id:
+            if recording_id in self._recordings:
+                return
+            self._recordings.add(recording_id)
+        if path != self._path:
+            self.flush()
+            self._path = path
+        self._logger = api.logger
+
+        artists = {}
+        for record in records:
+            if record.artist_id:
+                artists.setdefault(record.artist_id, set()).add(record.instrument)
+                self._names[record.artist_id] = record.artist
+        if len(artists) > MAX_ARTISTS:
+            return
+
+        artist_ids = sorted(artists)
+        for index, artist_1 in enumerate(artist_ids):
+            for artist_2 in artist_ids[index + 1:]:
+                edge = self._edges.get((artist_1, artist_2))
+                if edge is None:
+                    edge = self._edges[(artist_1, artist_2)] = [0, set(), set()]
+                edge[0] += 1
+                edge[1].update(artists[artist_1])
+                edge[2].update(artists[artist_2])
+
+        if not self._exit_registered:
+            atexit.register(self.flush)
+            self._exit_registered = True
+        if len(self._edges) >= FLUSH_EDGES or time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the edges collected since the last write to the file, in a single buffered write.
+        """
+        self._last_flush = time.monotonic()
+        edges, self._edges = self._edges, {}
+        names, self._names = self._names, {}
+        if not edges or not self._path:
+            return
+
+        rows = [
+            (
+                artist_1, names.get(artist_1, ''), artist_2, names.get(artist_2, ''), weight,
+                ';'.join(sorted(instruments_1)), ';'.join(sorted(instruments_2)),
+            )
+            for (artist_1, artist_2), (weight, instruments_1, instruments_2) in edges.items()
+        ]
+        try:
+            new_file = not os.path.exists(self._path) or not os.path.getsize(self._path)
+            with open(self._path, 'a', newline='', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(HEADER)
+                writer.writerows(rows)
+        except OSError as e:
+            if self._logger:
+                self._logger.error(f"Unable to write the co-performance graph to '{self._path}': {e}")
+
+
+COPERFORMANCE_GRAPH = CoPerformanceGraph()
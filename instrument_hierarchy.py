@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Offline snapshot of the MusicBrainz instrument hierarchy.
+
+The snapshot is stored in ``instrument_hierarchy.json`` as a precomputed
+ancestor table keyed by instrument MBID, so that looking up the family or
+top-level instrument for a relation is a single dictionary access.  The file
+is generated from the instrument file of the MusicBrainz JSON data dumps, which
+includes the relationships of every instrument, with::
+
+    python -m combine_performer_tags.instrument_hierarchy build instrument.jsonl > instrument_hierarchy.json
+
+If the data dumps are not available, an instrument file in the same format can
+be fetched from the MusicBrainz web service first, which takes about half an
+hour at the rate limit of one request per second::
+
+    python -m combine_performer_tags.instrument_hierarchy fetch instrument.jsonl
+
+A sample covering the instruments in the options page examples is kept with the
+tests in ``tests/data/instrument_hierarchy_sample.json``.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from urllib.parse import urlencode
+from urllib.request import (
+    Request,
+    urlopen,
+)
+
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instrument_hierarchy.json')
+
+# MusicBrainz web service used to fetch the instruments, and the minimum interval in seconds
+# between requests allowed by its rate limit
+WS_URL = 'https://musicbrainz.org/ws/2/'
+WS_INTERVAL = 1.0
+WS_PAGE_SIZE = 100
+USER_AGENT = 'CombinePerformerTags/3.0 ( https://github.com/rdswift/picard-v3-combine-performer-tags )'
+
+# Grouping levels, numbered to match the radio buttons on the options page.
+LEVEL_EXACT = 1
+LEVEL_FAMILY = 2
+LEVEL_TOP = 3
+
+
+class InstrumentHierarchy():
+    """Ancestor table for the instruments in the hierarchy snapshot.  The table
+    is only read from disk the first time it is needed.
+    """
+
+    def __init__(self, path: str = SNAPSHOT_PATH) -> None:
+        self.path = path
+        self._ancestors = None
+
+    @property
+    def ancestors(self) -> dict:
+        """Mapping of instrument MBID to a (family, top-level) tuple of instrument names.
+        """
+        if self._ancestors is None:
+            self._ancestors = self._load()
+        return self._ancestors
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        names = data['names']
+        return {mbid: (names[family], names[top]) for mbid, (family, top) in data['ancestors'].items()}
+
+    def get_name(self, instrument_id: str, level: int) -> str:
+        """Get the name of the ancestor instrument at the specified grouping level.
+
+        Args:
+            instrument_id (str): MusicBrainz id of the instrument.
+            level (int): Grouping level (``LEVEL_FAMILY`` or ``LEVEL_TOP``).
+
+        Returns:
+            str: Name of the ancestor instrument, or an empty string if the instrument
+                is not in the snapshot or the level is ``LEVEL_EXACT``.
+        """
+        if level == LEVEL_EXACT or instrument_id not in self.ancestors:
+            return ''
+        return self.ancestors[instrument_id][0 if level == LEVEL_FAMILY else 1]
+
+
+INSTRUMENT_HIERARCHY = InstrumentHierarchy()
+
+
+def build_snapshot(instruments: list) -> dict:
+    """Build the compact snapshot data from MusicBrainz instrument entities.
+
+    Args:
+        instruments (list): Instrument entities including their ``instrument-rels``
+            relationships, in MusicBrainz JSON web service format.
+
+    Returns:
+        dict: Snapshot data suitable for writing to ``instrument_hierarchy.json``.
+    """
+    names = {x['id']: x['name'] for x in instruments}
+    parents = {}
+    for instrument in instruments:
+        for relation in instrument.get('relations', []):
+            # "children" relationships pointing backward link an instrument to the instrument it is a type of.
+            if relation.get('type') == 'children' and relation.get('direction') == 'backward':
+                parents[instrument['id']] = relation['instrument']['id']
+                break
+
+    name_list = []
+    name_index = {}
+
+    def _index(mbid: str) -> int:
+        name = names.get(mbid, '')
+        if name not in name_index:
+            name_index[name] = len(name_list)
+            name_list.append(name)
+        return name_index[name]
+
+    ancestors = {}
+    for mbid in names:
+        chain = [mbid]
+        while chain[-1] in parents and parents[chain[-1]] not in chain:
+            chain.append(parents[chain[-1]])
+        family = chain[-2] if len(chain) > 1 else chain[-1]
+        ancestors[mbid] = [_index(family), _index(chain[-1])]
+
+    return {'names': name_list, 'ancestors': ancestors}
+
+
+def _ws_get(path: str, params: dict) -> dict:
+    request = Request(f"{WS_URL}{path}?{urlencode(dict(params, fmt='json'))}", headers={'User-Agent': USER_AGENT})
+    with urlopen(request, timeout=30) as response:
+        return json.load(response)
+
+
+def fetch_instruments(get=_ws_get, interval: float = WS_INTERVAL):
+    """Generator fetching every instrument with its instrument relationships from the MusicBrainz
+    web service, in the format of the instrument file of the JSON data dumps.
+
+    Args:
+        get (callable, optional): Function getting a web service document from its path and query
+            parameters.  Defaults to requesting it from the MusicBrainz web service.
+        interval (float, optional): Minimum interval in seconds between requests.  Defaults to 1.
+
+    Yields:
+        dict: Instrument entity including its ``relations``.
+    """
+    last = [0.0]
+
+    def _get(path: str, params: dict) -> dict:
+        time.sleep(max(0.0, last[0] + interval - time.monotonic()))
+        last[0] = time.monotonic()
+        return get(path, params)
+
+    ids = []
+    offset = 0
+    while True:
+        page = _get('instrument', {'query': '*', 'limit': WS_PAGE_SIZE, 'offset': offset})
+        instruments = page.get('instruments', [])
+        ids.extend(x['id'] for x in instruments)
+        offset += len(instruments)
+        if not instruments or offset >= page.get('count', 0):
+            break
+    for mbid in dict.fromkeys(ids):
+        yield _get(f"instrument/{mbid}", {'inc': 'instrument-rels'})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the instrument hierarchy snapshot")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help="write the snapshot for an instrument file to standard output")
+    build_parser.add_argument('instruments', help="instrument file with one JSON instrument per line")
+    fetch_parser = subparsers.add_parser('fetch', help="fetch an instrument file from the MusicBrainz web service")
+    fetch_parser.add_argument('instruments', help="instrument file to write")
+
+    args = parser.parse_args()
+    if args.command == 'build':
+        with open(args.instruments, 'r', encoding='utf-8') as dump:
+            entities = [json.loads(line) for line in dump if line.strip()]
+        json.dump(build_snapshot(entities), sys.stdout, ensure_ascii=False, separators=(',', ':'))
+    else:
+        with open(args.instruments, 'w', encoding='utf-8', newline='\n') as dump:
+            for count, entity in enumerate(fetch_instruments(), start=1):
+                dump.write(json.dumps(entity, ensure_ascii=False) + '\n')
+                if not count % 100:
+                    print(f"Fetched {count} instruments", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Optional memory profiling of the track processing for each album.
+
+When enabled, ``tracemalloc`` is started when the first track of an album is
+processed and a snapshot of the traces allocated by the plugin's own source
+lines is taken.  While each track is processed, the peak of the traced memory
+is reset before the call and read back afterwards, giving the peak and the net
+growth of the traced memory during the call without taking a snapshot for
+every track.  These figures cover all of the memory traced during the call,
+which is made from Picard's main thread, rather than only the plugin's source
+lines.  Once the album has finished loading, a final filtered snapshot is
+compared with the first and the memory retained by the plugin's source lines is
+written to the log, along with the largest differences.  Tracing is stopped
+again when no albums are being profiled, so there is no overhead when the
+profiling mode is not enabled.
+"""
+
+import os
+import tracemalloc
+
+
+PLUGIN_FILES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '*')
+
+# Snapshot filters keeping only the traces allocated by the plugin's own source lines
+PLUGIN_FILTER = [
+    tracemalloc.Filter(True, PLUGIN_FILES),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+def plugin_snapshot() -> tracemalloc.Snapshot:
+    """Take a snapshot of the memory allocated by the plugin's own source lines.
+
+    Returns:
+        tracemalloc.Snapshot: The filtered snapshot.
+    """
+    return tracemalloc.take_snapshot().filter_traces(PLUGIN_FILTER)
+
+
+class AlbumMemoryProfile():
+    """Memory use collected while the tracks of an album are processed.
+    """
+
+    def __init__(self, album_id: str) -> None:
+        self.album_id = album_id
+        self.snapshot = plugin_snapshot()
+        self.tracks = 0
+        self.growth = 0
+        self.peak = 0
+
+
+class MemoryProfiler():
+    """Profiles the memory allocated by the plugin while the tracks of each album are processed.
+    """
+
+    # Number of source lines to include in the report for each album
+    TOP_COUNT = 10
+
+    def __init__(self) -> None:
+        self._albums = {}
+        self._started = False
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        if abs(size) < 1024:
+            return f"{size} B"
+        if abs(size) < 1024 * 1024:
+            return f"{size / 1024:.1f} KiB"
+        return f"{size / 1024 / 1024:.1f} MiB"
+
+    def profile(self, api, album, album_id: str, func, *args) -> None:
+        """Call a track processing function, collecting its memory use for the album.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            album (Album): Album containing the track, or None.
+            album_id (str): MusicBrainz id of the album.
+            func (callable): Function to call.
+            *args: Arguments for the function.
+        """
+        if album is None or album.loaded:
+            func(*args)
+            return
+
+        key = id(album)
+        if key not in self._albums:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started = True
+            self._albums[key] = AlbumMemoryProfile(album_id)
+            album.run_when_loaded(lambda: self.report(api, key), run_on_error=True)
+        profile = self._albums[key]
+
+        tracemalloc.reset_peak()
+        before, _peak = tracemalloc.get_traced_memory()
+        try:
+            func(*args)
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            profile.tracks += 1
+            profile.growth += current - before
+            profile.peak = max(profile.peak, peak - before)
+
+    def discard(self, album) -> None:
+        """Stop profiling an album that was removed before it finished loading.
+
+        Args:
+            album (Album): The removed album.
+        """
+        if self._albums.pop(id(album), None) is not None:
+            self._stop()
+
+    def report(self, api, key: int) -> None:
+        """Write the memory profile for an album to the log.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            key (int): Key of the album in the collected profiles.
+        """
+        if key not in self._albums:
+            return
+        profile = self._albums.pop(key)
+        differences = plugin_snapshot().compare_to(profile.snapshot, 'lineno')
+        retained = sum(x.size_diff for x in differences)
+        allocations = sum(x.count_diff for x in differences)
+        self._stop()
+
+        lines = [
+            f"{profile.album_id}: Memory profile for {profile.tracks} tracks: "
+            f"peak of {self._format_size(profile.peak)} traced above the start of a single track, "
+            f"{self._format_size(profile.growth)} net growth in traced memory while processing, "
+            f"{self._format_size(retained)} in {allocations} blocks retained by the plugin's source lines."
+        ]
+        for difference in differences[:self.TOP_COUNT]:
+            if not difference.size_diff:
+                break
+            frame = difference.traceback[0]
+            lines.append(
+                f"    {os.path.basename(frame.filename)}:{frame.lineno}: "
+                f"{self._format_size(difference.size_diff):>10} in {difference.count_diff} blocks"
+            )
+        api.logger.info('\n'.join(lines))
+
+    def _stop(self) -> None:
+        if self._started and not self._albums:
+            tracemalloc.stop()
+            self._started = False
+
+
+MEMORY_PROFILER = MemoryProfiler()
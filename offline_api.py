@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Stand-in for the parts of the Picard ``PluginApi`` used by the plugin, so that the
+plugin's entry points can be run and benchmarked without a running Picard instance.
+Registered functions are stored rather than being added to Picard, and albums are
+simulated with ``OfflineAlbum`` and ``OfflineTrack`` objects.
+"""
+
+from collections import defaultdict
+from functools import partial
+import logging
+
+
+class OfflineSetting(dict):
+    """Stand-in for the Picard global ``setting`` configuration section.
+    """
+
+    def raw_value(self, name: str, qtype=None):
+        """Get the stored value for a setting, or None if it is not set.
+
+        Args:
+            name (str): Name of the setting.
+            qtype (type, optional): Type to convert the value to.
+
+        Returns:
+            Value of the setting, or None.
+        """
+        value = self.get(name)
+        if value is None or qtype is None:
+            return value
+        return qtype(value)
+
+    def remove(self, name: str) -> None:
+        """Remove a setting.
+
+        Args:
+            name (str): Name of the setting.
+        """
+        self.pop(name, None)
+
+
+class OfflineGlobalConfig():
+    """Stand-in for the Picard global configuration.
+    """
+
+    def __init__(self, settings: dict = None) -> None:
+        self.setting = OfflineSetting({'track_ars': True})
+        self.setting.update(settings or {})
+
+
+class OfflinePluginConfig(dict):
+    """Stand-in for the plugin's configuration section.
+    """
+
+    def register_option(self, name: str, default) -> None:
+        """Register an option, setting it to the default value if it is not already set.
+
+        Args:
+            name (str): Name of the option.
+            default: Default value for the option.
+        """
+        self.setdefault(name, default)
+
+
+class OfflineAlbum():
+    """Simulated album, providing the loading state, tasks and callbacks used by the plugin.  As in
+    Picard, completing a task does not finish loading the album, which is only finalized once
+    the album's own requests have finished and no blocking tasks are pending.
+    """
+
+    def __init__(self, album_id: str) -> None:
+        self.id = album_id
+        self.loaded = False
+        # Whether each pending task is blocking, by task id
+        self.tasks = {}
+        self.tracks = []
+        self._after_load_callbacks = []
+
+    def run_when_loaded(self, func, run_on_error: bool = False) -> None:  # pylint: disable=unused-argument
+        """Run a function once the album has finished loading.
+        """
+        if self.loaded:
+            func()
+        else:
+            self._after_load_callbacks.append(func)
+
+    def finish_loading(self) -> bool:
+        """Finalize the album once its tracks have been processed, as Picard does when the requests
+        for the release have finished.  The album is left loading if a blocking task is pending.
+
+        Returns:
+            bool: True if the album has finished loading.
+        """
+        if not self.loaded and not any(self.tasks.values()):
+            self.loaded = True
+            callbacks, self._after_load_callbacks = self._after_load_callbacks, []
+            for func in callbacks:
+                func()
+        return self.loaded
+
+
+class OfflineTrack():
+    """Simulated track on an ``OfflineAlbum``.
+    """
+
+    def __init__(self, album: OfflineAlbum) -> None:
+        self.album = album
+        self.metadata = {}
+        self.orig_metadata = {}
+        self.scripted_metadata = {}
+        self.files = []
+        album.tracks.append(self)
+
+    @staticmethod
+    def run_scripts(metadata, strip_whitespace: bool = False) -> None:  # pylint: disable=unused-argument
+        """Run the tagger scripts on the metadata.  There are no tagger scripts offline.
+        """
+
+    def update_file_metadata(self, file) -> None:
+        """Run the tagger scripts for a linked file, which is not needed offline.
+        """
+
+    def update(self) -> None:
+        """Refresh the track's display, which is not needed offline.
+        """
+
+
+class OfflinePluginApi():
+    """Stand-in for the Picard ``PluginApi``.  Any ``register_*`` call stores the registered
+    object (or the keyword arguments, if there are no positional arguments) in ``registered``
+    under the name of the method, with the api injected as the first argument of processing
+    functions as Picard does.  Other ``unregister_*`` calls are accepted and ignored.
+    """
+
+    # Registration methods whose functions are called with the api as the first argument
+    API_INJECTED = (
+        'register_track_metadata_processor',
+        'register_album_metadata_processor',
+        'register_album_post_removal_processor',
+        'register_file_post_addition_to_track_processor',
+        'register_file_pre_save_processor',
+        'register_file_post_save_processor',
+    )
+
+    def __init__(self, settings: dict = None, plugin_config: dict = None, logger: logging.Logger = None) -> None:
+        """Stand-in for the Picard ``PluginApi``.
+
+        Args:
+            settings (dict, optional): Initial values for the global settings.  The
+                "track_ars" setting is enabled unless specified otherwise.
+            plugin_config (dict, optional): Initial values for the plugin's settings.
+            logger (logging.Logger, optional): Logger to use.  Defaults to a logger named
+                after this module.
+        """
+        self.global_config = OfflineGlobalConfig(settings)
+        self.plugin_config = OfflinePluginConfig(plugin_config or {})
+        self.logger = logger or logging.getLogger(__name__)
+        self.registered = defaultdict(list)
+
+    def __getattr__(self, name: str):
+        if name.startswith('register_'):
+            return partial(self._register, name)
+        if name.startswith('unregister_'):
+            return lambda *args, **kwargs: None
+        raise AttributeError(name)
+
+    def _register(self, _method: str, *args, **kwargs) -> None:
+        item = args[0] if args else kwargs
+        if _method in self.API_INJECTED:
+            item = partial(item, self)
+        self.registered[_method].append(item)
+
+    def register_options_page(self, page_class) -> None:
+        """Store an options page class, making the api available to its instances as Picard does.
+        """
+        page_class.api = self
+        self.registered['register_options_page'].append(page_class)
+
+    def unregister_all_script_variables(self) -> None:
+        """Remove all registered script variables.
+        """
+        self.registered.pop('register_script_variable', None)
+
+    def tr(self, _key: str, text: str = None, **kwargs) -> str:
+        """Return the untranslated text, with any placeholders replaced.
+        """
+        return text.format(**kwargs) if kwargs else text
+
+    def add_album_task(self, album: OfflineAlbum, task_id: str, _description: str, blocking: bool = False, **_kwargs) -> None:
+        """Add a task to the album.  A blocking task must be completed before the album can
+        finish loading.
+        """
+        album.tasks[task_id] = blocking
+
+    def complete_album_task(self, album: OfflineAlbum, task_id: str) -> None:
+        """Mark an album task as completed.  As in Picard, this does not finalize the album.
+        """
+        album.tasks.pop(task_id, None)
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Optional library-wide index of the performers on each recording, stored in SQLite.
+
+The performance records of the recordings on an album are collected while the album
+is loading, and written to the database in a single transaction once it has loaded.
+The existing rows for a recording are replaced when it is processed again.  Queries
+from the script functions are answered from the indexed table, with a cache of the
+recent results in front that is cleared whenever the index is updated.
+"""
+
+from functools import lru_cache
+import sqlite3
+import threading
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS performances (
+    recording_id TEXT NOT NULL,
+    artist_id TEXT NOT NULL,
+    artist TEXT NOT NULL,
+    role TEXT NOT NULL,
+    instrument TEXT NOT NULL,
+    attributes TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS performances_recording ON performances (recording_id);
+CREATE INDEX IF NOT EXISTS performances_artist_id ON performances (artist_id);
+CREATE INDEX IF NOT EXISTS performances_artist ON performances (artist);
+"""
+
+# Number of query results to keep in the cache for each script function
+CACHE_SIZE = 1024
+
+# Separator for multiple values, as used by Picard
+MULTI_VALUED_JOINER = '; '
+
+
+class PerformerIndex():
+    """Index of the performers on each recording processed, stored in an SQLite database.
+    """
+
+    def __init__(self) -> None:
+        self._path = ''
+        self._connection = None
+        self._lock = threading.Lock()
+        self._albums = {}
+        self._track_count = lru_cache(maxsize=CACHE_SIZE)(self._query_track_count)
+        self._instruments = lru_cache(maxsize=CACHE_SIZE)(self._query_instruments)
+
+    def open(self, api, path: str) -> None:
+        """Open the index database, closing any database already open.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            path (str): Path of the database file, or an empty string to disable the index.
+        """
+        if path == self._path and self._connection is not None:
+            return
+        self.close()
+        self._path = path
+        if not path:
+            return
+        try:
+            connection = sqlite3.connect(path, check_same_thread=False)
+            with connection:
+                connection.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            api.logger.error(f"Unable to open the performer index '{path}': {e}")
+            return
+        self._connection = connection
+
+    def close(self) -> None:
+        """Close the index database.  Records collected for albums that have not finished
+        loading are discarded.
+        """
+        self._albums = {}
+        self._clear_cache()
+        if self._connection is not None:
+            with self._lock:
+                self._connection.close()
+            self._connection = None
+
+    def add_recording(self, api, album, recording_id: str, records: list) -> None:
+        """Add the performers on a recording to the index, replacing any existing rows for the
+        recording.  The rows are written when the album has finished loading.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            album (Album): Album containing the recording, or None.
+            recording_id (str): MusicBrainz id of the recording.
+            records (list): Performance records for the recording.
+        """
+        if self._connection is None or not recording_id:
+            return
+        rows = [
+            (recording_id, x.artist_id, x.artist, x.group, x.instrument, ';'.join(sorted(x.attributes)))
+            for x in records
+        ]
+        if album is None or album.loaded:
+            self._write(api, {recording_id: rows})
+            return
+
+        key = id(album)
+        if key not in self._albums:
+            self._albums[key] = {}
+            album.run_when_loaded(lambda: self.commit(api, key), run_on_error=True)
+        self._albums[key][recording_id] = rows
+
+    def discard(self, album) -> None:
+        """Discard the records collected for an album that was removed before it finished loading.
+
+        Args:
+            album (Album): The removed album.
+        """
+        self._albums.pop(id(album), None)
+
+    def commit(self, api, key: int) -> None:
+        """Write the records collected for an album to the index.
+
+        Args:
+            api (PluginApi): The plugin's api.
+            key (int): Key of the album in the collected records.
+        """
+        recordings = self._albums.pop(key, None)
+        if recordings and self._connection is not None:
+            self._write(api, recordings)
+
+    def _write(self, api, recordings: dict) -> None:
+        try:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "DELETE FROM performances WHERE recording_id = ?",
+                    [(x,) for x in recordings]
+                )
+                self._connection.executemany(
+                    "INSERT INTO performances VALUES (?, ?, ?, ?, ?, ?)",
+                    [row for rows in recordings.values() for row in rows]
+                )
+        except sqlite3.Error as e:
+            api.logger.error(f"Unable to update the performer index '{self._path}': {e}")
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        self._track_count.cache_clear()
+        self._instruments.cache_clear()
+
+    def track_count(self, artist: str, instrument: str = '') -> str:
+        """Get the number of recordings in the index featuring an artist.
+
+        Args:
+            artist (str): Name or MusicBrainz id of the artist.
+            instrument (str, optional): Only count the recordings where the artist performs
+                this instrument or vocal.
+
+        Returns:
+            str: Number of recordings, or an empty string if the index is not available.
+        """
+        if self._connection is None:
+            return ''
+        return self._track_count(artist, instrument)
+
+    def instruments(self, artist: str) -> str:
+        """Get the instruments and vocals performed by an artist on the recordings in the index.
+
+        Args:
+            artist (str): Name or MusicBrainz id of the artist.
+
+        Returns:
+            str: Multi-value list of the instruments and vocals, or an empty string if the
+                index is not available.
+        """
+        if self._connection is None:
+            return ''
+        return self._instruments(artist)
+
+    def _query(self, sql: str, params: tuple) -> list:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def _query_track_count(self, artist: str, instrument: str) -> str:
+        sql = "SELECT COUNT(DISTINCT recording_id) FROM performances WHERE (artist_id = ? OR artist = ?)"
+        params = (artist, artist)
+        if instrument:
+            sql += " AND instrument = ?"
+            params += (instrument,)
+        try:
+            return str(self._query(sql, params)[0][0])
+        except sqlite3.Error:
+            return ''
+
+    def _query_instruments(self, artist: str) -> str:
+        sql = (
+            "SELECT instrument FROM performances WHERE (artist_id = ? OR artist = ?) "
+            "GROUP BY instrument ORDER BY MIN(role), instrument"
+        )
+        try:
+            return MULTI_VALUED_JOINER.join(x[0] for x in self._query(sql, (artist, artist)))
+        except sqlite3.Error:
+            return ''
+
+
+PERFORMER_INDEX = PerformerIndex()
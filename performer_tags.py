@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Performance records built from existing `performer:<role>` tags.
+
+This is used in place of the recording relations when Picard is not set to retrieve
+the track relationships.  The role in each tag name is written by Picard as any prefix
+attributes such as "guest" or "solo", followed by the instruments or vocals performed
+joined as "a, b and c".  The tags carry no MusicBrainz ids or sort names, so the
+artist name is also used as the sort name, the performers are combined by name, and
+the instrument hierarchy does not apply.
+"""
+
+from functools import lru_cache
+import re
+
+from .relation_handlers import (
+    RELATION_GROUPS,
+    PerformanceRecord,
+)
+
+
+PERFORMER_TAG_PREFIX = 'performer:'
+
+# Attributes written by Picard ahead of the instruments or vocals in the role
+PREFIX_ATTRIBUTES = frozenset({'additional', 'guest', 'minor', 'solo'})
+
+# Roles written by Picard for relation types other than instrument and vocal
+ROLE_GROUPS = {
+    '': 'p',
+    'orchestra': 'o',
+    'chorus master': 'm',
+    'concertmaster': 'p',
+}
+
+RE_ROLE_SEPARATOR = re.compile(r',\s+|\s+and\s+')
+
+
+@lru_cache(maxsize=None)
+def parse_role(role: str) -> tuple:
+    """Split the role from a `performer:<role>` tag name into its performances.  The results
+    are cached, since the same few roles occur throughout a library.
+
+    Args:
+        role (str): Role following the "performer:" prefix of the tag name.
+
+    Returns:
+        tuple: Tuples of (group, instrument, attributes) for each instrument or vocal in the role.
+    """
+    words = role.split()
+    attributes = []
+    while words and words[0].lower() in PREFIX_ATTRIBUTES:
+        attributes.append(words.pop(0).lower())
+    attributes = tuple(attributes)
+    nouns = ' '.join(words)
+
+    group = ROLE_GROUPS.get(nouns.lower())
+    if group is not None:
+        return ((group, nouns or RELATION_GROUPS[group].default_name, attributes),)
+
+    performances = []
+    for instrument in RE_ROLE_SEPARATOR.split(nouns):
+        if instrument:
+            group = 'v' if instrument.lower().endswith(('vocal', 'vocals')) else 'i'
+            performances.append((group, instrument, attributes))
+    return tuple(performances)
+
+
+def parse_performer_tags(metadata) -> list:
+    """Build the performance records from the `performer:<role>` tags in the metadata.
+
+    Args:
+        metadata (Metadata): Track or file metadata containing the tags.
+
+    Returns:
+        list: Performance records in the order of the tags.
+    """
+    records = []
+    for name, artist in metadata.items():
+        if not name.startswith(PERFORMER_TAG_PREFIX) or not artist:
+            continue
+        for group, instrument, attributes in parse_role(name[len(PERFORMER_TAG_PREFIX):]):
+            records.append(PerformanceRecord(
+                group=group,
+                artist=artist,
+                artist_id='',
+                artist_credit='',
+                artist_sort=artist,
+                artist_key=0,
+                instrument=instrument,
+                instrument_id='',
+                instrument_credit='',
+                attributes=attributes,
+            ))
+    return records
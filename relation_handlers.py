@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Handlers for the types of performance relations processed by the plugin.
+
+Each handler parses the relations of one type into performance records, and holds
+the rules used to format them: the one-letter group stored in the records, the rank
+of the group when sorting, and the option settings that apply to the group.  The
+handlers are looked up in a dictionary keyed by the relation type, with a second
+dictionary keyed by the relation type id for handlers registered by id, so other
+plugins can add handlers for further relation types with ``register_relation_handler()``.
+
+Each record also carries a compact integer key for its artist, assigned from the artist's
+MusicBrainz id through a table shared by the whole session, so that the records are combined
+by artist rather than by the name shown for the artist.
+"""
+
+from collections import namedtuple
+import threading
+
+
+PerformanceRecord = namedtuple(
+    'PerformanceRecord',
+    [
+        'group', 'artist', 'artist_id', 'artist_credit', 'artist_sort', 'artist_key',
+        'instrument', 'instrument_id', 'instrument_credit', 'attributes',
+    ]
+)
+
+KEYWORD_ATTRIBUTES = frozenset({'additional', 'guest', 'solo'})
+
+# Handlers by relation type, by relation type id, and by the group stored in the records
+RELATION_HANDLERS = {}
+TYPE_ID_HANDLERS = {}
+RELATION_GROUPS = {}
+
+# Sort rank of each group, by the group stored in the records
+GROUP_RANKS = {}
+
+
+class ArtistKeys():
+    """Table assigning a compact integer key to each artist MusicBrainz id seen during the session.
+    Key 0 is used for records without an artist id, which are combined by the artist's name.
+    """
+
+    def __init__(self) -> None:
+        self._keys = {'': 0}
+        self._lock = threading.Lock()
+
+    def get(self, artist_id: str) -> int:
+        """Get the key for an artist, assigning a new key the first time the artist is seen.
+
+        Args:
+            artist_id (str): MusicBrainz id of the artist.
+
+        Returns:
+            int: Key for the artist.
+        """
+        key = self._keys.get(artist_id)
+        if key is None:
+            # Assigned under the lock, so that two artists first seen by different
+            # threads at the same time are not given the same key
+            with self._lock:
+                key = self._keys.setdefault(artist_id, len(self._keys))
+        return key
+
+
+ARTIST_KEYS = ArtistKeys()
+
+
+class RelationHandler():
+    """Parses and formats the performance relations of one type.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-few-public-methods
+
+    def __init__(
+        self,
+        group: str,
+        rank: int,
+        default_name: str,
+        instrument_attributes: bool = False,
+        credited_option: str = None,
+        keyword_options: dict = None,
+        type_attributes: bool = False,
+        hierarchy: bool = False,
+        option: str = None,
+    ) -> None:
+        """Parses and formats the performance relations of one type.
+
+        Args:
+            group (str): Single letter identifying the group in the performance records.
+            rank (int): Sort rank of the group, with lower ranks sorted first.
+            default_name (str): Name used for the instrument when the relation does not specify one.
+            instrument_attributes (bool, optional): The relation's attributes name the instrument
+                or vocal performed.  Defaults to False.
+            credited_option (str, optional): PluginOptions attribute selecting the credited name
+                of the instrument or vocal.  Defaults to None.
+            keyword_options (dict, optional): PluginOptions attribute selecting whether to include
+                each of the keyword attributes.  Defaults to none of the keyword attributes.
+            type_attributes (bool, optional): Other attributes are included with the vocal type
+                attributes.  Defaults to False.
+            hierarchy (bool, optional): The instruments can be grouped using the instrument
+                hierarchy.  Defaults to False.
+            option (str, optional): PluginOptions attribute selecting whether to include the
+                relations of this type.  Defaults to None, to always include them.
+        """
+        self.group = group
+        self.rank = rank
+        self.default_name = default_name
+        self.instrument_attributes = instrument_attributes
+        self.credited_option = credited_option
+        self.keyword_options = keyword_options or {}
+        self.type_attributes = type_attributes
+        self.hierarchy = hierarchy
+        self.option = option
+
+    def parse(self, relation: dict) -> PerformanceRecord:
+        """Parse a relation into a performance record.
+
+        Args:
+            relation (dict): Relation in MusicBrainz JSON web service format.
+
+        Returns:
+            PerformanceRecord: The parsed relation.
+        """
+        attributes = set(x for x in relation['attributes'])   # Make copy to update if empty
+        if self.instrument_attributes:
+            if not attributes or not attributes.difference(KEYWORD_ATTRIBUTES):
+                attributes.add(self.default_name)
+            instrument = attributes.difference(KEYWORD_ATTRIBUTES).pop()
+            attributes = attributes.difference({instrument,})
+        else:
+            instrument = self.default_name
+
+        artist_id = relation['artist'].get('id', '')
+        return PerformanceRecord(
+            group=self.group,
+            artist=relation['artist']['name'],
+            artist_id=artist_id,
+            artist_credit=relation.get('target-credit', ''),
+            artist_sort=relation['artist']['sort-name'],
+            artist_key=ARTIST_KEYS.get(artist_id),
+            instrument=instrument,
+            instrument_id=relation.get('attribute-ids', {}).get(instrument, ''),
+            instrument_credit=relation.get('attribute-credits', {}).get(instrument, ''),
+            attributes=tuple(attributes),
+        )
+
+
+def register_relation_handler(handler: RelationHandler, relation_type: str = None, type_id: str = None) -> None:
+    """Register a handler for a type of performance relation, replacing any existing handler
+    for the type.
+
+    Args:
+        handler (RelationHandler): Handler for the relations.
+        relation_type (str, optional): Name of the relation type, such as "instrument".
+        type_id (str, optional): MusicBrainz id of the relation type.  Relations are matched
+            by type id only when there is no handler for the type name.
+    """
+    if relation_type:
+        RELATION_HANDLERS[relation_type] = handler
+    if type_id:
+        TYPE_ID_HANDLERS[type_id] = handler
+    RELATION_GROUPS[handler.group] = handler
+    GROUP_RANKS[handler.group] = handler.rank
+
+
+INSTRUMENT_KEYWORD_OPTIONS = {
+    'additional': 'OPT_INSTRUMENT_ATTR_ADDITIONAL',
+    'guest': 'OPT_INSTRUMENT_ATTR_GUEST',
+    'solo': 'OPT_INSTRUMENT_ATTR_SOLO',
+}
+
+VOCAL_KEYWORD_OPTIONS = {
+    'additional': 'OPT_VOCAL_ATTR_ADDITIONAL',
+    'guest': 'OPT_VOCAL_ATTR_GUEST',
+    'solo': 'OPT_VOCAL_ATTR_SOLO',
+}
+
+register_relation_handler(
+    RelationHandler(
+        'i', 0, 'instruments',
+        instrument_attributes=True,
+        credited_option='OPT_CREDITED_INSTRUMENT',
+        keyword_options=INSTRUMENT_KEYWORD_OPTIONS,
+        hierarchy=True,
+    ),
+    'instrument',
+)
+register_relation_handler(
+    RelationHandler(
+        'v', 1, 'vocals',
+        instrument_attributes=True,
+        credited_option='OPT_CREDITED_VOCAL',
+        keyword_options=VOCAL_KEYWORD_OPTIONS,
+        type_attributes=True,
+    ),
+    'vocal',
+)
+
+# Other performance credits use the instrument settings for their keyword attributes
+register_relation_handler(
+    RelationHandler('p', 2, 'performer', keyword_options=INSTRUMENT_KEYWORD_OPTIONS, option='OPT_OTHER_PERFORMERS'),
+    'performer',
+)
+register_relation_handler(
+    RelationHandler('o', 3, 'orchestra', keyword_options=INSTRUMENT_KEYWORD_OPTIONS, option='OPT_OTHER_PERFORMERS'),
+    'performing orchestra',
+)
+register_relation_handler(
+    RelationHandler('c', 4, 'conductor', keyword_options=INSTRUMENT_KEYWORD_OPTIONS, option='OPT_OTHER_PERFORMERS'),
+    'conductor',
+)
+register_relation_handler(
+    RelationHandler('m', 5, 'chorus master', keyword_options=INSTRUMENT_KEYWORD_OPTIONS, option='OPT_OTHER_PERFORMERS'),
+    'chorus master',
+)
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Standalone HTTP/JSON service exposing the combiner to other processes.  Run from the
+directory containing the plugin package with::
+
+    python -m combine_performer_tags.service --port 8765 --max-concurrency 4
+
+The service uses the offline api, so it needs neither a running Picard instance nor a Qt
+event loop.  Requests are JSON objects sent with POST, and the connections are kept alive
+between requests:
+
+``/performers``
+    ``{"recording": {"id": ..., "relations": [...]}, "options": ...}`` returns
+    ``{"id": ..., "performers": [...]}``.
+
+``/performers/batch``
+    ``{"recordings": [{"id": ..., "relations": [...]}, ...], "options": ...}`` returns
+    ``{"results": [{"id": ..., "performers": [...]}, ...]}`` in the order of the recordings.
+
+The optional ``options`` are either an object of settings keyed by the Picard configuration
+keys, as saved for an output profile, or a list of ``$performers()`` overrides such as
+``["group=instrument", "guest=0"]``.  Settings that are not given use the plugin defaults,
+and a request with an unknown setting or a value not accepted by the option is refused.
+The compiled options and the records parsed for each recording are cached and shared by all
+requests, keyed by the recording id and a digest of its relations so that a recording sent
+again with different relations is processed again.  ``GET /health`` reports the service status.
+"""
+
+import argparse
+from functools import lru_cache
+import hashlib
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+import json
+import threading
+
+from . import (
+    DEFAULT_VARIABLE,
+    PROCESSOR_CACHE_SIZE,
+    CombinePerformerTags,
+    PluginOptions,
+    ProcessorCache,
+    check_settings,
+    compile_overrides,
+    enable,
+)
+from .offline_api import OfflinePluginApi
+
+
+# Largest request body accepted, in bytes
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# Seconds a request waits for a free processing slot before it is refused
+SLOT_TIMEOUT = 5
+
+
+class ServiceError(Exception):
+    """Error in a service request, reported to the client with an HTTP status.
+    """
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class PerformerService():
+    """Combines the performers for recordings sent by other processes, independent of the
+    transport used to receive the requests.
+    """
+
+    def __init__(self, max_concurrency: int = 4) -> None:
+        """Combines the performers for recordings sent by other processes.
+
+        Args:
+            max_concurrency (int, optional): Maximum number of requests processed at the same
+                time.  Defaults to 4.
+        """
+        self.api = OfflinePluginApi(plugin_config={})
+        enable(self.api)
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.processors = ProcessorCache(PROCESSOR_CACHE_SIZE)
+        self._cache_lock = threading.Lock()
+        self._compile_settings = lru_cache(maxsize=256)(self._make_options)
+
+    def _make_options(self, settings: str) -> PluginOptions:
+        options = PluginOptions(self.api)
+        options.load_from_config()
+        options.load_from_dict(json.loads(settings))
+        return options
+
+    def compile_options(self, options) -> PluginOptions:
+        """Get the options for a request.  The compiled options are cached, so a profile used
+        by many requests is only compiled once.
+
+        Args:
+            options (dict | list | None): Settings keyed by the Picard configuration keys, or
+                a list of `$performers()` overrides.
+
+        Returns:
+            PluginOptions: Options to use for processing.
+        """
+        if options is None:
+            options = {}
+        if isinstance(options, list):
+            compiled = compile_overrides(self.api, tuple(str(x) for x in options))
+            if compiled is None:
+                raise ServiceError(400, "Invalid option overrides.")
+            return compiled
+        if not isinstance(options, dict):
+            raise ServiceError(400, "The options must be an object or a list of overrides.")
+        error = check_settings(self.api, options)
+        if error:
+            raise ServiceError(400, error)
+        return self._compile_settings(json.dumps(options, sort_keys=True))
+
+    @staticmethod
+    def cache_key(recording_id: str, relations: list) -> str:
+        """Get the key of the records parsed for a recording in the cache.
+
+        Args:
+            recording_id (str): Id of the recording.
+            relations (list): Relations sent for the recording.
+
+        Returns:
+            str: The recording id and a digest of its relations.
+        """
+        content = json.dumps(relations, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return f"{recording_id}:{hashlib.sha1(content.encode('utf-8')).hexdigest()}"
+
+    def combine(self, recording: dict, options: PluginOptions) -> dict:
+        """Combine the performers for a recording.  The records parsed for a recording with an
+        id are cached, so the relations are only parsed once for each recording and set of
+        relations.
+
+        Args:
+            recording (dict): Recording in MusicBrainz JSON web service format, with its relations.
+            options (PluginOptions): Options to use for processing.
+
+        Returns:
+            dict: The recording id and its performance items.
+        """
+        if not isinstance(recording, dict) or not isinstance(recording.get('relations'), list):
+            raise ServiceError(400, "Each recording must be an object with a list of relations.")
+        recording_id = recording.get('id', '')
+        processor = None
+        key = self.cache_key(recording_id, recording['relations']) if recording_id else ''
+        if key:
+            with self._cache_lock:
+                processor = self.processors.get(key)
+        cached = processor is not None
+        if not cached:
+            processor = CombinePerformerTags(recording['relations'], options, self.api)
+        try:
+            performers = processor.get_performers(options)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ServiceError(400, f"Unable to process recording '{recording_id}': {e}") from e
+        if not cached and key:
+            processor.release_source()
+            with self._cache_lock:
+                self.processors.add(key, processor)
+        return {'id': recording_id, DEFAULT_VARIABLE: performers}
+
+    def handle(self, method: str, path: str, body: bytes) -> tuple:
+        """Handle a request.
+
+        Args:
+            method (str): HTTP method of the request.
+            path (str): Path of the request.
+            body (bytes): Body of the request.
+
+        Returns:
+            tuple: The HTTP status and the response object.
+        """
+        try:
+            if method == 'GET' and path == '/health':
+                return 200, {'status': 'ok'}
+            if method != 'POST' or path not in ('/performers', '/performers/batch'):
+                raise ServiceError(404, f"Unknown request '{method} {path}'.")
+            try:
+                request = json.loads(body)
+            except ValueError as e:
+                raise ServiceError(400, f"Invalid JSON: {e}") from e
+            if not isinstance(request, dict):
+                raise ServiceError(400, "The request must be a JSON object.")
+
+            if not self.slots.acquire(timeout=SLOT_TIMEOUT):  # pylint: disable=consider-using-with
+                raise ServiceError(503, "Too many requests are being processed.")
+            try:
+                options = self.compile_options(request.get('options'))
+                if path == '/performers':
+                    return 200, self.combine(request.get('recording'), options)
+                recordings = request.get('recordings')
+                if not isinstance(recordings, list):
+                    raise ServiceError(400, "The batch request must have a list of recordings.")
+                return 200, {'results': [self.combine(x, options) for x in recordings]}
+            finally:
+                self.slots.release()
+        except ServiceError as e:
+            return e.status, {'error': str(e)}
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Report unexpected errors to the client rather than closing the connection without a response
+            self.api.logger.exception(f"Error handling request '{method} {path}': {e}")
+            return 500, {'error': "Internal error processing the request."}
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """HTTP request handler for the performer service, keeping the connections alive.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'CombinePerformerTags'
+    # Send each response as soon as it is written, rather than waiting for the client's
+    # acknowledgement of the previous packet on the kept-alive connection
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:   # pylint: disable=invalid-name
+        self._respond(*self.server.service.handle('GET', self.path, b''))
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_SIZE:
+            self.close_connection = True
+            self._respond(413 if length > 0 else 400, {'error': "Missing or unsupported Content-Length."})
+            return
+        body = self.rfile.read(length)
+        self._respond(*self.server.service.handle('POST', self.path, body))
+
+    def _respond(self, status: int, payload: dict) -> None:
+        content = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        if status == 503:
+            self.send_header('Retry-After', str(SLOT_TIMEOUT))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        self.server.service.api.logger.debug(format % args)
+
+
+class ServiceServer(ThreadingHTTPServer):
+    """Threaded HTTP server for the performer service.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, service: PerformerService) -> None:
+        """Threaded HTTP server for the performer service.
+
+        Args:
+            address (tuple): Host and port to listen on.  Port 0 selects a free port.
+            service (PerformerService): Service handling the requests.
+        """
+        super().__init__(address, ServiceRequestHandler)
+        self.service = service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Combine Performer Tags HTTP/JSON service")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=8765, help="port to listen on")
+    parser.add_argument('--max-concurrency', type=int, default=4, help="maximum number of requests processed at the same time")
+    args = parser.parse_args()
+
+    server = ServiceServer((args.host, args.port), PerformerService(args.max_concurrency))
+    print(f"Serving on http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
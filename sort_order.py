@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Sort orders for the performance items.
+
+Each sort order assigns every performance record a tuple of small integers from
+precomputed rank tables (role, attribute and instrument ranks, or the position of
+the relation).  The items and the values within each item are sorted on these
+rank tuples, followed by the rank of the item's name in a table of the distinct
+names, so that the sorting itself never compares strings.
+"""
+
+from .instrument_hierarchy import (
+    INSTRUMENT_HIERARCHY,
+    LEVEL_FAMILY,
+    LEVEL_TOP,
+)
+from .relation_handlers import GROUP_RANKS
+
+
+# Sort orders, numbered to match the radio buttons on the options page.
+SORT_ALPHABETICAL = 1
+SORT_RELATION_ORDER = 2
+SORT_LEAD_VOCALS_FIRST = 3
+SORT_SOLOISTS_FIRST = 4
+SORT_INSTRUMENT_FAMILY = 5
+
+LEAD_VOCALS = 'lead vocals'
+
+
+def rank_table(values) -> dict:
+    """Make a table of the rank of each distinct value in sorted order.
+
+    Args:
+        values (iterable): Values to rank.
+
+    Returns:
+        dict: Rank of each value, starting from 0.
+    """
+    return {value: rank for rank, value in enumerate(sorted(set(values)))}
+
+
+def instrument_ranks(records: list) -> dict:
+    """Make a table of the rank of each instrument in the records, by the names of their top-level
+    instrument and family.  Instruments that are not in the hierarchy snapshot are ranked last.
+
+    Args:
+        records (list): Performance records.
+
+    Returns:
+        dict: Rank of each instrument id.
+    """
+    def _family(instrument_id: str) -> tuple:
+        top = INSTRUMENT_HIERARCHY.get_name(instrument_id, LEVEL_TOP)
+        return (0, top, INSTRUMENT_HIERARCHY.get_name(instrument_id, LEVEL_FAMILY)) if top else (1, '', '')
+
+    families = {x.instrument_id: _family(x.instrument_id) for x in records if x.group == 'i'}
+    ranks = rank_table(families.values())
+    return {instrument_id: ranks[family] for instrument_id, family in families.items()}
+
+
+def record_ranks(records: list, sort_order: int, families: dict = None, start: int = 0) -> list:
+    """Get the rank tuple for each of the performance records.
+
+    Args:
+        records (list): Performance records.
+        sort_order (int): Sort order to use.
+        families (dict, optional): Instrument ranks from ``instrument_ranks()`` for all of the
+            records, when ranking the records in chunks.  Defaults to the ranks for ``records``.
+        start (int, optional): Position of the first record, when ranking the records in chunks.
+
+    Returns:
+        list: Tuple of integer ranks for each record, in the same order as the records.
+    """
+    if sort_order == SORT_RELATION_ORDER:
+        return [(index,) for index in range(start, start + len(records))]
+    if sort_order == SORT_LEAD_VOCALS_FIRST:
+        return [(0 if x.group == 'v' and x.instrument == LEAD_VOCALS else 1 + GROUP_RANKS[x.group],) for x in records]
+    if sort_order == SORT_SOLOISTS_FIRST:
+        return [(0 if 'solo' in x.attributes else 1, GROUP_RANKS[x.group]) for x in records]
+    if sort_order == SORT_INSTRUMENT_FAMILY:
+        if families is None:
+            families = instrument_ranks(records)
+        return [(GROUP_RANKS[x.group], families.get(x.instrument_id, 0)) for x in records]
+    return [(GROUP_RANKS[x.group],) for x in records]
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Tests for the plugin, run with the offline api from the directory containing the plugin
+package with::
+
+    python -m unittest discover -s combine_performer_tags/tests -t .
+"""
+
+import logging
+
+from PyQt6 import QtWidgets
+
+from .. import offline_api
+
+
+# Keep the messages logged by the offline api out of the test output.  Tests checking the
+# messages capture them with assertLogs().
+logging.getLogger(offline_api.__name__).addHandler(logging.NullHandler())
+
+
+def qt_application() -> QtWidgets.QApplication:
+    """Get the application shared by the tests.  A widget application is used, as the options
+    page needs one and only a single application can be created in the process.
+
+    Returns:
+        QtWidgets.QApplication: The application.
+    """
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import json
+import os
+import tempfile
+from types import SimpleNamespace
+import unittest
+
+from picard.file import File
+from picard.metadata import Metadata
+
+from .. import (
+    CREDITS_FILE_KEY,
+    DEFAULT_VARIABLE,
+    ExampleMetadata,
+    enable,
+    reapply_to_track,
+)
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+
+
+class AlbumCreditsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.api = OfflinePluginApi(plugin_config={})
+        enable(self.api)
+        self.process = self.api.registered['register_track_metadata_processor'][0]
+        self.file_saved = self.api.registered['register_file_post_save_processor'][0]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _load_album(self, filename: str) -> tuple:
+        self.api.plugin_config[CREDITS_FILE_KEY] = filename
+        album = OfflineAlbum(f"credits-{filename}")
+        album.metadata = Metadata({'album': 'Late for the Sky', 'albumartist': 'Jackson Browne'})
+        files = []
+        album.iterfiles = lambda save=False: iter(files)
+        tracks = []
+        # The tracks are processed out of order, and sorted by their disc and track numbers in the sheet
+        for number in (2, 1):
+            track = OfflineTrack(album)
+            track.metadata = Metadata({'tracknumber': str(number), 'discnumber': '1', 'title': f"Song {number}"})
+            recording = {'id': f"{album.id}-{number}", 'relations': ExampleMetadata.RELS[number:]}
+            self.process(track, track.metadata, {'number': str(number), 'recording': recording}, {'id': album.id})
+            track.orig_metadata = Metadata(track.metadata)
+            track.scripted_metadata = Metadata(track.metadata)
+            tracks.append(track)
+            files.append(SimpleNamespace(filename=os.path.join(self.directory.name, f"{number}.flac"), parent_item=track, state=File.State.NORMAL))
+        return album, tracks, files
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.directory.name, filename)
+
+    def test_text_sheet(self):
+        album, tracks, _files = self._load_album('credits.txt')
+        self.assertFalse(os.path.exists(self._path('credits.txt')))
+        album.finish_loading()
+        with open(self._path('credits.txt'), encoding='utf-8') as f:
+            lines = f.read().split('\n')
+        self.assertEqual(lines[:3], ['Late for the Sky', 'Jackson Browne', ''])
+        self.assertEqual(lines[3], '01 Song 1')
+        performers = tracks[1].metadata.getall(f"~{DEFAULT_VARIABLE}")
+        self.assertEqual(lines[4:4 + len(performers)], [f"    {x}" for x in performers])
+        self.assertIn('02 Song 2', lines)
+
+    def test_json_sheet(self):
+        album, tracks, _files = self._load_album('credits.json')
+        album.finish_loading()
+        with open(self._path('credits.json'), encoding='utf-8') as f:
+            sheet = json.load(f)
+        self.assertEqual(sheet['album'], 'Late for the Sky')
+        self.assertEqual([x['tracknumber'] for x in sheet['tracks']], [1, 2])
+        self.assertEqual(sheet['tracks'][1]['performers'], tracks[0].metadata.getall(f"~{DEFAULT_VARIABLE}"))
+
+    def test_written_once_all_files_saved(self):
+        album, _tracks, files = self._load_album('saved.txt')
+        album.finish_loading()
+        os.remove(self._path('saved.txt'))
+        files[0].state = File.State.PENDING
+        self.file_saved(files[1])
+        self.assertFalse(os.path.exists(self._path('saved.txt')))
+        files[0].state = File.State.NORMAL
+        self.file_saved(files[0])
+        self.assertTrue(os.path.exists(self._path('saved.txt')))
+        self.assertEqual(os.listdir(self.directory.name), ['saved.txt'])
+
+    def test_reapply_updates_sheet(self):
+        album, tracks, files = self._load_album('reapply.json')
+        album.finish_loading()
+        reapply_to_track(self.api, tracks[0], [(DEFAULT_VARIABLE, None)], [['Someone: kazoo']])
+        self.file_saved(files[0])
+        with open(self._path('reapply.json'), encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['tracks'][1]['performers'], ['Someone: kazoo'])
+
+    def test_not_written_without_file_name(self):
+        album, _tracks, _files = self._load_album('')
+        album.finish_loading()
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
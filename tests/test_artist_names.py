@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import unittest
+
+from .. import (
+    NAME_ARTIST,
+    NAME_FIRST_CREDIT,
+    NAME_MOST_CREDITED,
+    CombinePerformerTags,
+)
+from ..benchmark import (
+    make_options,
+    make_relations,
+)
+
+
+def _relation(instrument: str, credit: str, artist_id: str = 'artist-1', name: str = 'Jackson Browne') -> dict:
+    return {
+        'artist': {'id': artist_id, 'name': name, 'sort-name': name},
+        'attribute-credits': {},
+        'attribute-ids': {},
+        'attributes': [instrument],
+        'target-credit': credit,
+        'type': 'instrument',
+    }
+
+
+# Credited as "J. Browne" first, and as "Jack Browne" most often
+RELATIONS = [
+    _relation('guitar', 'J. Browne'),
+    _relation('piano', ''),
+    _relation('organ', 'Jack Browne'),
+    _relation('drums', 'Jack Browne'),
+    _relation('bass', '', 'artist-2', 'David Lindley'),
+]
+
+
+def _run_chunks(processor: CombinePerformerTags, profiles: list, chunk_size: int) -> list:
+    steps = processor.iter_chunks(profiles, chunk_size)
+    try:
+        while True:
+            next(steps)
+    except StopIteration as e:
+        return e.value
+
+
+class ArtistNameTest(unittest.TestCase):
+
+    @staticmethod
+    def _performers(policy: int, **settings) -> list:
+        options = make_options(dict(settings, artist_name=policy))
+        return CombinePerformerTags(RELATIONS, options).get_performers()
+
+    def test_name_policies(self):
+        for policy, name in ((NAME_FIRST_CREDIT, 'J. Browne'), (NAME_MOST_CREDITED, 'Jack Browne'), (NAME_ARTIST, 'Jackson Browne')):
+            with self.subTest(policy=policy):
+                self.assertEqual(self._performers(policy), ['David Lindley: bass', f"{name}: drums, guitar, organ, piano"])
+
+    def test_standard_name_without_credited_artists(self):
+        for policy in (NAME_FIRST_CREDIT, NAME_MOST_CREDITED, NAME_ARTIST):
+            with self.subTest(policy=policy):
+                self.assertEqual(
+                    self._performers(policy, cred_artist=False),
+                    ['David Lindley: bass', 'Jackson Browne: drums, guitar, organ, piano']
+                )
+
+    def test_chunked_names_match(self):
+        relations = make_relations(3000)
+        for policy in (NAME_FIRST_CREDIT, NAME_MOST_CREDITED, NAME_ARTIST):
+            with self.subTest(policy=policy):
+                options = make_options({'artist_name': policy})
+                expected = CombinePerformerTags(relations, options).get_performers()
+                self.assertEqual(_run_chunks(CombinePerformerTags(relations, options), [options], 100), [expected])
+
+    def test_names_shared_by_profiles(self):
+        relations = make_relations(1000)
+        first = make_options({'artist_name': NAME_FIRST_CREDIT})
+        most = make_options({'artist_name': NAME_MOST_CREDITED})
+        results = _run_chunks(CombinePerformerTags(relations, first), [first, most], 100)
+        self.assertEqual(results, [CombinePerformerTags(relations, x).get_performers() for x in (first, most)])
+
+
+if __name__ == '__main__':
+    unittest.main()
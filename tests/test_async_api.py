@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import unittest
+
+from .. import (
+    CombinePerformerTags,
+    async_api,
+)
+from ..async_api import (
+    combine_async,
+    combine_stream,
+    default_options,
+)
+from ..benchmark import make_relations
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Executor counting the calls submitted to it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class AsyncApiTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.options = default_options()
+        self.executor = CountingExecutor()
+        self.recordings = [{'id': f"r{i}", 'relations': make_relations(count, seed=i)} for i, count in enumerate((10, 40, 300, 5, 0, 30))]
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def _expected(self, relations: list) -> list:
+        return CombinePerformerTags(relations, self.options).get_performers(self.options)
+
+    async def test_combine_async(self):
+        with mock.patch.object(async_api, 'OFFLOAD_THRESHOLD', 100):
+            for recording in self.recordings:
+                with self.subTest(recording=recording['id']):
+                    self.assertEqual(await combine_async(recording['relations'], executor=self.executor), self._expected(recording['relations']))
+        # Only the recording with more relations than the threshold is processed in the executor
+        self.assertEqual(self.executor.submitted, 1)
+
+    async def test_stream_order_and_back_pressure(self):
+        read = 0
+
+        async def _source():
+            nonlocal read
+            for recording in self.recordings:
+                read += 1
+                await asyncio.sleep(0)
+                yield recording
+
+        results = []
+        with mock.patch.object(async_api, 'OFFLOAD_THRESHOLD', 100):
+            async for mbid, performers in combine_stream(_source(), self.options, max_in_flight=2, executor=self.executor):
+                results.append((mbid, performers))
+                self.assertLessEqual(read, len(results) + 2)
+        self.assertEqual(results, [(x['id'], self._expected(x['relations'])) for x in self.recordings])
+
+    async def test_stream_error(self):
+        async def _source():
+            yield self.recordings[0]
+            yield {'id': 'bad', 'relations': [None]}
+
+        results = []
+        with self.assertRaises(AttributeError):
+            async for result in combine_stream(_source(), self.options):
+                results.append(result)
+        self.assertEqual([x[0] for x in results], ['r0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
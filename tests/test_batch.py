@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import argparse
+import io
+import json
+import os
+import random
+import tempfile
+from unittest import mock
+import unittest
+import uuid
+
+from .. import batch
+from ..batch import (
+    ShardWorker,
+    load_options,
+    merge_files,
+    parse_shard,
+    shard_of,
+)
+from ..benchmark import make_relations
+
+
+def _read(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class BatchTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.options = load_options(None)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.dump = os.path.join(self.directory.name, 'recording.jsonl')
+        generator = random.Random(1)
+        with open(self.dump, 'w', encoding='utf-8') as f:
+            for i in range(600):
+                relations = make_relations(generator.randint(0, 6), seed=i) if i % 5 else []
+                f.write(json.dumps({'id': str(uuid.UUID(int=generator.getrandbits(128))), 'relations': relations}) + '\n')
+            f.write('not json\n')
+        # The workers report their progress on stderr
+        patcher = mock.patch('sys.stderr', new_callable=io.StringIO)
+        self.stderr = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _worker(self, name: str, shard: tuple, interval: int = 50) -> ShardWorker:
+        directory = os.path.join(self.directory.name, name)
+        os.makedirs(directory, exist_ok=True)
+        return ShardWorker(self.dump, directory, shard, self.options, interval)
+
+    def _reference(self) -> str:
+        return _read(self._worker('reference', (1, 1), 1000).run())
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard('2/4'), (2, 4))
+        for text in ('0/4', '5/4', '1/0', 'x', '1/2/3'):
+            with self.subTest(text=text), self.assertRaises(argparse.ArgumentTypeError):
+                parse_shard(text)
+
+    def test_shard_of(self):
+        self.assertEqual(shard_of('f1d1a6e2-0000-4000-8000-000000000000', 7), shard_of('f1d1a6e2-0000-4000-8000-000000000000', 7))
+        self.assertEqual({shard_of(str(uuid.UUID(int=x)), 3) for x in range(100)}, {1, 2, 3})
+
+    def test_shards_merge_to_single_shard_output(self):
+        reference = self._reference()
+        lines = reference.splitlines()
+        ids = [json.loads(x)['id'] for x in lines]
+        self.assertEqual(ids, sorted(ids))
+        self.assertTrue(all(json.loads(x)['performers'] for x in lines))
+        self.assertIn('Skipped invalid recording', self.stderr.getvalue())
+
+        outputs = [self._worker('shards', (x, 3)).run() for x in (1, 2, 3)]
+        merged = os.path.join(self.directory.name, 'merged.jsonl')
+        # A recording found in more than one file is only written once
+        self.assertEqual(merge_files(outputs + outputs[:1], merged), len(lines))
+        self.assertEqual(_read(merged), reference)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.directory.name, 'shards'))), sorted(
+            f"shard-{x}-of-3.{y}" for x in (1, 2, 3) for y in ('jsonl', 'checkpoint.json')
+        ))
+
+    def test_merge_in_several_passes(self):
+        outputs = [self._worker('passes', (x, 5)).run() for x in range(1, 6)]
+        merged = os.path.join(self.directory.name, 'merged.jsonl')
+        with mock.patch.object(batch, 'MAX_MERGE_FILES', 2):
+            merge_files(outputs, merged)
+        self.assertEqual(_read(merged), self._reference())
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['merged.jsonl', 'passes', 'recording.jsonl', 'reference'])
+
+    def test_resume_after_interruption(self):
+        worker = self._worker('resume', (2, 3), 20)
+        write_run = worker._write_run  # pylint: disable=protected-access
+        runs = []
+
+        def _interrupted(lines: list, offset: int) -> None:
+            write_run(lines, offset)
+            runs.append(offset)
+            if len(runs) == 2:
+                raise KeyboardInterrupt
+
+        worker._write_run = _interrupted  # pylint: disable=protected-access
+        with self.assertRaises(KeyboardInterrupt):
+            worker.run()
+        with open(worker.checkpoint_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        self.assertEqual((state['runs'], state['offset'], state['finished']), (2, runs[-1], False))
+
+        resumed = self._worker('resume', (2, 3), 20).run()
+        self.assertEqual(_read(resumed), _read(self._worker('complete', (2, 3)).run()))
+        # A finished shard is not processed again
+        with mock.patch.object(ShardWorker, '_write_run') as write:
+            self.assertEqual(self._worker('resume', (2, 3), 20).run(), resumed)
+        write.assert_not_called()
+
+    def test_checkpoint_for_other_shard(self):
+        worker = self._worker('other', (1, 2))
+        worker.run()
+        os.rename(worker.checkpoint_path, os.path.join(self.directory.name, 'other', 'shard-1-of-3.checkpoint.json'))
+        with self.assertRaises(ValueError):
+            self._worker('other', (1, 3)).run()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+from types import SimpleNamespace
+import unittest
+
+from picard.metadata import Metadata
+
+from .. import (
+    CHANGED_VARIABLE,
+    COMPARE_TAG_KEY,
+    DEFAULT_VARIABLE,
+    ExampleMetadata,
+    enable,
+    reapply_to_track,
+)
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+
+
+class ScriptedTrack(OfflineTrack):
+    """Track recording the `_performers_changed` variable seen by the tagger scripts for each file.
+    """
+
+    def __init__(self, album: OfflineAlbum) -> None:
+        super().__init__(album)
+        self.seen = []
+
+    def update_file_metadata(self, file) -> None:
+        self.seen.append(file.metadata['~' + CHANGED_VARIABLE])
+
+
+class ChangeDetectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = OfflinePluginApi(plugin_config={COMPARE_TAG_KEY: 'performers'})
+        enable(self.api)
+        self.process = self.api.registered['register_track_metadata_processor'][0]
+        self.file_added = self.api.registered['register_file_post_addition_to_track_processor'][0]
+        album = OfflineAlbum('album')
+        album.loaded = True
+        self.track = ScriptedTrack(album)
+        self.track.metadata = Metadata()
+        recording = {'id': 'change-detection', 'relations': ExampleMetadata.RELS}
+        self.process(self.track, self.track.metadata, {'number': '1', 'recording': recording}, {'id': 'album'})
+        for name in ('orig_metadata', 'scripted_metadata'):
+            setattr(self.track, name, Metadata(self.track.metadata))
+        self.performers = self.track.metadata.getall(f"~{DEFAULT_VARIABLE}")
+
+    def _add_file(self, performers: list) -> SimpleNamespace:
+        orig_metadata = Metadata()
+        orig_metadata['performers'] = performers
+        file = SimpleNamespace(orig_metadata=orig_metadata, metadata=Metadata())
+        self.track.files.append(file)
+        self.file_added(self.track, file)
+        return file
+
+    def test_scripts_see_variable_when_file_added(self):
+        for performers, changed in ((self.performers, ''), (['Someone else: guitar'], '1')):
+            with self.subTest(changed=changed):
+                self.track.seen.clear()
+                file = self._add_file(performers)
+                self.assertEqual(self.track.seen, [changed])
+                self.assertEqual(file.metadata['~' + CHANGED_VARIABLE], changed)
+
+    def test_variable_recomputed_on_reapply(self):
+        file = self._add_file(self.performers)
+        self.track.seen.clear()
+        profiles = [(DEFAULT_VARIABLE, None)]
+        self.assertTrue(reapply_to_track(self.api, self.track, profiles, [self.performers[:1]]))
+        self.assertEqual(self.track.seen, ['1'])
+        self.assertEqual(file.metadata['~' + CHANGED_VARIABLE], '1')
+        self.assertTrue(reapply_to_track(self.api, self.track, profiles, [self.performers]))
+        self.assertEqual(file.metadata['~' + CHANGED_VARIABLE], '')
+
+    def test_no_rerun_without_compare_tag(self):
+        self.api.plugin_config[COMPARE_TAG_KEY] = ''
+        file = self._add_file(self.performers)
+        self.assertEqual(self.track.seen, [])
+        self.assertNotIn('~' + CHANGED_VARIABLE, file.metadata)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import time
+import unittest
+
+from PyQt6 import QtCore
+
+from picard.metadata import Metadata
+
+from .. import (
+    CHUNK_SIZE,
+    CHUNK_THRESHOLD_KEY,
+    DEFAULT_VARIABLE,
+    LOADED_TRACKS,
+    TRACK_ONLY_VARIABLE,
+    ChunkedRunner,
+    CombinePerformerTags,
+    ExampleMetadata,
+    PluginOptions,
+    enable,
+)
+from ..benchmark import (
+    make_options,
+    make_relations,
+    measure_stall,
+)
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+from . import qt_application
+
+
+# Longest allowed event loop stall in seconds when a large recording is processed in chunks
+STALL_LIMIT = 0.05
+
+
+class ChunkedProcessingTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = qt_application()
+
+    def setUp(self):
+        self.api = OfflinePluginApi(plugin_config={CHUNK_THRESHOLD_KEY: 100})
+        enable(self.api)
+        self.process = self.api.registered['register_track_metadata_processor'][0]
+
+    def _load_album(self, album: OfflineAlbum, relations: list) -> list:
+        tracks = []
+        for number, track_relations in enumerate(relations, start=1):
+            track = OfflineTrack(album)
+            track.metadata = Metadata()
+            recording = {'id': f"{album.id}-{number}", 'relations': track_relations}
+            self.process(track, track.metadata, {'number': str(number), 'recording': recording}, {'id': album.id})
+            tracks.append(track)
+        # Picard keeps the metadata from before the tagger scripts when it finalizes the album
+        for track in tracks:
+            track.orig_metadata = Metadata(track.metadata)
+            track.scripted_metadata = Metadata(track.metadata)
+        return tracks
+
+    def _wait_for_tasks(self, album: OfflineAlbum, timeout: float = 10) -> None:
+        end = time.perf_counter() + timeout
+        while album.tasks and time.perf_counter() < end:
+            self.app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 10)
+        self.assertFalse(album.tasks)
+
+    def _full_output(self, relations: list) -> list:
+        options = PluginOptions(self.api)
+        options.load_from_config()
+        return CombinePerformerTags(relations, options).get_performers(options)
+
+    def test_album_finishes_loading(self):
+        album = OfflineAlbum('chunked-album')
+        large = make_relations(1000)
+        tracks = self._load_album(album, [ExampleMetadata.RELS, large, ExampleMetadata.RELS])
+        # The chunks are processed in a non-blocking task, so the album is not held open
+        self.assertEqual(list(album.tasks.values()), [False])
+        self.assertTrue(album.finish_loading())
+        self.assertFalse(tracks[1].metadata.getall(f"~{DEFAULT_VARIABLE}"))
+        self.assertFalse(tracks[0].metadata[f"~{TRACK_ONLY_VARIABLE}"])
+
+        self._wait_for_tasks(album)
+        for metadata in (tracks[1].orig_metadata, tracks[1].metadata):
+            self.assertEqual(metadata.getall(f"~{DEFAULT_VARIABLE}"), self._full_output(large))
+        self.assertIn(tracks[1], LOADED_TRACKS)
+        # The performers common to the album are found once the chunked track has been processed
+        for track in tracks:
+            self.assertTrue(track.metadata.getall(f"~{TRACK_ONLY_VARIABLE}"))
+
+    def test_longest_stall(self):
+        source = make_relations(20000)
+        options = make_options()
+        expected = CombinePerformerTags(source, options).get_performers()
+
+        def _chunked(done) -> None:
+            ChunkedRunner(CombinePerformerTags(source, options).iter_chunks([options], CHUNK_SIZE), done).start()
+
+        stall, _elapsed, result = measure_stall(_chunked)
+        self.assertEqual(result, [expected])
+        self.assertLess(stall, STALL_LIMIT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import csv
+import os
+import tempfile
+from unittest import mock
+import unittest
+
+from .. import (
+    CombinePerformerTags,
+    coperformance,
+)
+from ..benchmark import make_options
+from ..coperformance import (
+    HEADER,
+    CoPerformanceGraph,
+)
+from ..offline_api import OfflinePluginApi
+
+
+def _relation(instrument: str, artist_id: str, name: str) -> dict:
+    return {
+        'artist': {'id': artist_id, 'name': name, 'sort-name': name},
+        'attribute-credits': {},
+        'attribute-ids': {},
+        'attributes': [instrument],
+        'target-credit': '',
+        'type': 'instrument',
+    }
+
+
+def _records(*relations) -> list:
+    return CombinePerformerTags(list(relations), make_options()).records
+
+
+BROWNE = ('artist-1', 'Jackson Browne')
+LINDLEY = ('artist-2', 'David Lindley')
+KUNKEL = ('artist-3', 'Russ Kunkel')
+
+
+class CoPerformanceGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = OfflinePluginApi()
+        self.graph = CoPerformanceGraph()
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, 'graph.csv')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _read(self) -> list:
+        with open(self.path, newline='', encoding='utf-8') as f:
+            return list(csv.reader(f))
+
+    def test_edges_for_recordings(self):
+        self.graph.add_recording(self.api, self.path, 'rec-1', _records(
+            _relation('guitar', *BROWNE), _relation('piano', *BROWNE), _relation('fiddle', *LINDLEY),
+        ))
+        self.graph.add_recording(self.api, self.path, 'rec-2', _records(
+            _relation('guitar', *BROWNE), _relation('slide guitar', *LINDLEY), _relation('drums', *KUNKEL),
+        ))
+        self.graph.flush()
+        rows = self._read()
+        self.assertEqual(tuple(rows[0]), HEADER)
+        self.assertCountEqual(rows[1:], [
+            ['artist-1', 'Jackson Browne', 'artist-2', 'David Lindley', '2', 'guitar;piano', 'fiddle;slide guitar'],
+            ['artist-1', 'Jackson Browne', 'artist-3', 'Russ Kunkel', '1', 'guitar', 'drums'],
+            ['artist-2', 'David Lindley', 'artist-3', 'Russ Kunkel', '1', 'slide guitar', 'drums'],
+        ])
+
+    def test_recording_counted_once(self):
+        records = _records(_relation('guitar', *BROWNE), _relation('fiddle', *LINDLEY))
+        for _i in range(3):
+            self.graph.add_recording(self.api, self.path, 'rec-1', records)
+        self.graph.flush()
+        self.assertEqual(self._read()[1][4], '1')
+
+    def test_rows_appended_on_each_flush(self):
+        for recording_id in ('rec-1', 'rec-2'):
+            self.graph.add_recording(self.api, self.path, recording_id, _records(_relation('guitar', *BROWNE), _relation('fiddle', *LINDLEY)))
+            self.graph.flush()
+        rows = self._read()
+        self.assertEqual(rows.count(list(HEADER)), 1)
+        self.assertEqual(sum(int(x[4]) for x in rows[1:]), 2)
+
+    def test_recording_with_too_many_artists(self):
+        with mock.patch.object(coperformance, 'MAX_ARTISTS', 2):
+            self.graph.add_recording(self.api, self.path, 'rec-1', _records(
+                _relation('guitar', *BROWNE), _relation('fiddle', *LINDLEY), _relation('drums', *KUNKEL),
+            ))
+        self.graph.flush()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_write_error_is_logged(self):
+        path = os.path.join(self.directory.name, 'missing', 'graph.csv')
+        self.graph.add_recording(self.api, path, 'rec-1', _records(_relation('guitar', *BROWNE), _relation('fiddle', *LINDLEY)))
+        with self.assertLogs(self.api.logger, 'ERROR') as logs:
+            self.graph.flush()
+        self.assertIn(path, logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+from types import SimpleNamespace
+import unittest
+
+from picard.metadata import Metadata
+
+from .. import (
+    DECISION_TRACE_KEY,
+    CombinePerformerTags,
+    ExampleMetadata,
+    enable,
+    script_performers_trace,
+)
+from ..benchmark import make_options
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+
+
+RELATIONS = list(ExampleMetadata.RELS) + [
+    {'type': 'producer', 'artist': {'id': 'producer', 'name': 'Producer', 'sort-name': 'Producer'}},
+    {'type': 'instrument', 'attributes': ['guitar']},
+]
+
+
+class DecisionTraceTest(unittest.TestCase):
+
+    def _traced(self, size: int = 100) -> CombinePerformerTags:
+        processor = CombinePerformerTags(RELATIONS, make_options())
+        processor.enable_trace(size)
+        return processor
+
+    def test_decisions(self):
+        processor = self._traced()
+        processor.get_performers()
+        trace = list(processor.trace)
+        self.assertIn("Parsed 'instrument' relation: Jackson Browne as piano", trace)
+        self.assertIn("Skipped 'producer' relation: not a performance relation type", trace)
+        self.assertIn("Skipped 'instrument' relation: no artist", trace)
+        self.assertIn("Formatting 11 records grouped by artist", trace)
+        self.assertIn("Included Jackson Browne as piano: merged 'piano' into 'Jackson Browne'", trace)
+        self.assertIn(
+            "Included Jimmie Fadden as harmonica: added 'Jim Fadden: mouth harp (solo)' "
+            "(credited artist 'Jim Fadden'; credited instrument 'mouth harp')",
+            trace
+        )
+
+    def test_output_unchanged(self):
+        self.assertEqual(self._traced().get_performers(), CombinePerformerTags(RELATIONS, make_options()).get_performers())
+
+    def test_trace_disabled_by_default(self):
+        processor = CombinePerformerTags(RELATIONS, make_options())
+        processor.get_performers()
+        self.assertIsNone(processor.trace)
+
+    def test_most_recent_decisions_kept(self):
+        processor = self._traced(3)
+        processor.get_performers()
+        self.assertEqual(len(processor.trace), 3)
+        self.assertTrue(processor.trace[-1].startswith('Included David Crosby'))
+
+
+class TraceScriptFunctionTest(unittest.TestCase):
+
+    def _process(self, recording_id: str, trace: bool) -> tuple:
+        api = OfflinePluginApi(plugin_config={DECISION_TRACE_KEY: trace})
+        enable(api)
+        album = OfflineAlbum('album')
+        album.loaded = True
+        track = OfflineTrack(album)
+        track.metadata = Metadata()
+        recording = {'id': recording_id, 'relations': RELATIONS}
+        with self.assertLogs(api.logger, 'DEBUG') as logs:
+            api.registered['register_track_metadata_processor'][0](track, track.metadata, {'number': '1', 'recording': recording}, {'id': 'album'})
+            api.logger.debug('done')
+        parser = SimpleNamespace(context={'musicbrainz_recordingid': recording_id}, file=None)
+        return script_performers_trace(api, parser), [x for x in logs.output if 'Decision trace' in x]
+
+    def test_trace_enabled(self):
+        trace, logged = self._process('trace-enabled', True)
+        self.assertIn("Skipped 'producer' relation: not a performance relation type", trace.split('\n'))
+        self.assertEqual(len(logged), 1)
+        self.assertIn('trace-enabled', logged[0])
+
+    def test_trace_not_enabled(self):
+        self.assertEqual(self._process('trace-disabled', False), ('', []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+
+import json
+import os
+import tempfile
+import unittest
+
+from ..instrument_hierarchy import (
+    LEVEL_EXACT,
+    LEVEL_FAMILY,
+    LEVEL_TOP,
+    InstrumentHierarchy,
+    build_snapshot,
+    fetch_instruments,
+)
+
+
+# Sample of the snapshot, covering the instruments in the options page examples
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'instrument_hierarchy_sample.json')
+
+
+def _instrument(mbid: str, name: str, parent: str = None) -> dict:
+    relations = []
+    if parent:
+        relations.append({'type': 'children', 'direction': 'backward', 'instrument': {'id': parent}})
+    return {'id': mbid, 'name': name, 'relations': relations}
+
+
+class InstrumentHierarchyTest(unittest.TestCase):
+
+    def test_sample_snapshot(self):
+        hierarchy = InstrumentHierarchy(SAMPLE_PATH)
+        violin_family = '377e007a-33fe-4825-9bef-136cf5cf581a'
+        self.assertEqual(hierarchy.get_name(violin_family, LEVEL_FAMILY), 'bowed string instruments')
+        self.assertEqual(hierarchy.get_name(violin_family, LEVEL_TOP), 'string instruments')
+        self.assertEqual(hierarchy.get_name(violin_family, LEVEL_EXACT), '')
+        self.assertEqual(hierarchy.get_name('not-an-instrument', LEVEL_TOP), '')
+
+    def test_build_snapshot(self):
+        instruments = [
+            _instrument('strings', 'string instruments'),
+            _instrument('bowed', 'bowed string instruments', 'strings'),
+            _instrument('violin', 'violin', 'bowed'),
+            _instrument('viola', 'viola', 'bowed'),
+            _instrument('piano', 'piano'),
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'instrument_hierarchy.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(build_snapshot(instruments), f)
+            hierarchy = InstrumentHierarchy(path)
+            for mbid in ('violin', 'viola', 'bowed'):
+                self.assertEqual(hierarchy.get_name(mbid, LEVEL_FAMILY), 'bowed string instruments')
+                self.assertEqual(hierarchy.get_name(mbid, LEVEL_TOP), 'string instruments')
+            self.assertEqual(hierarchy.get_name('piano', LEVEL_FAMILY), 'piano')
+            self.assertEqual(hierarchy.get_name('piano', LEVEL_TOP), 'piano')
+            self.assertEqual(len(hierarchy.ancestors), len(instruments))
+
+    def test_fetch_instruments(self):
+        instruments = {
+            'strings': _instrument('strings', 'string instruments'),
+            'bowed': _instrument('bowed', 'bowed string instruments', 'strings'),
+            'violin': _instrument('violin', 'violin', 'bowed'),
+        }
+        requests = []
+
+        def _get(path: str, params: dict) -> dict:
+            requests.append((path, params))
+            if path == 'instrument':
+                ids = list(instruments)[params['offset']:params['offset'] + 2]
+                return {'count': len(instruments), 'instruments': [{'id': x} for x in ids]}
+            return instruments[path.split('/')[1]]
+
+        fetched = list(fetch_instruments(_get, interval=0))
+        self.assertEqual(fetched, list(instruments.values()))
+        self.assertEqual([x[1]['offset'] for x in requests if x[0] == 'instrument'], [0, 2])
+        self.assertTrue(all(x[1] == {'inc': 'instrument-rels'} for x in requests if x[0] != 'instrument'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+from unittest import mock
+import tracemalloc
+import unittest
+
+from ..memory_profile import MemoryProfiler
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+)
+
+
+SIZE = 1024 * 1024
+
+
+class MemoryProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = OfflinePluginApi()
+        self.profiler = MemoryProfiler()
+        self.album = OfflineAlbum('album')
+        self.kept = []
+
+    def _temporary(self) -> None:
+        data = bytearray(SIZE)
+        del data
+
+    def _retained(self) -> None:
+        self.kept.append(bytearray(SIZE))
+
+    def test_peak_and_growth(self):
+        self.profiler.profile(self.api, self.album, 'album', self._temporary)
+        self.profiler.profile(self.api, self.album, 'album', self._retained)
+        profile = self.profiler._albums[id(self.album)]  # pylint: disable=protected-access
+        self.assertEqual(profile.tracks, 2)
+        self.assertGreaterEqual(profile.peak, SIZE)
+        self.assertGreaterEqual(profile.growth, SIZE)
+        self.assertLess(profile.growth, 2 * SIZE)
+        with self.assertLogs(self.api.logger, 'INFO') as logs:
+            self.album.finish_loading()
+        self.assertIn('album: Memory profile for 2 tracks', logs.output[0])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_no_snapshot_per_track(self):
+        self.profiler.profile(self.api, self.album, 'album', self._temporary)
+        with mock.patch.object(tracemalloc, 'take_snapshot', wraps=tracemalloc.take_snapshot) as take_snapshot:
+            for _i in range(3):
+                self.profiler.profile(self.api, self.album, 'album', self._temporary)
+            take_snapshot.assert_not_called()
+        self.profiler.discard(self.album)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_loaded_album_is_not_profiled(self):
+        self.album.loaded = True
+        self.profiler.profile(self.api, self.album, 'album', self._retained)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(len(self.kept), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import unittest
+
+from picard.metadata import Metadata
+
+from .. import (
+    MISSING_DATA_LOG,
+    MissingDataLog,
+    enable,
+)
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+
+
+class MissingDataLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = OfflinePluginApi(plugin_config={})
+        enable(self.api)
+        self.process = self.api.registered['register_track_metadata_processor'][0]
+
+    def _process(self, album: OfflineAlbum, number: int, recording: dict = None) -> None:
+        track = OfflineTrack(album)
+        track.metadata = Metadata()
+        track_metadata = {'number': str(number)}
+        if recording is not None:
+            track_metadata['recording'] = recording
+        self.process(track, track.metadata, track_metadata, {'id': album.id})
+
+    def test_single_summary_for_album(self):
+        album = OfflineAlbum('missing-album')
+        with self.assertNoLogs(self.api.logger, 'ERROR'):
+            for number in range(1, 8):
+                self._process(album, number)
+            self._process(album, 8, {'id': 'no-relations'})
+        with self.assertLogs(self.api.logger, 'ERROR') as logs:
+            album.finish_loading()
+        self.assertEqual(logs.output, [
+            f"ERROR:{self.api.logger.name}:missing-album: Missing 'recording' in 7 tracks (1, 2, 3, 4, 5, ...); "
+            "'recording->relations' in 1 track (8) metadata."
+        ])
+
+    def test_loaded_album_logs_immediately(self):
+        album = OfflineAlbum('loaded-album')
+        album.loaded = True
+        with self.assertLogs(self.api.logger, 'ERROR') as logs:
+            self._process(album, 3)
+        self.assertIn("loaded-album: Missing 'recording' in track 3 metadata.", logs.output[0])
+
+    def test_discarded_album_is_not_logged(self):
+        album = OfflineAlbum('removed-album')
+        self._process(album, 1)
+        MISSING_DATA_LOG.discard(album)
+        with self.assertNoLogs(self.api.logger, 'ERROR'):
+            album.finish_loading()
+
+    def test_warn_once(self):
+        log = MissingDataLog()
+        with self.assertLogs(self.api.logger, 'WARNING') as logs:
+            for _i in range(3):
+                log.warn_once(self.api, 'key', 'message')
+        self.assertEqual(len(logs.output), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+from unittest import mock
+import unittest
+
+from .. import (
+    FIELD_BUTTON_GROUP,
+    FIELD_CHECKBOX,
+    CombinePerformerTagsOptionsPage,
+    PluginOptions,
+    enable,
+)
+from ..offline_api import (
+    OfflinePluginApi,
+    OfflinePluginConfig,
+)
+from . import qt_application
+
+
+class RecordingConfig(OfflinePluginConfig):
+    """Plugin configuration recording the keys written to it.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.written = []
+
+    def __setitem__(self, key, value) -> None:
+        self.written.append(key)
+        super().__setitem__(key, value)
+
+
+class OptionsPageTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = qt_application()
+
+    def setUp(self):
+        self.api = OfflinePluginApi()
+        self.api.plugin_config = RecordingConfig()
+        enable(self.api)
+        with mock.patch('picard.ui.options.tagger_instance', lambda: None):
+            self.page = self.api.registered['register_options_page'][0]()
+        self.page.load()
+        self.api.plugin_config.written.clear()
+        self.keys = PluginOptions()
+
+    def test_fields_cover_all_options(self):
+        attributes = [x for x in self.keys.__dict__ if x.startswith('OPT_')]
+        self.assertCountEqual([x[0] for x in CombinePerformerTagsOptionsPage.FIELDS], attributes)
+
+    def test_widgets_show_settings(self):
+        for attribute, field_type, _widgets in CombinePerformerTagsOptionsPage.FIELDS:
+            value = self.api.plugin_config[getattr(self.keys, attribute)]
+            with self.subTest(attribute=attribute):
+                if field_type == FIELD_CHECKBOX:
+                    self.assertEqual(self.page.checkboxes[attribute].isChecked(), value)
+                elif field_type == FIELD_BUTTON_GROUP:
+                    self.assertEqual(self.page.button_groups[attribute].checkedId(), int(value))
+                else:
+                    self.assertEqual(self.page.line_edits[attribute].text(), value)
+
+    def test_save_without_changes(self):
+        self.page.save()
+        self.assertEqual(self.api.plugin_config.written, [])
+
+    def test_save_only_changed_settings(self):
+        example = self.page.ui.example_items.text()
+        self.page.ui.solo_rb_2.click()
+        self.page.ui.rb_group_instrument.click()
+        self.page.ui.cb_vocal_types.click()
+        self.page.ui.format_group_1_end_char.setText('-')
+        self.page.ui.format_group_1_end_char.editingFinished.emit()
+        self.assertNotEqual(self.page.ui.example_items.text(), example)
+
+        self.page.save()
+        config = self.api.plugin_config
+        self.assertCountEqual(config.written, ['format_group_solo', 'group_by_artist', 'vocal_attr_types', 'format_group_1_end_char'])
+        self.assertEqual(config['format_group_solo'], 2)
+        self.assertIs(config['group_by_artist'], False)
+        self.assertIs(config['vocal_attr_types'], False)
+        self.assertEqual(config['format_group_1_end_char'], '-')
+
+        config.written.clear()
+        self.page.save()
+        self.assertEqual(config.written, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
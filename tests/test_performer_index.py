@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import os
+import tempfile
+import unittest
+
+from .. import CombinePerformerTags
+from ..benchmark import make_options
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+)
+from ..performer_index import PerformerIndex
+
+
+def _relation(instrument: str, artist_id: str, name: str, relation_type: str = 'instrument') -> dict:
+    return {
+        'artist': {'id': artist_id, 'name': name, 'sort-name': name},
+        'attribute-credits': {},
+        'attribute-ids': {},
+        'attributes': [instrument],
+        'target-credit': '',
+        'type': relation_type,
+    }
+
+
+def _records(*relations) -> list:
+    return CombinePerformerTags(list(relations), make_options()).records
+
+
+BROWNE = ('artist-1', 'Jackson Browne')
+LINDLEY = ('artist-2', 'David Lindley')
+
+
+class PerformerIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = OfflinePluginApi()
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.index = PerformerIndex()
+        self.index.open(self.api, os.path.join(self.directory.name, 'index.db'))
+
+    def tearDown(self):
+        self.index.close()
+        self.directory.cleanup()
+
+    def test_album_written_once_loaded(self):
+        album = OfflineAlbum('album')
+        self.index.add_recording(self.api, album, 'rec-1', _records(_relation('guitar', *BROWNE), _relation('fiddle', *LINDLEY)))
+        self.index.add_recording(self.api, album, 'rec-2', _records(_relation('piano', *BROWNE)))
+        self.assertEqual(self.index.track_count('Jackson Browne'), '0')
+        album.finish_loading()
+        self.assertEqual(self.index.track_count('Jackson Browne'), '2')
+        self.assertEqual(self.index.track_count('artist-1', 'piano'), '1')
+        self.assertEqual(self.index.track_count('David Lindley', 'piano'), '0')
+
+    def test_instruments(self):
+        self.index.add_recording(self.api, None, 'rec-1', _records(
+            _relation('piano', *BROWNE), _relation('lead vocals', *BROWNE, 'vocal'), _relation('guitar', *BROWNE),
+        ))
+        instruments = self.index.instruments('Jackson Browne').split('; ')
+        self.assertCountEqual(instruments, ['guitar', 'piano', 'lead vocals'])
+        self.assertEqual(self.index.instruments('Nobody'), '')
+
+    def test_recording_replaced(self):
+        self.index.add_recording(self.api, None, 'rec-1', _records(_relation('guitar', *BROWNE)))
+        self.assertEqual(self.index.track_count('Jackson Browne'), '1')
+        self.assertEqual(self.index.instruments('Jackson Browne'), 'guitar')
+        self.index.add_recording(self.api, None, 'rec-1', _records(_relation('piano', *BROWNE)))
+        self.assertEqual(self.index.track_count('Jackson Browne'), '1')
+        self.assertEqual(self.index.instruments('Jackson Browne'), 'piano')
+
+    def test_discarded_album(self):
+        album = OfflineAlbum('removed')
+        self.index.add_recording(self.api, album, 'rec-1', _records(_relation('guitar', *BROWNE)))
+        self.index.discard(album)
+        album.finish_loading()
+        self.assertEqual(self.index.track_count('Jackson Browne'), '0')
+
+    def test_closed_index(self):
+        self.index.add_recording(self.api, None, 'rec-1', _records(_relation('guitar', *BROWNE)))
+        self.index.close()
+        self.assertEqual(self.index.track_count('Jackson Browne'), '')
+        self.assertEqual(self.index.instruments('Jackson Browne'), '')
+
+    def test_open_error_is_logged(self):
+        path = os.path.join(self.directory.name, 'missing', 'index.db')
+        with self.assertLogs(self.api.logger, 'ERROR') as logs:
+            self.index.open(self.api, path)
+        self.assertIn(path, logs.output[0])
+        self.assertEqual(self.index.track_count('Jackson Browne'), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
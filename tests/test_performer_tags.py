@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+from types import SimpleNamespace
+import unittest
+
+from picard.metadata import Metadata
+
+from .. import (
+    DEFAULT_VARIABLE,
+    LOADED_TRACKS,
+    enable,
+)
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+from ..performer_tags import (
+    parse_performer_tags,
+    parse_role,
+)
+
+
+def _tags() -> Metadata:
+    metadata = Metadata()
+    metadata.add('performer:guest solo lead vocals', 'Jane Doe')
+    metadata.add('performer:acoustic guitar and piano', 'John Roe')
+    metadata.add('performer:acoustic guitar and piano', 'Jane Doe')
+    metadata.add('performer:orchestra', 'LSO')
+    metadata['title'] = 'Title'
+    return metadata
+
+
+class ParseRoleTest(unittest.TestCase):
+
+    def test_roles(self):
+        for role, expected in (
+            ('acoustic guitar, piano and organ', (('i', 'acoustic guitar', ()), ('i', 'piano', ()), ('i', 'organ', ()))),
+            ('guest solo lead vocals', (('v', 'lead vocals', ('guest', 'solo')),)),
+            ('Guest vocals', (('v', 'vocals', ('guest',)),)),
+            ('additional drums', (('i', 'drums', ('additional',)),)),
+            ('orchestra', (('o', 'orchestra', ()),)),
+            ('chorus master', (('m', 'chorus master', ()),)),
+            ('concertmaster', (('p', 'concertmaster', ()),)),
+            ('guest', (('p', 'performer', ('guest',)),)),
+        ):
+            with self.subTest(role=role):
+                self.assertEqual(parse_role(role), expected)
+
+    def test_performer_tags(self):
+        records = parse_performer_tags(_tags())
+        self.assertEqual(
+            [(x.group, x.artist, x.instrument, x.attributes) for x in records],
+            [
+                ('v', 'Jane Doe', 'lead vocals', ('guest', 'solo')),
+                ('i', 'John Roe', 'acoustic guitar', ()),
+                ('i', 'John Roe', 'piano', ()),
+                ('i', 'Jane Doe', 'acoustic guitar', ()),
+                ('i', 'Jane Doe', 'piano', ()),
+                ('o', 'LSO', 'orchestra', ()),
+            ]
+        )
+        for record in records:
+            self.assertEqual((record.artist_id, record.artist_sort), ('', record.artist))
+
+
+class ExistingTagsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = OfflinePluginApi(settings={'track_ars': False}, plugin_config={'other_performers': True})
+        enable(self.api)
+        self.process = self.api.registered['register_track_metadata_processor'][0]
+        self.file_added = self.api.registered['register_file_post_addition_to_track_processor'][0]
+        self.album = OfflineAlbum('album')
+        self.album.loaded = True
+
+    def _track(self, metadata: Metadata) -> OfflineTrack:
+        track = OfflineTrack(self.album)
+        for name in ('metadata', 'orig_metadata', 'scripted_metadata'):
+            setattr(track, name, Metadata(metadata))
+        return track
+
+    def test_track_metadata_tags(self):
+        metadata = _tags()
+        track = self._track(metadata)
+        with self.assertLogs(self.api.logger, 'WARNING'):
+            self.process(track, metadata, {'number': '1', 'recording': {'id': 'tags-track'}}, {'id': 'album'})
+        self.assertEqual(metadata.getall(f"~{DEFAULT_VARIABLE}"), [
+            'Jane Doe: acoustic guitar, piano, lead vocals (solo) (guest)',
+            'John Roe: acoustic guitar, piano',
+            'LSO: orchestra',
+        ])
+
+    def test_file_tags_without_relations(self):
+        track = self._track(Metadata({'musicbrainz_recordingid': 'tags-file'}))
+        file = SimpleNamespace(orig_metadata=_tags(), metadata=Metadata())
+        track.files.append(file)
+        self.file_added(track, file)
+        self.assertEqual(len(track.metadata.getall(f"~{DEFAULT_VARIABLE}")), 3)
+        self.assertEqual(track.orig_metadata.getall(f"~{DEFAULT_VARIABLE}"), track.metadata.getall(f"~{DEFAULT_VARIABLE}"))
+        self.assertIn(track, LOADED_TRACKS)
+
+    def test_no_performer_tags(self):
+        metadata = Metadata({'title': 'Title'})
+        self.process(self._track(metadata), metadata, {'number': '1', 'recording': {'id': 'tags-none'}}, {'id': 'album'})
+        self.assertNotIn(f"~{DEFAULT_VARIABLE}", metadata)
+
+
+if __name__ == '__main__':
+    unittest.main()
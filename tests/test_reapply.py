@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import time
+import unittest
+
+from PyQt6 import QtCore
+
+from picard.metadata import Metadata
+
+from .. import (
+    DEFAULT_VARIABLE,
+    LOADED_TRACKS,
+    CombinePerformerTags,
+    ExampleMetadata,
+    PluginOptions,
+    _reapply_steps,
+    enable,
+    reapply_settings,
+)
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+from . import qt_application
+
+
+class CountingTrack(OfflineTrack):
+    """Track counting the refreshes of its display.
+    """
+
+    def __init__(self, album: OfflineAlbum) -> None:
+        super().__init__(album)
+        self.updates = 0
+
+    def update(self) -> None:
+        self.updates += 1
+
+
+def _run_steps(steps) -> tuple:
+    try:
+        while True:
+            next(steps)
+    except StopIteration as e:
+        return e.value
+
+
+class ReapplySettingsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = qt_application()
+
+    def setUp(self):
+        self.api = OfflinePluginApi(plugin_config={})
+        enable(self.api)
+        self.process = self.api.registered['register_track_metadata_processor'][0]
+        # Only re-apply the settings to the tracks loaded by the test
+        LOADED_TRACKS.clear()
+
+    def _load_tracks(self, album: OfflineAlbum, count: int) -> list:
+        tracks = []
+        for number in range(1, count + 1):
+            track = CountingTrack(album)
+            track.metadata = Metadata()
+            recording = {'id': f"reapply-{album.id}-{number}", 'relations': ExampleMetadata.RELS}
+            self.process(track, track.metadata, {'number': str(number), 'recording': recording}, {'id': album.id})
+            for name in ('orig_metadata', 'scripted_metadata'):
+                setattr(track, name, Metadata(track.metadata))
+            tracks.append(track)
+        return tracks
+
+    def _profiles(self) -> list:
+        options = PluginOptions(self.api)
+        options.load_from_config()
+        return [(DEFAULT_VARIABLE, options)]
+
+    def _steps(self, tracks: list):
+        return _reapply_steps(self.api, [(x, LOADED_TRACKS[x]) for x in tracks], self._profiles())
+
+    def _expected(self) -> list:
+        options = self._profiles()[0][1]
+        return CombinePerformerTags(ExampleMetadata.RELS, options).get_performers(options)
+
+    def test_unchanged_settings(self):
+        album = OfflineAlbum('unchanged')
+        album.loaded = True
+        tracks = self._load_tracks(album, 3)
+        self.assertEqual(_run_steps(self._steps(tracks)), (0, 3))
+        self.assertEqual([x.updates for x in tracks], [0, 0, 0])
+
+    def test_changed_settings(self):
+        album = OfflineAlbum('changed')
+        album.loaded = True
+        tracks = self._load_tracks(album, 3)
+        before = tracks[0].metadata.getall(f"~{DEFAULT_VARIABLE}")
+        self.api.plugin_config['group_by_artist'] = False
+        self.assertEqual(_run_steps(self._steps(tracks)), (3, 3))
+        expected = self._expected()
+        self.assertNotEqual(expected, before)
+        for track in tracks:
+            for metadata in (track.orig_metadata, track.scripted_metadata, track.metadata):
+                self.assertEqual(metadata.getall(f"~{DEFAULT_VARIABLE}"), expected)
+            self.assertEqual(track.updates, 1)
+
+    def test_loading_album_skipped(self):
+        album = OfflineAlbum('loading')
+        tracks = self._load_tracks(album, 2)
+        self.api.plugin_config['group_by_artist'] = False
+        self.assertEqual(_run_steps(self._steps(tracks)), (0, 0))
+
+    def test_reapply_from_event_loop(self):
+        album = OfflineAlbum('event-loop')
+        album.loaded = True
+        track = self._load_tracks(album, 1)[0]
+        self.api.plugin_config['group_by_artist'] = False
+        with self.assertLogs(self.api.logger, 'INFO') as logs:
+            reapply_settings(self.api)
+            # The tracks are processed from the event loop
+            self.assertEqual(track.updates, 0)
+            end = time.perf_counter() + 10
+            while not logs.output and time.perf_counter() < end:
+                self.app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 10)
+        self.assertIn('Re-applied the settings', logs.output[0])
+        self.assertEqual(track.metadata.getall(f"~{DEFAULT_VARIABLE}"), self._expected())
+
+
+if __name__ == '__main__':
+    unittest.main()
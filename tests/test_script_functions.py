@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+from types import SimpleNamespace
+import unittest
+
+from picard.metadata import (
+    MULTI_VALUED_JOINER,
+    Metadata,
+)
+
+from .. import (
+    DEFAULT_VARIABLE,
+    PROCESSOR_CACHE,
+    PROCESSOR_CACHE_SIZE,
+    ExampleMetadata,
+    enable,
+    script_performers,
+)
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+
+
+class ScriptPerformersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = OfflinePluginApi(plugin_config={})
+        enable(self.api)
+        self.process = self.api.registered['register_track_metadata_processor'][0]
+        self.album = OfflineAlbum('album')
+        self.album.loaded = True
+
+    def _process(self, recording_id: str) -> OfflineTrack:
+        track = OfflineTrack(self.album)
+        track.metadata = Metadata()
+        recording = {'id': recording_id, 'relations': ExampleMetadata.RELS}
+        self.process(track, track.metadata, {'number': '1', 'recording': recording}, {'id': 'album'})
+        return track
+
+    @staticmethod
+    def _evict_recordings() -> None:
+        for i in range(PROCESSOR_CACHE_SIZE):
+            PROCESSOR_CACHE.add(f"evict-{i}", None)
+
+    def test_loaded_track_after_cache_eviction(self):
+        track = self._process('script-loaded')
+        self._evict_recordings()
+        self.assertIsNone(PROCESSOR_CACHE.get('script-loaded'))
+        parser = SimpleNamespace(
+            context={'musicbrainz_recordingid': 'script-loaded'},
+            file=SimpleNamespace(parent_item=track),
+        )
+        self.assertEqual(
+            script_performers(self.api, parser).split(MULTI_VALUED_JOINER),
+            track.metadata.getall(f"~{DEFAULT_VARIABLE}"),
+        )
+
+    def test_missing_recording_is_logged(self):
+        parser = SimpleNamespace(context={'musicbrainz_recordingid': 'script-missing'}, file=None)
+        with self.assertLogs(self.api.logger, 'WARNING') as logs:
+            self.assertEqual(script_performers(self.api, parser), '')
+        self.assertIn('script-missing', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+
+import json
+from unittest import mock
+import unittest
+
+from .. import ExampleMetadata
+from ..service import PerformerService
+
+
+class PerformerServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.service = PerformerService(max_concurrency=1)
+
+    def _post(self, recording: dict) -> tuple:
+        status, response = self.service.handle('POST', '/performers', json.dumps({'recording': recording}).encode('utf-8'))
+        return status, response.get('performers')
+
+    def test_same_id_with_different_relations(self):
+        status, first = self._post({'id': 'r1', 'relations': ExampleMetadata.RELS})
+        self.assertEqual(status, 200)
+        status, second = self._post({'id': 'r1', 'relations': ExampleMetadata.RELS[:1]})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(first, second)
+        self.assertEqual(second, self._post({'id': 'r2', 'relations': ExampleMetadata.RELS[:1]})[1])
+
+    def test_same_id_with_same_relations_is_cached(self):
+        recording = {'id': 'r3', 'relations': ExampleMetadata.RELS}
+        _status, first = self._post(recording)
+        key = self.service.cache_key('r3', ExampleMetadata.RELS)
+        self.assertIsNotNone(self.service.processors.get(key))
+        self.assertEqual(self._post(recording)[1], first)
+
+    def _post_options(self, options) -> tuple:
+        request = {'recording': {'id': 'r4', 'relations': ExampleMetadata.RELS}, 'options': options}
+        return self.service.handle('POST', '/performers', json.dumps(request).encode('utf-8'))
+
+    def test_invalid_settings_are_refused(self):
+        for options in (
+            {'sort_order': 'x'},
+            {'instrument_grouping_level': 99},
+            {'instrument_grouping_level': 1.0},
+            {'cred_artist': 1},
+            {'group_by_artist': 0},
+            {'format_group_1_start_char': 5},
+            {'unknown_setting': True},
+        ):
+            with self.subTest(options=options):
+                status, response = self._post_options(options)
+                self.assertEqual(status, 400)
+                self.assertIn(next(iter(options)), response['error'])
+
+    def test_valid_settings_are_accepted(self):
+        status, response = self._post_options({'sort_order': 2, 'group_by_artist': False, 'cred_artist': False, 'format_group_1_start_char': '['})
+        self.assertEqual(status, 200)
+        self.assertTrue(response['performers'])
+
+    def test_unexpected_error_returns_json(self):
+        with mock.patch.object(self.service, 'combine', side_effect=ValueError('broken')):
+            with self.assertLogs(self.service.api.logger, 'ERROR'):
+                status, response = self._post_options(None)
+        self.assertEqual(status, 500)
+        self.assertIn('error', response)
+        # The processing slot is released after the error
+        self.assertEqual(self._post({'id': 'r5', 'relations': ExampleMetadata.RELS})[0], 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
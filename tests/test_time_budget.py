@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+from contextlib import closing
+import os
+import sqlite3
+import tempfile
+from types import SimpleNamespace
+import time
+import unittest
+
+from picard.metadata import (
+    MULTI_VALUED_JOINER,
+    Metadata,
+)
+
+from .. import (
+    CHUNK_THRESHOLD_KEY,
+    COPERFORMANCE_FILE_KEY,
+    COPERFORMANCE_GRAPH,
+    DEFAULT_VARIABLE,
+    LOADED_TRACKS,
+    PERFORMER_INDEX,
+    PROCESSOR_CACHE,
+    TIME_BUDGET_KEY,
+    TRUNCATED_VARIABLE,
+    CombinePerformerTags,
+    ExampleMetadata,
+    PluginOptions,
+    _reapply_steps,
+    enable,
+    script_performers,
+)
+from ..benchmark import make_relations
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+
+
+class TimeBudgetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = OfflinePluginApi(plugin_config={CHUNK_THRESHOLD_KEY: 0})
+        enable(self.api)
+        self.process = self.api.registered['register_track_metadata_processor'][0]
+        self.album = OfflineAlbum('album')
+        self.album.loaded = True
+
+    def _process(self, recording_id: str, relations: list, budget: int) -> OfflineTrack:
+        self.api.plugin_config[TIME_BUDGET_KEY] = budget
+        track = OfflineTrack(self.album)
+        track.metadata = Metadata()
+        self.process(track, track.metadata, {'number': '1', 'recording': {'id': recording_id, 'relations': relations}}, {'id': 'album'})
+        for name in ('orig_metadata', 'scripted_metadata'):
+            setattr(track, name, Metadata(track.metadata))
+        return track
+
+    def _full_output(self, relations: list) -> list:
+        options = PluginOptions(self.api)
+        options.load_from_config()
+        return CombinePerformerTags(relations, options).get_performers(options)
+
+    def _script_output(self, recording_id: str) -> list:
+        parser = SimpleNamespace(context={'musicbrainz_recordingid': recording_id}, file=None)
+        return script_performers(self.api, parser).split(MULTI_VALUED_JOINER)
+
+    def test_script_function_after_budget_expires(self):
+        relations = ExampleMetadata.RELS
+        track = self._process('budget-script', relations, 20)
+        self.assertFalse(track.metadata[f"~{TRUNCATED_VARIABLE}"])
+        time.sleep(0.05)
+        self.assertEqual(self._script_output('budget-script'), self._full_output(relations))
+        self.assertEqual(track.metadata.getall(f"~{DEFAULT_VARIABLE}"), self._full_output(relations))
+
+    def test_reapply_after_budget_expires(self):
+        relations = ExampleMetadata.RELS
+        track = self._process('budget-reapply', relations, 20)
+        time.sleep(0.05)
+        options = PluginOptions(self.api)
+        options.load_from_config()
+        steps = _reapply_steps(self.api, [(track, LOADED_TRACKS[track])], [(DEFAULT_VARIABLE, options)])
+        with self.assertRaises(StopIteration) as result:
+            while True:
+                next(steps)
+        self.assertEqual(result.exception.value, (0, 1))
+        self.assertEqual(track.metadata.getall(f"~{DEFAULT_VARIABLE}"), self._full_output(relations))
+
+    def test_truncated_records_are_parsed_again(self):
+        relations = make_relations(20000)
+        track = self._process('budget-truncated', relations, 1)
+        self.assertEqual(track.metadata[f"~{TRUNCATED_VARIABLE}"], '1')
+        self.assertNotIn(track, LOADED_TRACKS)
+        processor = PROCESSOR_CACHE.get('budget-truncated')
+        self.assertFalse(processor.degraded)
+        self.assertEqual(self._script_output('budget-truncated'), self._full_output(relations))
+
+    def test_truncated_records_are_not_indexed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            graph_path = os.path.join(directory, 'graph.csv')
+            index_path = os.path.join(directory, 'index.db')
+            self.api.plugin_config[COPERFORMANCE_FILE_KEY] = graph_path
+            PERFORMER_INDEX.open(self.api, index_path)
+            try:
+                for recording_id, relations, budget, indexed in (
+                    ('budget-index-truncated', make_relations(20000), 1, False),
+                    ('budget-index-full', ExampleMetadata.RELS, 0, True),
+                ):
+                    self._process(recording_id, relations, budget)
+                    COPERFORMANCE_GRAPH.flush()
+                    self.assertEqual(os.path.exists(graph_path), indexed)
+                    with closing(sqlite3.connect(index_path)) as connection:
+                        rows = connection.execute('SELECT COUNT(*) FROM performances WHERE recording_id = ?', (recording_id,)).fetchone()[0]
+                    self.assertEqual(bool(rows), indexed)
+            finally:
+                PERFORMER_INDEX.close()
+                self.api.plugin_config[COPERFORMANCE_FILE_KEY] = ''
+
+
+if __name__ == '__main__':
+    unittest.main()
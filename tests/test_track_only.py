@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024-2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+import unittest
+
+from picard.metadata import Metadata
+
+from .. import (
+    ALBUM_COMMON_PERFORMERS,
+    DEFAULT_VARIABLE,
+    LOADED_TRACKS,
+    TRACK_ONLY_VARIABLE,
+    CombinePerformerTags,
+    ExampleMetadata,
+    PluginOptions,
+    _reapply_steps,
+    enable,
+)
+from ..offline_api import (
+    OfflineAlbum,
+    OfflinePluginApi,
+    OfflineTrack,
+)
+
+
+GUEST = {
+    'type': 'instrument',
+    'artist': {'id': 'guest', 'name': 'Guest Player', 'sort-name': 'Player, Guest'},
+    'attribute-credits': {},
+    'attribute-ids': {},
+    'attributes': ['guest', 'kazoo'],
+    'target-credit': '',
+}
+
+
+class TrackOnlyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = OfflinePluginApi(plugin_config={})
+        enable(self.api)
+        self.process = self.api.registered['register_track_metadata_processor'][0]
+
+    def _load_album(self, album: OfflineAlbum, relations: list) -> list:
+        tracks = []
+        for number, track_relations in enumerate(relations, start=1):
+            track = OfflineTrack(album)
+            for name in ('metadata', 'orig_metadata', 'scripted_metadata'):
+                setattr(track, name, Metadata())
+            recording = {'id': f"{album.id}-{number}", 'relations': track_relations}
+            self.process(track, track.metadata, {'number': str(number), 'recording': recording}, {'id': album.id})
+            for name in ('orig_metadata', 'scripted_metadata'):
+                getattr(track, name).update(track.metadata)
+            tracks.append(track)
+        return tracks
+
+    def _options(self) -> PluginOptions:
+        options = PluginOptions(self.api)
+        options.load_from_config()
+        return options
+
+    def _performers(self, relations: list) -> list:
+        options = self._options()
+        return CombinePerformerTags(relations, options).get_performers(options)
+
+    @staticmethod
+    def _track_only(track: OfflineTrack) -> list:
+        return track.metadata.getall(f"~{TRACK_ONLY_VARIABLE}")
+
+    def test_performers_specific_to_each_track(self):
+        rels = ExampleMetadata.RELS
+        album = OfflineAlbum('track-only')
+        tracks = self._load_album(album, [rels, rels + [GUEST], rels[1:]])
+        self.assertEqual([self._track_only(x) for x in tracks], [[], [], []])
+        album.finish_loading()
+        self.assertEqual(self._track_only(tracks[0]), self._performers(rels[:1]))
+        self.assertEqual(self._track_only(tracks[1]), self._performers([rels[0], GUEST]))
+        self.assertEqual(self._track_only(tracks[2]), [])
+        for track in tracks:
+            self.assertEqual(track.orig_metadata.getall(f"~{TRACK_ONLY_VARIABLE}"), self._track_only(track))
+
+    def test_single_track_album(self):
+        album = OfflineAlbum('single-track')
+        track = self._load_album(album, [ExampleMetadata.RELS])[0]
+        album.finish_loading()
+        self.assertEqual(self._track_only(track), track.metadata.getall(f"~{DEFAULT_VARIABLE}"))
+
+    def test_removed_album(self):
+        album = OfflineAlbum('removed')
+        tracks = self._load_album(album, [ExampleMetadata.RELS, ExampleMetadata.RELS + [GUEST]])
+        ALBUM_COMMON_PERFORMERS.discard(album)
+        album.finish_loading()
+        self.assertEqual(self._track_only(tracks[1]), [])
+
+    def test_reapply_updates_variable(self):
+        rels = ExampleMetadata.RELS
+        album = OfflineAlbum('track-only-reapply')
+        tracks = self._load_album(album, [rels, rels + [GUEST]])
+        album.finish_loading()
+        self.api.plugin_config['group_by_artist'] = False
+        steps = _reapply_steps(self.api, [(x, LOADED_TRACKS[x]) for x in tracks], [(DEFAULT_VARIABLE, self._options())])
+        with self.assertRaises(StopIteration):
+            while True:
+                next(steps)
+        self.assertEqual(self._track_only(tracks[1]), self._performers([GUEST]))
+
+
+if __name__ == '__main__':
+    unittest.main()
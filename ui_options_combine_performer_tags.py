@@ -48,6 +48,44 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         self.page_description.setObjectName("page_description")
         self.verticalLayout_3.addWidget(self.page_description)
         self.verticalLayout_2.addWidget(self.page_description_frame)
+        self.section_profiles_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_profiles_title.setFont(font)
+        self.section_profiles_title.setObjectName("section_profiles_title")
+        self.verticalLayout_2.addWidget(self.section_profiles_title)
+        self.section_profiles_frame = QtWidgets.QFrame(parent=self.scrollAreaWidgetContents)
+        self.section_profiles_frame.setObjectName("section_profiles_frame")
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout(self.section_profiles_frame)
+        self.verticalLayout_11.setContentsMargins(-1, 0, -1, -1)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.section_profiles_description = QtWidgets.QLabel(parent=self.section_profiles_frame)
+        self.section_profiles_description.setTextFormat(QtCore.Qt.TextFormat.MarkdownText)
+        self.section_profiles_description.setWordWrap(True)
+        self.section_profiles_description.setObjectName("section_profiles_description")
+        self.verticalLayout_11.addWidget(self.section_profiles_description)
+        self.horizontalLayout_12 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_12.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
+        self.section_profiles_label_profile = QtWidgets.QLabel(parent=self.section_profiles_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_profiles_label_profile.setFont(font)
+        self.section_profiles_label_profile.setObjectName("section_profiles_label_profile")
+        self.horizontalLayout_12.addWidget(self.section_profiles_label_profile)
+        self.profile_selector = QtWidgets.QComboBox(parent=self.section_profiles_frame)
+        self.profile_selector.setObjectName("profile_selector")
+        self.horizontalLayout_12.addWidget(self.profile_selector)
+        self.profile_add = QtWidgets.QPushButton(parent=self.section_profiles_frame)
+        self.profile_add.setObjectName("profile_add")
+        self.horizontalLayout_12.addWidget(self.profile_add)
+        self.profile_remove = QtWidgets.QPushButton(parent=self.section_profiles_frame)
+        self.profile_remove.setObjectName("profile_remove")
+        self.horizontalLayout_12.addWidget(self.profile_remove)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_12.addItem(spacerItem)
+        self.verticalLayout_11.addLayout(self.horizontalLayout_12)
+        self.verticalLayout_2.addWidget(self.section_profiles_frame)
         self.section_standard_or_credited_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
         font = QtGui.QFont()
         font.setBold(True)
@@ -78,6 +116,33 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         self.cb_credited_vocals.setObjectName("cb_credited_vocals")
         self.verticalLayout_6.addWidget(self.cb_credited_vocals)
         self.verticalLayout_4.addLayout(self.verticalLayout_6)
+        self.horizontalLayout_17 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_17.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_17.setObjectName("horizontalLayout_17")
+        self.section_standard_or_credited_label_artist_name = QtWidgets.QLabel(parent=self.section_standard_or_credited_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_standard_or_credited_label_artist_name.setFont(font)
+        self.section_standard_or_credited_label_artist_name.setObjectName("section_standard_or_credited_label_artist_name")
+        self.horizontalLayout_17.addWidget(self.section_standard_or_credited_label_artist_name)
+        self.widget_7 = QtWidgets.QWidget(parent=self.section_standard_or_credited_frame)
+        self.widget_7.setObjectName("widget_7")
+        self.horizontalLayout_18 = QtWidgets.QHBoxLayout(self.widget_7)
+        self.horizontalLayout_18.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_18.setObjectName("horizontalLayout_18")
+        self.artist_name_rb_1 = QtWidgets.QRadioButton(parent=self.widget_7)
+        self.artist_name_rb_1.setObjectName("artist_name_rb_1")
+        self.horizontalLayout_18.addWidget(self.artist_name_rb_1)
+        self.artist_name_rb_2 = QtWidgets.QRadioButton(parent=self.widget_7)
+        self.artist_name_rb_2.setObjectName("artist_name_rb_2")
+        self.horizontalLayout_18.addWidget(self.artist_name_rb_2)
+        self.artist_name_rb_3 = QtWidgets.QRadioButton(parent=self.widget_7)
+        self.artist_name_rb_3.setObjectName("artist_name_rb_3")
+        self.horizontalLayout_18.addWidget(self.artist_name_rb_3)
+        self.horizontalLayout_17.addWidget(self.widget_7)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_17.addItem(spacerItem1)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_17)
         self.verticalLayout_2.addWidget(self.section_standard_or_credited_frame)
         self.includes_section_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
         font = QtGui.QFont()
@@ -147,8 +212,8 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         self.section_includes_label_vocal_types.setObjectName("section_includes_label_vocal_types")
         self.gridLayout.addWidget(self.section_includes_label_vocal_types, 3, 0, 1, 1)
         self.horizontalLayout.addLayout(self.gridLayout)
-        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout.addItem(spacerItem)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(spacerItem2)
         self.verticalLayout_5.addLayout(self.horizontalLayout)
         self.verticalLayout_2.addWidget(self.section_includes_frame)
         self.section_grouping_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
@@ -186,9 +251,75 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         self.rb_group_instrument = QtWidgets.QRadioButton(parent=self.section_grouping_frame)
         self.rb_group_instrument.setObjectName("rb_group_instrument")
         self.horizontalLayout_6.addWidget(self.rb_group_instrument)
-        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_6.addItem(spacerItem1)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_6.addItem(spacerItem3)
         self.verticalLayout_10.addLayout(self.horizontalLayout_6)
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.section_grouping_label_level = QtWidgets.QLabel(parent=self.section_grouping_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_grouping_label_level.setFont(font)
+        self.section_grouping_label_level.setObjectName("section_grouping_label_level")
+        self.horizontalLayout_10.addWidget(self.section_grouping_label_level)
+        self.widget_5 = QtWidgets.QWidget(parent=self.section_grouping_frame)
+        self.widget_5.setObjectName("widget_5")
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout(self.widget_5)
+        self.horizontalLayout_11.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.level_rb_1 = QtWidgets.QRadioButton(parent=self.widget_5)
+        self.level_rb_1.setObjectName("level_rb_1")
+        self.horizontalLayout_11.addWidget(self.level_rb_1)
+        self.level_rb_2 = QtWidgets.QRadioButton(parent=self.widget_5)
+        self.level_rb_2.setObjectName("level_rb_2")
+        self.horizontalLayout_11.addWidget(self.level_rb_2)
+        self.level_rb_3 = QtWidgets.QRadioButton(parent=self.widget_5)
+        self.level_rb_3.setObjectName("level_rb_3")
+        self.horizontalLayout_11.addWidget(self.level_rb_3)
+        self.horizontalLayout_10.addWidget(self.widget_5)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_10.addItem(spacerItem4)
+        self.verticalLayout_10.addLayout(self.horizontalLayout_10)
+        self.horizontalLayout_15 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_15.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_15.setObjectName("horizontalLayout_15")
+        self.section_grouping_label_sort = QtWidgets.QLabel(parent=self.section_grouping_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_grouping_label_sort.setFont(font)
+        self.section_grouping_label_sort.setObjectName("section_grouping_label_sort")
+        self.horizontalLayout_15.addWidget(self.section_grouping_label_sort)
+        self.widget_6 = QtWidgets.QWidget(parent=self.section_grouping_frame)
+        self.widget_6.setObjectName("widget_6")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.widget_6)
+        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.sort_rb_1 = QtWidgets.QRadioButton(parent=self.widget_6)
+        self.sort_rb_1.setObjectName("sort_rb_1")
+        self.verticalLayout_13.addWidget(self.sort_rb_1)
+        self.sort_rb_2 = QtWidgets.QRadioButton(parent=self.widget_6)
+        self.sort_rb_2.setObjectName("sort_rb_2")
+        self.verticalLayout_13.addWidget(self.sort_rb_2)
+        self.sort_rb_3 = QtWidgets.QRadioButton(parent=self.widget_6)
+        self.sort_rb_3.setObjectName("sort_rb_3")
+        self.verticalLayout_13.addWidget(self.sort_rb_3)
+        self.sort_rb_4 = QtWidgets.QRadioButton(parent=self.widget_6)
+        self.sort_rb_4.setObjectName("sort_rb_4")
+        self.verticalLayout_13.addWidget(self.sort_rb_4)
+        self.sort_rb_5 = QtWidgets.QRadioButton(parent=self.widget_6)
+        self.sort_rb_5.setObjectName("sort_rb_5")
+        self.verticalLayout_13.addWidget(self.sort_rb_5)
+        self.horizontalLayout_15.addWidget(self.widget_6)
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_15.addItem(spacerItem5)
+        self.verticalLayout_10.addLayout(self.horizontalLayout_15)
+        self.cb_normalize_keys = QtWidgets.QCheckBox(parent=self.section_grouping_frame)
+        self.cb_normalize_keys.setObjectName("cb_normalize_keys")
+        self.verticalLayout_10.addWidget(self.cb_normalize_keys)
+        self.cb_other_performers = QtWidgets.QCheckBox(parent=self.section_grouping_frame)
+        self.cb_other_performers.setObjectName("cb_other_performers")
+        self.verticalLayout_10.addWidget(self.cb_other_performers)
         self.verticalLayout_2.addWidget(self.section_grouping_frame)
         self.keywords_section_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
         font = QtGui.QFont()
@@ -293,8 +424,8 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         self.solo_rb_4.setObjectName("solo_rb_4")
         self.horizontalLayout_8.addWidget(self.solo_rb_4)
         self.gridLayout_3.addWidget(self.widget_3, 2, 1, 1, 1)
-        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.gridLayout_3.addItem(spacerItem2, 0, 5, 1, 1)
+        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_3.addItem(spacerItem6, 0, 5, 1, 1)
         self.section_keywords_label_additional = QtWidgets.QLabel(parent=self.section_keywords_frame)
         font = QtGui.QFont()
         font.setBold(True)
@@ -386,8 +517,8 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         self.format_group_4_start_char.setText(" (")
         self.format_group_4_start_char.setObjectName("format_group_4_start_char")
         self.gridLayout_2.addWidget(self.format_group_4_start_char, 6, 1, 1, 1, QtCore.Qt.AlignmentFlag.AlignHCenter)
-        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.gridLayout_2.addItem(spacerItem3, 2, 4, 1, 1)
+        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_2.addItem(spacerItem7, 2, 4, 1, 1)
         self.section_display_label_4 = QtWidgets.QLabel(parent=self.section_dosplay_frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Preferred)
         sizePolicy.setHorizontalStretch(0)
@@ -492,6 +623,117 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         self.gridLayout_2.addWidget(self.section_display_label_start, 2, 1, 1, 1, QtCore.Qt.AlignmentFlag.AlignHCenter)
         self.verticalLayout_8.addLayout(self.gridLayout_2)
         self.verticalLayout_2.addWidget(self.section_dosplay_frame)
+        self.section_processing_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_processing_title.setFont(font)
+        self.section_processing_title.setObjectName("section_processing_title")
+        self.verticalLayout_2.addWidget(self.section_processing_title)
+        self.section_processing_frame = QtWidgets.QFrame(parent=self.scrollAreaWidgetContents)
+        self.section_processing_frame.setObjectName("section_processing_frame")
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.section_processing_frame)
+        self.verticalLayout_12.setContentsMargins(-1, 0, -1, -1)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.section_processing_description = QtWidgets.QLabel(parent=self.section_processing_frame)
+        self.section_processing_description.setTextFormat(QtCore.Qt.TextFormat.MarkdownText)
+        self.section_processing_description.setWordWrap(True)
+        self.section_processing_description.setObjectName("section_processing_description")
+        self.verticalLayout_12.addWidget(self.section_processing_description)
+        self.horizontalLayout_13 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_13.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_13.setObjectName("horizontalLayout_13")
+        self.section_processing_label_chunk_threshold = QtWidgets.QLabel(parent=self.section_processing_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_processing_label_chunk_threshold.setFont(font)
+        self.section_processing_label_chunk_threshold.setObjectName("section_processing_label_chunk_threshold")
+        self.horizontalLayout_13.addWidget(self.section_processing_label_chunk_threshold)
+        self.chunk_threshold = QtWidgets.QSpinBox(parent=self.section_processing_frame)
+        self.chunk_threshold.setMaximum(1000000)
+        self.chunk_threshold.setSingleStep(500)
+        self.chunk_threshold.setObjectName("chunk_threshold")
+        self.horizontalLayout_13.addWidget(self.chunk_threshold)
+        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_13.addItem(spacerItem8)
+        self.verticalLayout_12.addLayout(self.horizontalLayout_13)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.section_processing_label_time_budget = QtWidgets.QLabel(parent=self.section_processing_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_processing_label_time_budget.setFont(font)
+        self.section_processing_label_time_budget.setObjectName("section_processing_label_time_budget")
+        self.horizontalLayout_3.addWidget(self.section_processing_label_time_budget)
+        self.time_budget = QtWidgets.QSpinBox(parent=self.section_processing_frame)
+        self.time_budget.setMaximum(60000)
+        self.time_budget.setSingleStep(100)
+        self.time_budget.setObjectName("time_budget")
+        self.horizontalLayout_3.addWidget(self.time_budget)
+        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem9)
+        self.verticalLayout_12.addLayout(self.horizontalLayout_3)
+        self.horizontalLayout_14 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_14.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_14.setObjectName("horizontalLayout_14")
+        self.section_processing_label_compare_tag = QtWidgets.QLabel(parent=self.section_processing_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_processing_label_compare_tag.setFont(font)
+        self.section_processing_label_compare_tag.setObjectName("section_processing_label_compare_tag")
+        self.horizontalLayout_14.addWidget(self.section_processing_label_compare_tag)
+        self.compare_tag = QtWidgets.QLineEdit(parent=self.section_processing_frame)
+        self.compare_tag.setObjectName("compare_tag")
+        self.horizontalLayout_14.addWidget(self.compare_tag)
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_14.addItem(spacerItem10)
+        self.verticalLayout_12.addLayout(self.horizontalLayout_14)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.section_processing_label_coperformance_file = QtWidgets.QLabel(parent=self.section_processing_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_processing_label_coperformance_file.setFont(font)
+        self.section_processing_label_coperformance_file.setObjectName("section_processing_label_coperformance_file")
+        self.horizontalLayout_4.addWidget(self.section_processing_label_coperformance_file)
+        self.coperformance_file = QtWidgets.QLineEdit(parent=self.section_processing_frame)
+        self.coperformance_file.setObjectName("coperformance_file")
+        self.horizontalLayout_4.addWidget(self.coperformance_file)
+        self.verticalLayout_12.addLayout(self.horizontalLayout_4)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.section_processing_label_index_file = QtWidgets.QLabel(parent=self.section_processing_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_processing_label_index_file.setFont(font)
+        self.section_processing_label_index_file.setObjectName("section_processing_label_index_file")
+        self.horizontalLayout_5.addWidget(self.section_processing_label_index_file)
+        self.index_file = QtWidgets.QLineEdit(parent=self.section_processing_frame)
+        self.index_file.setObjectName("index_file")
+        self.horizontalLayout_5.addWidget(self.index_file)
+        self.verticalLayout_12.addLayout(self.horizontalLayout_5)
+        self.horizontalLayout_16 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_16.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_16.setObjectName("horizontalLayout_16")
+        self.section_processing_label_credits_file = QtWidgets.QLabel(parent=self.section_processing_frame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_processing_label_credits_file.setFont(font)
+        self.section_processing_label_credits_file.setObjectName("section_processing_label_credits_file")
+        self.horizontalLayout_16.addWidget(self.section_processing_label_credits_file)
+        self.credits_file = QtWidgets.QLineEdit(parent=self.section_processing_frame)
+        self.credits_file.setObjectName("credits_file")
+        self.horizontalLayout_16.addWidget(self.credits_file)
+        self.verticalLayout_12.addLayout(self.horizontalLayout_16)
+        self.cb_memory_profiling = QtWidgets.QCheckBox(parent=self.section_processing_frame)
+        self.cb_memory_profiling.setObjectName("cb_memory_profiling")
+        self.verticalLayout_12.addWidget(self.cb_memory_profiling)
+        self.cb_decision_trace = QtWidgets.QCheckBox(parent=self.section_processing_frame)
+        self.cb_decision_trace.setObjectName("cb_decision_trace")
+        self.verticalLayout_12.addWidget(self.cb_decision_trace)
+        self.verticalLayout_2.addWidget(self.section_processing_frame)
         self.section_example_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
         font = QtGui.QFont()
         font.setBold(True)
@@ -528,11 +770,20 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         CombinePerformerTagsOptionsPage.setWindowTitle(_translate("CombinePerformerTagsOptionsPage", "form.title"))
         self.page_title.setText(_translate("CombinePerformerTagsOptionsPage", "page.title"))
         self.page_description.setText(_translate("CombinePerformerTagsOptionsPage", "page.description"))
+        self.section_profiles_title.setText(_translate("CombinePerformerTagsOptionsPage", "section.profiles.title"))
+        self.section_profiles_description.setText(_translate("CombinePerformerTagsOptionsPage", "section.profiles.text"))
+        self.section_profiles_label_profile.setText(_translate("CombinePerformerTagsOptionsPage", "section.profiles.label.profile"))
+        self.profile_add.setText(_translate("CombinePerformerTagsOptionsPage", "section.profiles.button.add"))
+        self.profile_remove.setText(_translate("CombinePerformerTagsOptionsPage", "section.profiles.button.remove"))
         self.section_standard_or_credited_title.setText(_translate("CombinePerformerTagsOptionsPage", "section.standard_or_credited.title"))
         self.section_standard_or_credited_description.setText(_translate("CombinePerformerTagsOptionsPage", "section.standard_or_credited.text"))
         self.cb_credited_artists.setText(_translate("CombinePerformerTagsOptionsPage", "option.credited_artists"))
         self.cb_credited_instruments.setText(_translate("CombinePerformerTagsOptionsPage", "option.credited_instruments"))
         self.cb_credited_vocals.setText(_translate("CombinePerformerTagsOptionsPage", "option.credited_vocals"))
+        self.section_standard_or_credited_label_artist_name.setText(_translate("CombinePerformerTagsOptionsPage", "section.standard_or_credited.label.artist_name"))
+        self.artist_name_rb_1.setText(_translate("CombinePerformerTagsOptionsPage", "section.standard_or_credited.rb.artist_name.first"))
+        self.artist_name_rb_2.setText(_translate("CombinePerformerTagsOptionsPage", "section.standard_or_credited.rb.artist_name.most_common"))
+        self.artist_name_rb_3.setText(_translate("CombinePerformerTagsOptionsPage", "section.standard_or_credited.rb.artist_name.artist"))
         self.includes_section_title.setText(_translate("CombinePerformerTagsOptionsPage", "section.includes.title"))
         self.section_includes_text.setText(_translate("CombinePerformerTagsOptionsPage", "section.includes.text"))
         self.cb_guest_vocals.setText(_translate("CombinePerformerTagsOptionsPage", "section.includes.cb.vocals"))
@@ -551,6 +802,18 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         self.section_grouping_label_group_by.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.label.group_by"))
         self.rb_group_artist.setText(_translate("CombinePerformerTagsOptionsPage", "section.group.rb.artist"))
         self.rb_group_instrument.setText(_translate("CombinePerformerTagsOptionsPage", "section.group.rb.instrument_vocal"))
+        self.section_grouping_label_level.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.label.level"))
+        self.level_rb_1.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.rb.level.exact"))
+        self.level_rb_2.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.rb.level.family"))
+        self.level_rb_3.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.rb.level.top"))
+        self.section_grouping_label_sort.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.label.sort"))
+        self.sort_rb_1.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.rb.sort.alphabetical"))
+        self.sort_rb_2.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.rb.sort.relation"))
+        self.sort_rb_3.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.rb.sort.lead_vocals"))
+        self.sort_rb_4.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.rb.sort.soloists"))
+        self.sort_rb_5.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.rb.sort.family"))
+        self.cb_normalize_keys.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.cb.normalize_keys"))
+        self.cb_other_performers.setText(_translate("CombinePerformerTagsOptionsPage", "section.grouping.cb.other_performers"))
         self.keywords_section_title.setText(_translate("CombinePerformerTagsOptionsPage", "section.keywords.title"))
         self.section_keywords_description.setText(_translate("CombinePerformerTagsOptionsPage", "section.keywords.text"))
         self.section_keywords_label_additional.setText(_translate("CombinePerformerTagsOptionsPage", "section.label.additional"))
@@ -578,4 +841,22 @@ class Ui_CombinePerformerTagsOptionsPage(object):
         self.format_group_3_end_char.setPlaceholderText(_translate("CombinePerformerTagsOptionsPage", "section.display.default.blank"))
         self.format_group_1_sep_char.setPlaceholderText(_translate("CombinePerformerTagsOptionsPage", "section.display.default.blank"))
         self.section_display_label_start.setText(_translate("CombinePerformerTagsOptionsPage", "section.display.label.start"))
+        self.section_processing_title.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.title"))
+        self.section_processing_description.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.text"))
+        self.section_processing_label_chunk_threshold.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.label.chunk_threshold"))
+        self.chunk_threshold.setSpecialValueText(_translate("CombinePerformerTagsOptionsPage", "section.processing.chunk_threshold.never"))
+        self.chunk_threshold.setSuffix(_translate("CombinePerformerTagsOptionsPage", "section.processing.chunk_threshold.suffix"))
+        self.section_processing_label_time_budget.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.label.time_budget"))
+        self.time_budget.setSpecialValueText(_translate("CombinePerformerTagsOptionsPage", "section.processing.time_budget.unlimited"))
+        self.time_budget.setSuffix(_translate("CombinePerformerTagsOptionsPage", "section.processing.time_budget.suffix"))
+        self.section_processing_label_compare_tag.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.label.compare_tag"))
+        self.compare_tag.setPlaceholderText(_translate("CombinePerformerTagsOptionsPage", "section.processing.compare_tag.placeholder"))
+        self.section_processing_label_coperformance_file.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.label.coperformance_file"))
+        self.coperformance_file.setPlaceholderText(_translate("CombinePerformerTagsOptionsPage", "section.processing.coperformance_file.placeholder"))
+        self.section_processing_label_index_file.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.label.index_file"))
+        self.index_file.setPlaceholderText(_translate("CombinePerformerTagsOptionsPage", "section.processing.index_file.placeholder"))
+        self.section_processing_label_credits_file.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.label.credits_file"))
+        self.credits_file.setPlaceholderText(_translate("CombinePerformerTagsOptionsPage", "section.processing.credits_file.placeholder"))
+        self.cb_memory_profiling.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.cb.memory_profiling"))
+        self.cb_decision_trace.setText(_translate("CombinePerformerTagsOptionsPage", "section.processing.cb.decision_trace"))
         self.section_example_title.setText(_translate("CombinePerformerTagsOptionsPage", "section.example.title"))